@@ -0,0 +1 @@
+"""Benchmarks of PyVista run with airspeed velocity."""
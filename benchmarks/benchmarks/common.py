@@ -0,0 +1,34 @@
+"""Synthetic datasets shared by the benchmarks.
+
+All datasets are generated so that the benchmarks run offline.
+"""
+import numpy as np
+
+import pyvista as pv
+
+# number of cells of the benchmarked datasets
+N_CELLS = [10**3, 10**5, 10**7]
+
+
+def image_data(n_cells):
+    """Return a cubic image with about ``n_cells`` voxels and point scalars."""
+    side = max(round(n_cells ** (1 / 3)), 1)
+    mesh = pv.ImageData(dimensions=(side + 1,) * 3, spacing=(1 / side,) * 3)
+    x, y, z = mesh.points.T
+    mesh.point_data['data'] = np.sin(6 * x) * np.cos(6 * y) + z
+    return mesh
+
+
+def unstructured_grid(n_cells):
+    """Return an unstructured grid of about ``n_cells`` hexahedra."""
+    return image_data(n_cells).cast_to_unstructured_grid()
+
+
+def polydata(n_cells):
+    """Return a wavy triangulated surface with about ``n_cells`` triangles."""
+    side = max(round((n_cells / 2) ** 0.5), 1)
+    mesh = pv.Plane(i_resolution=side, j_resolution=side).triangulate()
+    x, y, _ = mesh.points.T
+    mesh.points[:, 2] = 0.1 * np.sin(6 * x) * np.cos(6 * y)
+    mesh.point_data['data'] = mesh.points[:, 2]
+    return mesh
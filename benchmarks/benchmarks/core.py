@@ -0,0 +1,141 @@
+"""Benchmarks of dataset construction and data access."""
+import pickle
+
+import numpy as np
+
+import pyvista as pv
+
+from .common import N_CELLS, polydata, unstructured_grid
+
+
+class Construction:
+    """Create datasets from NumPy arrays."""
+
+    params = N_CELLS
+    param_names = ['n_cells']
+    timeout = 600
+
+    def setup(self, n_cells):
+        grid = unstructured_grid(n_cells)
+        self.points = grid.points
+        self.cells = grid.cells
+        self.celltypes = grid.celltypes
+        surface = polydata(n_cells)
+        self.surface_points = surface.points
+        self.faces = surface.faces
+        side = round(n_cells ** (1 / 3)) + 1
+        self.xyz = np.meshgrid(*[np.linspace(0, 1, side)] * 3, indexing='ij')
+
+    def time_unstructured_grid(self, n_cells):
+        pv.UnstructuredGrid(self.cells, self.celltypes, self.points)
+
+    def peakmem_unstructured_grid(self, n_cells):
+        pv.UnstructuredGrid(self.cells, self.celltypes, self.points)
+
+    def time_polydata(self, n_cells):
+        pv.PolyData(self.surface_points, self.faces)
+
+    def time_structured_grid(self, n_cells):
+        pv.StructuredGrid(*self.xyz)
+
+    def time_wrap_points(self, n_cells):
+        pv.wrap(self.points)
+
+
+class ArrayAccess:
+    """Get and set the arrays of a dataset."""
+
+    params = N_CELLS
+    param_names = ['n_cells']
+    timeout = 300
+
+    def setup(self, n_cells):
+        self.mesh = unstructured_grid(n_cells)
+        rng = np.random.default_rng(0)
+        self.scalars = rng.random(self.mesh.n_points)
+        self.vectors = rng.random((self.mesh.n_points, 3))
+        self.cell_scalars = rng.random(self.mesh.n_cells)
+
+    def time_set_point_scalars(self, n_cells):
+        self.mesh.point_data['scalars'] = self.scalars
+
+    def time_set_point_vectors(self, n_cells):
+        self.mesh.point_data['vectors'] = self.vectors
+
+    def time_set_cell_scalars(self, n_cells):
+        self.mesh.cell_data['scalars'] = self.cell_scalars
+
+    def peakmem_set_point_vectors(self, n_cells):
+        self.mesh.point_data['vectors'] = self.vectors
+
+    def time_get_point_scalars(self, n_cells):
+        self.mesh.point_data['data']
+
+    def time_active_scalars(self, n_cells):
+        self.mesh.active_scalars
+
+    def time_points(self, n_cells):
+        self.mesh.points
+
+    def time_cell_connectivity(self, n_cells):
+        self.mesh.cell_connectivity
+
+    def time_wrap(self, n_cells):
+        pv.wrap(self.mesh.GetPointData().GetArray('data'))
+
+
+class Topology:
+    """Query the topology of datasets and combine them."""
+
+    params = N_CELLS
+    param_names = ['n_cells']
+    timeout = 600
+
+    def setup(self, n_cells):
+        self.mesh = unstructured_grid(n_cells)
+        self.ids = np.linspace(0, self.mesh.n_cells - 1, 10, dtype=int)
+        bounds = np.linspace(0, self.mesh.n_cells, 9, dtype=int)
+        self.pieces = [
+            self.mesh.extract_cells(np.arange(start, stop))
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+
+    def time_cell_neighbors(self, n_cells):
+        for i in self.ids:
+            self.mesh.cell_neighbors(i)
+
+    def time_point_neighbors(self, n_cells):
+        for i in self.ids:
+            self.mesh.point_neighbors(i)
+
+    def time_merge(self, n_cells):
+        pv.merge(self.pieces)
+
+    def peakmem_merge(self, n_cells):
+        pv.merge(self.pieces)
+
+
+class Pickling:
+    """Pickle datasets in each pickle format."""
+
+    params = (N_CELLS, ['xml', 'legacy', 'binary'])
+    param_names = ['n_cells', 'format']
+    timeout = 600
+
+    def setup(self, n_cells, format):
+        self.format = pv.PICKLE_FORMAT
+        pv.set_pickle_format(format)
+        self.mesh = unstructured_grid(n_cells)
+        self.pickled = pickle.dumps(self.mesh, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def teardown(self, n_cells, format):
+        pv.set_pickle_format(self.format)
+
+    def time_dumps(self, n_cells, format):
+        pickle.dumps(self.mesh, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def time_loads(self, n_cells, format):
+        pickle.loads(self.pickled)
+
+    def peakmem_loads(self, n_cells, format):
+        pickle.loads(self.pickled)
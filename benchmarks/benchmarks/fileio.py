@@ -0,0 +1,45 @@
+"""Benchmarks of readers and writers."""
+import os
+import shutil
+import tempfile
+
+import pyvista as pv
+
+from .common import N_CELLS, image_data, polydata, unstructured_grid
+
+# dataset written in each file format
+DATASETS = {
+    '.vtu': unstructured_grid,
+    '.vtp': polydata,
+    '.vti': image_data,
+    '.vtk': unstructured_grid,
+    '.stl': polydata,
+    '.ply': polydata,
+}
+
+
+class ReadWrite:
+    """Write and read datasets in VTK XML, VTK legacy, STL and PLY files."""
+
+    params = (N_CELLS, list(DATASETS))
+    param_names = ['n_cells', 'extension']
+    timeout = 600
+
+    def setup(self, n_cells, extension):
+        self.mesh = DATASETS[extension](n_cells)
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir, f'mesh{extension}')
+        self.output = os.path.join(self.tempdir, f'output{extension}')
+        self.mesh.save(self.filename)
+
+    def teardown(self, n_cells, extension):
+        shutil.rmtree(self.tempdir)
+
+    def time_save(self, n_cells, extension):
+        self.mesh.save(self.output)
+
+    def time_read(self, n_cells, extension):
+        pv.read(self.filename)
+
+    def peakmem_read(self, n_cells, extension):
+        pv.read(self.filename)
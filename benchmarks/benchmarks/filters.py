@@ -0,0 +1,183 @@
+"""Benchmarks of common filters."""
+import numpy as np
+
+import pyvista as pv
+
+from .common import N_CELLS, image_data, polydata, unstructured_grid
+
+
+class ImageDataFilters:
+    """Filter image data."""
+
+    params = N_CELLS
+    param_names = ['n_cells']
+    timeout = 600
+
+    def setup(self, n_cells):
+        self.mesh = image_data(n_cells)
+
+    def time_contour(self, n_cells):
+        self.mesh.contour(5)
+
+    def peakmem_contour(self, n_cells):
+        self.mesh.contour(5)
+
+    def time_slice_along_axis(self, n_cells):
+        self.mesh.slice_along_axis(10)
+
+    def time_extract_surface(self, n_cells):
+        self.mesh.extract_surface()
+
+
+class UnstructuredGridFilters:
+    """Filter an unstructured grid."""
+
+    params = N_CELLS
+    param_names = ['n_cells']
+    timeout = 600
+
+    def setup(self, n_cells):
+        self.mesh = unstructured_grid(n_cells)
+
+    def time_threshold(self, n_cells):
+        self.mesh.threshold(0.5)
+
+    def peakmem_threshold(self, n_cells):
+        self.mesh.threshold(0.5)
+
+    def time_clip(self, n_cells):
+        self.mesh.clip(normal=(1, 1, 1))
+
+    def peakmem_clip(self, n_cells):
+        self.mesh.clip(normal=(1, 1, 1))
+
+    def time_slice(self, n_cells):
+        self.mesh.slice(normal=(1, 1, 1))
+
+    def time_extract_surface(self, n_cells):
+        self.mesh.extract_surface()
+
+    def time_cell_centers(self, n_cells):
+        self.mesh.cell_centers()
+
+    def time_point_data_to_cell_data(self, n_cells):
+        self.mesh.point_data_to_cell_data()
+
+
+class PolyDataFilters:
+    """Filter a triangulated surface."""
+
+    params = N_CELLS
+    param_names = ['n_cells']
+    timeout = 600
+
+    def setup(self, n_cells):
+        self.mesh = polydata(n_cells)
+
+    def time_compute_normals(self, n_cells):
+        self.mesh.compute_normals()
+
+    def peakmem_compute_normals(self, n_cells):
+        self.mesh.compute_normals()
+
+    def time_clean(self, n_cells):
+        self.mesh.clean()
+
+    def time_decimate(self, n_cells):
+        self.mesh.decimate(0.5)
+
+    def time_extract_feature_edges(self, n_cells):
+        self.mesh.extract_feature_edges()
+
+
+class Pipeline:
+    """Chain filters eagerly and in a lazy pipeline."""
+
+    params = N_CELLS
+    param_names = ['n_cells']
+    timeout = 600
+
+    def setup(self, n_cells):
+        self.mesh = unstructured_grid(n_cells)
+
+    def _eager_steps(self):
+        clipped = self.mesh.clip(normal='x', origin=(0.7, 0, 0))
+        thresholded = clipped.threshold(0.5)
+        surface = thresholded.extract_surface()
+        return clipped, thresholded, surface, surface.smooth(n_iter=10)
+
+    def _pipeline(self, release_data):
+        pipeline = self.mesh.pipeline(release_data=release_data)
+        pipeline = pipeline.clip(normal='x', origin=(0.7, 0, 0)).threshold(0.5)
+        return pipeline.extract_surface().smooth(n_iter=10).execute()
+
+    def time_eager(self, n_cells):
+        self._eager_steps()
+
+    def time_pipeline(self, n_cells):
+        self._pipeline(release_data=True)
+
+    def peakmem_eager(self, n_cells):
+        self._eager_steps()
+
+    def peakmem_pipeline(self, n_cells):
+        self._pipeline(release_data=False)
+
+    def peakmem_pipeline_release_data(self, n_cells):
+        self._pipeline(release_data=True)
+
+
+class RayTracing:
+    """Trace rays through a triangulated surface."""
+
+    params = (N_CELLS, [10**3, 10**6])
+    param_names = ['n_cells', 'n_rays']
+    timeout = 600
+
+    def setup(self, n_cells, n_rays):
+        self.mesh = polydata(n_cells)
+        rng = np.random.default_rng(0)
+        self.origins = rng.uniform(-0.5, 0.5, (n_rays, 3))
+        self.origins[:, 2] = 1
+        self.directions = rng.normal([0, 0, -1], 0.1, (n_rays, 3))
+        # build the cached bounding volume hierarchy
+        self.mesh.multi_ray_trace(self.origins[:1], self.directions[:1])
+
+    def time_build(self, n_cells, n_rays):
+        self.mesh.clear_locators()
+        self.mesh.multi_ray_trace(self.origins[:1], self.directions[:1])
+
+    def time_multi_ray_trace(self, n_cells, n_rays):
+        self.mesh.multi_ray_trace(self.origins, self.directions)
+
+    def time_multi_ray_trace_first_point(self, n_cells, n_rays):
+        self.mesh.multi_ray_trace(self.origins, self.directions, first_point=True)
+
+    def peakmem_multi_ray_trace(self, n_cells, n_rays):
+        self.mesh.multi_ray_trace(self.origins, self.directions)
+
+
+class CollideAll:
+    """Detect the collisions between many moving spheres."""
+
+    params = [10, 100, 1000]
+    param_names = ['n_meshes']
+    timeout = 600
+
+    def setup(self, n_meshes):
+        sphere = pv.Sphere(radius=0.5)
+        self.meshes = [sphere.copy() for _ in range(n_meshes)]
+        rng = np.random.default_rng(0)
+        self.transforms = np.tile(np.eye(4), (n_meshes, 1, 1))
+        # one sphere per unit volume, so that each sphere overlaps about four others
+        self.transforms[:, :3, 3] = rng.uniform(0, n_meshes ** (1 / 3), (n_meshes, 3))
+        self.steps = rng.normal(0, 0.01, (n_meshes, 3))
+
+    def time_first_call(self, n_meshes):
+        for mesh in self.meshes:
+            mesh.clear_locators()
+        pv.collide_all(self.meshes, self.transforms)
+
+    def time_update_transforms(self, n_meshes):
+        self.transforms[:, :3, 3] += self.steps
+        pv.collide_all(self.meshes, self.transforms)
@@ -0,0 +1,34 @@
+"""Benchmarks of the startup cost of pyvista.
+
+Each benchmark runs in a new interpreter, so that the modules imported by
+other benchmarks are not cached.
+"""
+
+
+class ImportTime:
+    """Import pyvista and use parts of its API for the first time."""
+
+    timeout = 120
+
+    def timeraw_import_pyvista(self):
+        return 'import pyvista'
+
+    def timeraw_import_core(self):
+        return 'import pyvista.core'
+
+    def timeraw_first_filter(self):
+        return 'import pyvista; pyvista.Sphere().clip()'
+
+    def timeraw_first_write(self):
+        return """
+        import os
+        import tempfile
+
+        import pyvista
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pyvista.Sphere().save(os.path.join(tmpdir, 'sphere.vtp'))
+        """
+
+    def timeraw_import_plotting(self):
+        return 'import pyvista; pyvista.Plotter'
@@ -0,0 +1,185 @@
+"""Benchmarks of offscreen rendering and interaction.
+
+These benchmarks need a working render window, for instance a virtual
+frame buffer started with ``xvfb-run``, or a VTK build using OSMesa or
+EGL together with ``ALLOW_PLOTTING=true``. They are skipped otherwise.
+"""
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import pyvista as pv
+
+# number of actors of the benchmarked scenes
+N_ACTORS = [1, 100, 10_000]
+
+# scenes made of one actor per mesh, or of a single composite actor
+SCENES = ['actors', 'composite']
+
+WINDOW_SIZE = [1024, 768]
+
+# adding ten thousand actors takes minutes
+TIMEOUT = 3600
+
+
+def require_rendering():
+    """Skip a benchmark when the system cannot render."""
+    if not pv.system_supports_plotting():
+        # asv reports benchmarks raising this in ``setup`` as skipped
+        raise NotImplementedError('Rendering is not supported on this system.')
+
+
+def spheres(n_actors):
+    """Return small spheres on a cubic lattice with point scalars."""
+    side = int(np.ceil(n_actors ** (1 / 3)))
+    sphere = pv.Sphere(radius=0.4, theta_resolution=8, phi_resolution=8)
+    meshes = []
+    for i in range(n_actors):
+        mesh = sphere.translate(np.unravel_index(i, (side,) * 3), inplace=False)
+        mesh.point_data['data'] = mesh.points[:, 2]
+        meshes.append(mesh)
+    return meshes
+
+
+def add_scene(plotter, meshes, scene):
+    """Add meshes to a plotter as individual actors or as a composite."""
+    if scene == 'composite':
+        plotter.add_composite(pv.MultiBlock(meshes), scalars='data')
+    else:
+        for mesh in meshes:
+            plotter.add_mesh(mesh, scalars='data')
+
+
+class SceneCreation:
+    """Create the actors of a scene and render it for the first time.
+
+    Each sample uses a new plotter, so that the first render includes
+    the creation of the render window and the upload to the GPU.
+    """
+
+    params = (N_ACTORS, SCENES)
+    param_names = ['n_actors', 'scene']
+    number = 1
+    repeat = (1, 10, 60.0)
+    warmup_time = 0
+    timeout = TIMEOUT
+
+    def setup(self, n_actors, scene):
+        require_rendering()
+        self.meshes = spheres(n_actors)
+        self.plotter = pv.Plotter(off_screen=True, window_size=WINDOW_SIZE)
+        self.tmpdir = tempfile.mkdtemp()
+
+    def teardown(self, n_actors, scene):
+        self.plotter.close()
+        shutil.rmtree(self.tmpdir)
+
+    def time_add(self, n_actors, scene):
+        add_scene(self.plotter, self.meshes, scene)
+
+    def peakmem_add(self, n_actors, scene):
+        add_scene(self.plotter, self.meshes, scene)
+
+    def time_add_and_first_render(self, n_actors, scene):
+        add_scene(self.plotter, self.meshes, scene)
+        self.plotter.show(auto_close=False)
+
+    def time_add_and_show_screenshot(self, n_actors, scene):
+        add_scene(self.plotter, self.meshes, scene)
+        self.plotter.show(screenshot=os.path.join(self.tmpdir, 'scene.png'), auto_close=False)
+
+
+class Rerender:
+    """Render a scene which has already been shown."""
+
+    params = (N_ACTORS, SCENES)
+    param_names = ['n_actors', 'scene']
+    timeout = TIMEOUT
+
+    def setup(self, n_actors, scene):
+        require_rendering()
+        self.meshes = spheres(n_actors)
+        self.plotter = pv.Plotter(off_screen=True, window_size=WINDOW_SIZE)
+        add_scene(self.plotter, self.meshes, scene)
+        self.plotter.show(auto_close=False)
+        self.scalars = -self.meshes[0].point_data['data']
+
+    def teardown(self, n_actors, scene):
+        self.plotter.close()
+
+    def time_render(self, n_actors, scene):
+        self.plotter.render()
+
+    def time_update_scalars(self, n_actors, scene):
+        self.scalars *= -1
+        self.plotter.update_scalars(self.scalars, mesh=self.meshes, render=True)
+
+    def time_update_points(self, n_actors, scene):
+        for mesh in self.meshes:
+            mesh.points[:, 0] += 1e-3
+            mesh.points.Modified()
+        self.plotter.render()
+
+    def time_screenshot(self, n_actors, scene):
+        self.plotter.screenshot(return_img=True)
+
+
+class MovieFrames:
+    """Write the frames of a movie or of an animated GIF."""
+
+    params = (N_ACTORS, ['mp4', 'gif'])
+    param_names = ['n_actors', 'format']
+    timeout = TIMEOUT
+
+    def setup(self, n_actors, fmt):
+        require_rendering()
+        if fmt == 'mp4':
+            try:
+                import imageio_ffmpeg  # noqa: F401
+            except ImportError:
+                raise NotImplementedError('imageio-ffmpeg is not installed.')
+        self.tmpdir = tempfile.mkdtemp()
+        filename = os.path.join(self.tmpdir, f'movie.{fmt}')
+        self.plotter = pv.Plotter(off_screen=True, window_size=WINDOW_SIZE)
+        add_scene(self.plotter, spheres(n_actors), 'actors')
+        if fmt == 'mp4':
+            self.plotter.open_movie(filename)
+        else:
+            self.plotter.open_gif(filename)
+        # exclude the first render
+        self.plotter.write_frame()
+
+    def teardown(self, n_actors, fmt):
+        self.plotter.close()
+        shutil.rmtree(self.tmpdir)
+
+    def time_write_frame(self, n_actors, fmt):
+        self.plotter.camera.azimuth += 1
+        self.plotter.write_frame()
+
+
+class WidgetCallbacks:
+    """Respond to the interaction with a widget and render the result."""
+
+    params = N_ACTORS
+    param_names = ['n_actors']
+    timeout = TIMEOUT
+
+    def setup(self, n_actors):
+        require_rendering()
+        mesh = pv.merge(spheres(n_actors))
+        self.plotter = pv.Plotter(off_screen=True, window_size=WINDOW_SIZE)
+        self.plotter.add_mesh_clip_plane(mesh, scalars='data', interaction_event='always')
+        self.plotter.show(auto_close=False)
+        self.widget = self.plotter.plane_widgets[0]
+
+    def teardown(self, n_actors):
+        self.plotter.close()
+
+    def time_clip_plane(self, n_actors):
+        origin = np.array(self.widget.GetOrigin())
+        self.widget.SetOrigin(*(origin + 1e-3))
+        self.widget.InvokeEvent('InteractionEvent')
+        self.plotter.render()
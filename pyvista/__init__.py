@@ -3,7 +3,9 @@
 
 MAX_N_COLOR_BARS = 10
 
+import importlib as _importlib
 import os
+import threading as _threading
 import warnings
 
 from pyvista._plot import plot
@@ -13,24 +15,12 @@ from pyvista.core.cell import _get_vtk_id_type
 from pyvista.core.utilities.observers import send_errors_to_logging
 from pyvista.core.wrappers import _wrappers
 from pyvista.errors import InvalidCameraError, RenderWindowUnavailable
-from pyvista.jupyter import set_jupyter_backend
-from pyvista.plotting import *
-from pyvista.plotting import _typing, _vtk
-from pyvista.plotting.utilities.sphinx_gallery import _get_sg_image_scraper
 from pyvista.report import GPUInfo, Report, get_gpu_info, vtk_version_info
-from pyvista.themes import (
-    DocumentTheme as _GlobalTheme,
-    _rcParams,
-    _set_plot_theme_from_env,
-    load_theme,
-    set_plot_theme,
-)
-
-global_theme = _GlobalTheme()
-rcParams = _rcParams()  # raises DeprecationError when used
 
-# Set preferred plot theme
-_set_plot_theme_from_env()
+# These are the modules of ``pyvista.plotting`` of the same names, which
+# shadowed the core modules when the plotting API was imported eagerly.
+# They are looked up in ``pyvista.plotting`` on first access.
+del errors, helpers, utilities
 
 # get the int type from vtk
 ID_TYPE = _get_vtk_id_type()
@@ -74,3 +64,78 @@ PICKLE_FORMAT = 'xml'
 
 # Name used for unnamed scalars
 DEFAULT_SCALARS_NAME = 'Data'
+
+# Attributes of the plotting, jupyter and theme modules, which import the
+# rendering libraries of VTK, and the modules defining them. They are only
+# imported when first accessed, so that using the core API alone does not
+# load them. The attributes of ``pyvista.plotting`` are looked up there.
+_LAZY_ATTRIBUTES = {
+    '_get_sg_image_scraper': 'pyvista.plotting.utilities.sphinx_gallery',
+    '_typing': 'pyvista.plotting',
+    '_vtk': 'pyvista.plotting',
+    'load_theme': 'pyvista.themes',
+    'set_jupyter_backend': 'pyvista.jupyter',
+    'set_plot_theme': 'pyvista.themes',
+}
+_LAZY_SUBMODULES = ('jupyter', 'plotting', 'themes')
+_THEME_ATTRIBUTES = (
+    '_GlobalTheme',
+    '_rcParams',
+    '_set_plot_theme_from_env',
+    'global_theme',
+    'rcParams',
+)
+_theme_lock = _threading.Lock()
+
+
+def _load_global_theme():
+    """Create the global theme and apply the theme set in the environment."""
+    with _theme_lock:
+        if 'global_theme' in globals():
+            return
+        from pyvista.themes import (
+            DocumentTheme as _GlobalTheme,
+            _rcParams,
+            _set_plot_theme_from_env,
+        )
+
+        globals().update(
+            _GlobalTheme=_GlobalTheme,
+            _rcParams=_rcParams,
+            _set_plot_theme_from_env=_set_plot_theme_from_env,
+            rcParams=_rcParams(),  # raises DeprecationError when used
+            global_theme=_GlobalTheme(),
+        )
+    # Set preferred plot theme
+    _set_plot_theme_from_env()
+
+
+def __getattr__(name):
+    """Import the plotting API and the themes on first access."""
+    if name in _THEME_ATTRIBUTES:
+        _load_global_theme()
+        return globals()[name]
+    if name == '__all__':
+        # ``from pyvista import *`` imports the whole API
+        return [key for key in __dir__() if not key.startswith('_')]
+    if name.startswith('__'):
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(_importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name in _LAZY_SUBMODULES:
+        value = _importlib.import_module(f'{__name__}.{name}')
+    else:
+        try:
+            value = getattr(_importlib.import_module('pyvista.plotting'), name)
+        except AttributeError:
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Return the attributes of pyvista, including those not yet imported."""
+    from pyvista import plotting
+
+    names = {*globals(), *_LAZY_ATTRIBUTES, *_LAZY_SUBMODULES, *plotting.__all__}
+    return sorted(names | set(_THEME_ATTRIBUTES))
@@ -2,7 +2,7 @@
 # flake8: noqa: F401
 
 from . import _vtk_core
-from .cell import Cell, CellArray
+from .cell import Cell, CellArray, CellsView
 from .celltype import CellType
 from .composite import MultiBlock
 from .dataset import DataObject, DataSet
@@ -31,6 +31,7 @@ from .filters import (
 )
 from .grid import Grid, ImageData, RectilinearGrid, UniformGrid
 from .objects import Table
+from .pipeline import Pipeline
 from .pointset import (
     ExplicitStructuredGrid,
     PointGrid,
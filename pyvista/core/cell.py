@@ -510,3 +510,278 @@ class CellArray(_vtk.vtkCellArray):
     def n_cells(self):
         """Return the number of cells."""
         return self.GetNumberOfCells()
+
+
+class CellsView:
+    """Columnar view of the cells of a dataset.
+
+    Exposes the topology and geometry of many cells at once as NumPy
+    arrays, avoiding the creation of a :class:`pyvista.Cell` for each
+    cell. Obtain one from :attr:`pyvista.DataSet.cells_view`.
+
+    .. versionadded:: 0.40.0
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        Points of the dataset with shape ``(n_points, 3)``.
+
+    offsets : numpy.ndarray
+        Offsets of each cell in ``connectivity`` with length ``n_cells + 1``.
+
+    connectivity : numpy.ndarray
+        Point ids of all cells.
+
+    celltypes : numpy.ndarray
+        VTK cell type of each cell.
+
+    cell_ids : numpy.ndarray, optional
+        Ids of the cells in the dataset. Defaults to ``0, ..., n_cells - 1``.
+
+    Notes
+    -----
+    The arrays may share memory with the dataset and are read-only. A view
+    describes the cells at the time it was created and should be requested
+    again after the cells or points of the dataset are modified.
+
+    For polyhedra, ``connectivity`` contains the unique point ids of each
+    cell; the faces are not part of the view.
+
+    Examples
+    --------
+    Get the bounds and centers of all the cells of a sphere and select the
+    cells of its upper half.
+
+    >>> import pyvista as pv
+    >>> mesh = pv.Sphere()
+    >>> view = mesh.cells_view
+    >>> view.bounds.shape
+    (1680, 6)
+    >>> upper = view[view.centers[:, 2] > 0]
+    >>> upper.n_cells
+    840
+
+    """
+
+    def __init__(self, points, offsets, connectivity, celltypes, cell_ids=None):
+        """Initialize the view."""
+        self._points = self._read_only(points)
+        self._offsets = self._read_only(offsets)
+        self._connectivity = self._read_only(connectivity)
+        self._celltypes = self._read_only(celltypes)
+        if cell_ids is None:
+            cell_ids = np.arange(self._celltypes.size)
+        self._cell_ids = self._read_only(cell_ids)
+        self._bounds = None
+        self._centers = None
+
+    @staticmethod
+    def _read_only(array) -> np.ndarray:
+        """Return a read-only view of an array."""
+        array = np.asarray(array).view()
+        array.flags.writeable = False
+        return array
+
+    def __len__(self) -> int:
+        """Return the number of cells."""
+        return self.n_cells
+
+    def __repr__(self) -> str:
+        """Return the object representation."""
+        return f'{type(self).__name__} (n_cells={self.n_cells})'
+
+    def __getitem__(self, key) -> CellsView:
+        """Return a view of a subset of the cells.
+
+        ``key`` may be an integer, a slice, an array of cell indices or a
+        boolean mask of length ``n_cells``.
+        """
+        if isinstance(key, slice):
+            ids = np.arange(*key.indices(self.n_cells))
+        else:
+            key = np.asarray(key)
+            if key.size == 0 and key.ndim == 1:
+                key = key.astype(int)
+            if key.dtype == bool:
+                if key.shape != (self.n_cells,):
+                    raise IndexError(
+                        f'Boolean mask of shape {key.shape} does not match the '
+                        f'number of cells ({self.n_cells}).'
+                    )
+                ids = np.flatnonzero(key)
+            elif np.issubdtype(key.dtype, np.integer):
+                ids = np.atleast_1d(key).ravel()
+                if ids.size and (ids.min() < -self.n_cells or ids.max() >= self.n_cells):
+                    raise IndexError(f'Cell index out of range for {self.n_cells} cells.')
+                ids = np.where(ids < 0, ids + self.n_cells, ids)
+            else:
+                raise TypeError(f'Invalid index type {key.dtype} for a CellsView.')
+
+        sizes = self.n_points[ids]
+        offsets = np.zeros(ids.size + 1, dtype=self._offsets.dtype)
+        np.cumsum(sizes, out=offsets[1:])
+        gather = np.repeat(self._offsets[:-1][ids] - offsets[:-1], sizes)
+        gather += np.arange(offsets[-1], dtype=gather.dtype)
+        return type(self)(
+            self._points,
+            offsets,
+            self._connectivity[gather],
+            self._celltypes[ids],
+            self._cell_ids[ids],
+        )
+
+    @property
+    def n_cells(self) -> int:
+        """Return the number of cells in the view.
+
+        Returns
+        -------
+        int
+            Number of cells.
+
+        """
+        return self._celltypes.size
+
+    @property
+    def cell_ids(self) -> np.ndarray:
+        """Return the ids of the cells in the dataset.
+
+        Returns
+        -------
+        numpy.ndarray
+            Id of each cell of the view in the original dataset.
+
+        """
+        return self._cell_ids
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """Return the offsets of each cell in :attr:`CellsView.connectivity`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Offsets with length ``n_cells + 1``. The point ids of cell ``i``
+            are ``connectivity[offsets[i]:offsets[i + 1]]``.
+
+        """
+        return self._offsets
+
+    @property
+    def connectivity(self) -> np.ndarray:
+        """Return the point ids of all cells.
+
+        Returns
+        -------
+        numpy.ndarray
+            Concatenated point ids of all cells.
+
+        """
+        return self._connectivity
+
+    @property
+    def celltypes(self) -> np.ndarray:
+        """Return the VTK cell type of each cell.
+
+        Returns
+        -------
+        numpy.ndarray
+            Cell types, which can be compared to :class:`pyvista.CellType`.
+
+        """
+        return self._celltypes
+
+    @property
+    def n_points(self) -> np.ndarray:
+        """Return the number of points of each cell.
+
+        Returns
+        -------
+        numpy.ndarray
+            Number of points of each cell.
+
+        """
+        return np.diff(self._offsets)
+
+    @property
+    def bounds(self) -> np.ndarray:
+        """Return the bounds of each cell.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape ``(n_cells, 6)`` in the form ``[xmin, xmax, ymin,
+            ymax, zmin, zmax]``. Cells without points have ``nan`` bounds.
+
+        """
+        if self._bounds is None:
+            bounds = np.full((self.n_cells, 6), np.nan)
+            nonempty = self.n_points > 0
+            starts = self._offsets[:-1][nonempty]
+            if starts.size:
+                for axis in range(3):
+                    coords = self._points[self._connectivity, axis]
+                    bounds[nonempty, 2 * axis] = np.minimum.reduceat(coords, starts)
+                    bounds[nonempty, 2 * axis + 1] = np.maximum.reduceat(coords, starts)
+            self._bounds = self._read_only(bounds)
+        return self._bounds
+
+    @property
+    def centers(self) -> np.ndarray:
+        """Return the center of each cell.
+
+        The center is the average of the points of the cell, which matches
+        the parametric center of linear triangles, quadrilaterals,
+        tetrahedra, voxels and hexahedra.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape ``(n_cells, 3)``. Cells without points have a
+            ``nan`` center.
+
+        """
+        if self._centers is None:
+            centers = np.full((self.n_cells, 3), np.nan)
+            sizes = self.n_points
+            nonempty = sizes > 0
+            starts = self._offsets[:-1][nonempty]
+            if starts.size:
+                for axis in range(3):
+                    coords = self._points[self._connectivity, axis].astype(float)
+                    centers[nonempty, axis] = np.add.reduceat(coords, starts)
+                centers[nonempty] /= sizes[nonempty, np.newaxis]
+            self._centers = self._read_only(centers)
+        return self._centers
+
+    def get_point_ids(self, index: int) -> np.ndarray:
+        """Return the point ids of a single cell of the view.
+
+        Parameters
+        ----------
+        index : int
+            Index of the cell in the view.
+
+        Returns
+        -------
+        numpy.ndarray
+            Point ids of the cell.
+
+        """
+        return self._connectivity[self._offsets[index] : self._offsets[index + 1]]
+
+    def get_points(self, index: int) -> np.ndarray:
+        """Return the point coordinates of a single cell of the view.
+
+        Parameters
+        ----------
+        index : int
+            Index of the cell in the view.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape ``(n, 3)`` with the points of the cell.
+
+        """
+        return self._points[self.get_point_ids(index)]
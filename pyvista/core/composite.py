@@ -4,6 +4,7 @@ These classes hold many VTK datasets in one object that can be passed
 to VTK algorithms and PyVista filtering/plotting routines.
 """
 import collections.abc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from itertools import zip_longest
 import pathlib
 from typing import Any, Iterable, List, Optional, Set, Tuple, Union, cast, overload
@@ -20,6 +21,7 @@ from .pyvista_ndarray import pyvista_ndarray
 from .utilities.arrays import FieldAssociation
 from .utilities.geometric_objects import Box
 from .utilities.helpers import is_pyvista_dataset, wrap
+from .utilities.misc import _resolve_workers
 
 _TypeMultiBlockLeaf = Union['MultiBlock', DataSet]
 
@@ -94,7 +96,7 @@ class MultiBlock(
 
     plot = pyvista._plot.plot
 
-    _WRITERS = dict.fromkeys(['.vtm', '.vtmb'], _vtk.vtkXMLMultiBlockDataWriter)
+    _WRITERS = dict.fromkeys(['.vtm', '.vtmb'], 'vtkXMLMultiBlockDataWriter')
 
     def __init__(self, *args, **kwargs) -> None:
         """Initialize multi block."""
@@ -132,6 +134,16 @@ class MultiBlock(
         # Upon creation make sure all nested structures are wrapped
         self.wrap_nested()
 
+    def __getstate__(self):
+        """Support pickle, ignoring the references to the blocks.
+
+        The references are restored when the blocks are added back on
+        unpickle.
+        """
+        state = super().__getstate__()
+        state['_refs'] = {}
+        return state
+
     def wrap_nested(self):
         """Ensure that all nested data structures are wrapped as PyVista datasets.
 
@@ -992,6 +1004,103 @@ class MultiBlock(
         newobject.wrap_nested()
         return newobject
 
+    def map(self, func, workers: Optional[int] = 1, executor: str = 'thread'):
+        """Apply a function to every dataset of this composite dataset.
+
+        The datasets of all nested blocks are dispatched concurrently to
+        ``func`` and the results are assembled in a new composite dataset
+        with the same nested structure and block names. Empty blocks
+        remain empty.
+
+        .. versionadded:: 0.40.0
+
+        Parameters
+        ----------
+        func : callable
+            Function called with each dataset, returning a dataset or
+            ``None``. When it returns a tuple of datasets, a tuple of
+            composite datasets is returned.
+
+        workers : int, default: 1
+            Number of workers used to process the datasets. ``-1`` uses
+            all the CPUs.
+
+        executor : str, default: "thread"
+            Either ``'thread'`` or ``'process'``. The VTK filters hold the
+            global interpreter lock while they execute, so that threads
+            only help functions which release it. Use ``'process'`` for
+            CPU bound filters, in which case ``func`` and the datasets must
+            be picklable. Consider the ``'binary'`` format of
+            :func:`pyvista.set_pickle_format` to pickle large datasets.
+
+        Returns
+        -------
+        pyvista.MultiBlock | tuple[pyvista.MultiBlock]
+            Composite dataset of the outputs of ``func``.
+
+        Examples
+        --------
+        Compute the outline of every block using two processes.
+
+        >>> import pyvista as pv
+        >>> blocks = pv.MultiBlock(
+        ...     {'sphere': pv.Sphere(), 'nested': pv.MultiBlock([pv.Cube()])}
+        ... )
+        >>> outlines = blocks.map(
+        ...     pv.DataSetFilters.outline, workers=2, executor='process'
+        ... )
+        >>> outlines.keys()
+        ['sphere', 'nested']
+        >>> outlines['nested'][0].n_lines
+        12
+
+        """
+        if executor not in ('thread', 'process'):
+            raise ValueError(f'`executor` must be "thread" or "process", got "{executor}".')
+        workers = _resolve_workers(workers)
+
+        datasets: List[DataSet] = []
+
+        def flatten(multi):
+            # nested lists of the indices of the datasets in ``datasets``
+            indices: List[Any] = []
+            for block in multi:
+                if isinstance(block, MultiBlock):
+                    indices.append(flatten(block))
+                elif block is None:
+                    indices.append(None)
+                else:
+                    datasets.append(block)
+                    indices.append(len(datasets) - 1)
+            return indices
+
+        structure = flatten(self)
+        if workers == 1:
+            results = [func(dataset) for dataset in datasets]
+        else:
+            pool = ThreadPoolExecutor if executor == 'thread' else ProcessPoolExecutor
+            with pool(min(workers, max(len(datasets), 1))) as pool_executor:
+                results = list(pool_executor.map(func, datasets))
+
+        def assemble(multi, indices, position):
+            output = MultiBlock()
+            for i, index in enumerate(indices):
+                if isinstance(index, list):
+                    block = assemble(multi[i], index, position)
+                elif index is None:
+                    block = None
+                elif position is None or results[index] is None:
+                    block = results[index]
+                else:
+                    block = results[index][position]
+                output.append(block, multi.get_block_name(i))
+            return output
+
+        if any(isinstance(result, tuple) for result in results):
+            n_outputs = max(len(result) for result in results if isinstance(result, tuple))
+            return tuple(assemble(self, structure, position) for position in range(n_outputs))
+        return assemble(self, structure, None)
+
     def set_active_scalars(
         self, name: Optional[str], preference: str = 'cell', allow_missing: bool = False
     ) -> Tuple[FieldAssociation, np.ndarray]:  # type: ignore
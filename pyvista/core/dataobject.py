@@ -3,7 +3,7 @@
 from abc import abstractmethod
 import collections.abc
 from pathlib import Path
-from typing import Any, DefaultDict, Dict, Type, Union
+from typing import Any, DefaultDict, Dict, Union
 
 import numpy as np
 
@@ -11,6 +11,7 @@ import pyvista
 
 from . import _vtk_core as _vtk
 from .datasetattributes import DataSetAttributes
+from .utilities import serialization
 from .utilities.arrays import FieldAssociation
 from .utilities.fileio import read, set_vtkwriter_mode
 from .utilities.helpers import wrap
@@ -24,7 +25,8 @@ DEFAULT_VECTOR_KEY = '_vectors'
 class DataObject:
     """Methods common to all wrapped data objects."""
 
-    _WRITERS: Dict[str, Union[Type[_vtk.vtkXMLWriter], Type[_vtk.vtkDataWriter]]] = {}
+    # file extension -> name of the VTK writer class, imported on first use
+    _WRITERS: Dict[str, str] = {}
 
     def __init__(self, *args, **kwargs) -> None:
         """Initialize the data object."""
@@ -107,11 +109,19 @@ class DataObject:
         Binary files write much faster than ASCII and have a smaller
         file size.
 
+        The ``'.pvnpy'`` extension writes a directory of raw NumPy arrays
+        which can be memory mapped when read, see
+        :func:`pyvista.save_pvnpy`.
+
         """
+        if Path(filename).suffix == '.pvnpy':
+            pyvista.save_pvnpy(filename, self)
+            return
+
         if self._WRITERS is None:
             raise NotImplementedError(
                 f'{self.__class__.__name__} writers are not specified,'
-                ' this should be a dict of (file extension: vtkWriter type)'
+                ' this should be a dict of (file extension: vtkWriter class name)'
             )
 
         file_path = Path(filename)
@@ -127,7 +137,7 @@ class DataObject:
         # store complex and bitarray types as field data
         self._store_metadata()
 
-        writer = self._WRITERS[file_ext]()
+        writer = getattr(_vtk, self._WRITERS[file_ext])()
         set_vtkwriter_mode(vtk_writer=writer, use_binary=binary)
         writer.SetFileName(str(file_path))
         writer.SetInputData(self)
@@ -516,16 +526,62 @@ class DataObject:
         """
         self.CopyAttributes(dataset)
 
+    def to_shared_memory(self) -> 'pyvista.SharedMemoryHandle':
+        """Copy the data object into a shared memory block.
+
+        The points, cells and data arrays are copied once into a
+        :mod:`multiprocessing.shared_memory` block. The returned handle is
+        small and can be sent to worker processes, which map the data
+        object without copy with :func:`pyvista.from_shared_memory`.
+
+        The block is released when the handle is used as a context manager
+        or when :func:`pyvista.SharedMemoryHandle.close` is called.
+
+        .. versionadded:: 0.40.0
+
+        Returns
+        -------
+        pyvista.SharedMemoryHandle
+            Picklable handle to the shared memory block.
+
+        See Also
+        --------
+        pyvista.from_shared_memory
+
+        Examples
+        --------
+        >>> import pyvista as pv
+        >>> mesh = pv.Sphere()
+        >>> with mesh.to_shared_memory() as handle:
+        ...     shared = pv.from_shared_memory(handle)
+        ...
+        >>> shared.n_points
+        842
+
+        """
+        return pyvista.SharedMemoryHandle(self)
+
     def __getstate__(self):
         """Support pickle by serializing the VTK object data to something which can be pickled natively.
 
         The format of the serialized VTK object data depends on `pyvista.PICKLE_FORMAT` (case-insensitive).
         - If `pyvista.PICKLE_FORMAT == 'xml'`, the data is serialized as an XML-formatted string.
         - If `pyvista.PICKLE_FORMAT == 'legacy'`, the data is serialized to bytes in VTK's binary format.
+        - If `pyvista.PICKLE_FORMAT == 'binary'`, the points, cells and data arrays are pickled as
+          NumPy arrays, which are written without copy (or out-of-band) with pickle protocol 5.
+
+        Composite datasets are always serialized as a list of blocks, each of them pickled with
+        `pyvista.PICKLE_FORMAT`.
         """
         state = self.__dict__.copy()
+        pickle_format = pyvista.PICKLE_FORMAT.lower()
+        if isinstance(self, _vtk.vtkMultiBlockDataSet):
+            pickle_format = 'binary'
 
-        if pyvista.PICKLE_FORMAT.lower() == 'xml':
+        if pickle_format == 'binary':
+            to_serialize = serialization.to_arrays(self)
+
+        elif pickle_format == 'xml':
             # the generic VTK XML writer `vtkXMLDataSetWriter` currently has a bug where it does not pass all
             # settings down to the sub-writers. Until this is fixed, use the dataset-specific writers
             # https://gitlab.kitware.com/vtk/vtk/-/issues/18661
@@ -552,7 +608,7 @@ class DataObject:
             writer.Write()
             to_serialize = writer.GetOutputString()
 
-        elif pyvista.PICKLE_FORMAT.lower() == 'legacy':
+        elif pickle_format == 'legacy':
             writer = _vtk.vtkDataSetWriter()
             writer.SetInputDataObject(self)
             writer.SetWriteToOutputString(True)
@@ -564,7 +620,7 @@ class DataObject:
 
         # this needs to be here because in multiprocessing situations, `pyvista.PICKLE_FORMAT` is not shared between
         # processes
-        state['PICKLE_FORMAT'] = pyvista.PICKLE_FORMAT
+        state['PICKLE_FORMAT'] = pickle_format
         return state
 
     def __setstate__(self, state):
@@ -575,7 +631,11 @@ class DataObject:
         )
         self.__dict__.update(state)
 
-        if pickle_format.lower() == 'xml':
+        if pickle_format.lower() == 'binary':
+            serialization.from_arrays(self, vtk_serialized)
+            return
+
+        elif pickle_format.lower() == 'xml':
             # the generic VTK XML reader `vtkXMLGenericDataObjectReader` currently has a bug where it does not pass all
             # settings down to the sub-readers. Until this is fixed, use the dataset-specific readers
             # https://gitlab.kitware.com/vtk/vtk/-/issues/18661
@@ -4,10 +4,9 @@ from __future__ import annotations
 from collections import namedtuple
 import collections.abc
 from copy import deepcopy
-from functools import partial
+import itertools
 from typing import (
     Any,
-    Callable,
     Dict,
     Generator,
     Iterable,
@@ -27,12 +26,13 @@ import pyvista
 
 from . import _vtk_core as _vtk
 from ._typing_core import BoundsLike, Number, NumericArray, Vector, VectorArray
+from .celltype import CellType
 from .dataobject import DataObject
 from .datasetattributes import DataSetAttributes
 from .errors import PyVistaDeprecationWarning, VTKVersionError
 from .filters import DataSetFilters, _get_output
 from .pyvista_ndarray import pyvista_ndarray
-from .utilities import transformations
+from .utilities import adjacency, transformations
 from .utilities.arrays import (
     FieldAssociation,
     _coerce_pointslike_arg,
@@ -42,13 +42,28 @@ from .utilities.arrays import (
     vtk_id_list_to_array,
 )
 from .utilities.helpers import is_pyvista_dataset
-from .utilities.misc import abstract_class, check_valid_vector
+from .utilities.misc import _resolve_workers, abstract_class, check_valid_vector
 from .utilities.points import vtk_points
 
 # vector array names
 DEFAULT_VECTOR_KEY = '_vectors'
 ActiveArrayInfoTuple = namedtuple('ActiveArrayInfoTuple', ['association', 'name'])
 
+# names of the VTK classes of the spatial locators which may be cached by
+# a dataset, imported on first use
+POINT_LOCATORS = {
+    'point': 'vtkPointLocator',
+    'static': 'vtkStaticPointLocator',
+    'octree': 'vtkOctreePointLocator',
+}
+CELL_LOCATORS = {
+    'cell': 'vtkCellLocator',
+    'static': 'vtkStaticCellLocator',
+    'tree': 'vtkCellTreeLocator',
+    'bsp': 'vtkModifiedBSPTree',
+    'obb': 'vtkOBBTree',
+}
+
 
 class ActiveArrayInfo:
     """Active array info class with support for pickling."""
@@ -125,11 +140,23 @@ class DataSet(DataSetFilters, DataObject):
         self._active_vectors_info = ActiveArrayInfo(FieldAssociation.POINT, name=None)
         self._active_tensors_info = ActiveArrayInfo(FieldAssociation.POINT, name=None)
         self._textures: Dict[str, pyvista.Texture] = {}
+        self._locators: Dict[str, Tuple[Any, Tuple]] = {}
+        self._adjacency: Dict[Tuple[str, str], Tuple[Tuple, Tuple[np.ndarray, np.ndarray]]] = {}
+        self._point_locator_type: Optional[str] = None
+        self._cell_locator_type: Optional[str] = None
 
     def __getattr__(self, item) -> Any:
         """Get attribute from base class if not found."""
         return super().__getattribute__(item)
 
+    def __getstate__(self):
+        """Support pickle, ignoring any cached locators."""
+        state = super().__getstate__()
+        # locators and adjacency graphs are rebuilt on demand
+        state['_locators'] = {}
+        state['_adjacency'] = {}
+        return state
+
     @property
     def active_scalars_info(self) -> ActiveArrayInfo:
         """Return the active scalar's association and name.
@@ -2158,13 +2185,194 @@ class DataSet(DataSetFilters, DataObject):
         pset.active_scalars_name = self.active_scalars_name
         return pset
 
+    def _get_mesh_state(self, points: bool = True) -> Tuple:
+        """Return the modification state of the cells and points of this dataset.
+
+        The state changes whenever the cells, or the points when ``points`` is
+        ``True``, are modified or replaced. Unlike ``GetMTime``, this ignores
+        modifications of the point, cell and field data.
+
+        Parameters
+        ----------
+        points : bool, default: True
+            Include the points in the state.
+
+        Returns
+        -------
+        tuple
+            Hashable modification state.
+
+        """
+        objects: List[Optional[_vtk.vtkObject]] = []
+        if isinstance(self, _vtk.vtkPolyData):
+            objects.extend([self.GetVerts(), self.GetLines(), self.GetPolys(), self.GetStrips()])
+        elif isinstance(self, _vtk.vtkUnstructuredGrid):
+            objects.extend([self.GetCells(), self.GetCellTypesArray(), self.GetFaces()])
+        elif not isinstance(self, pyvista.PointSet):
+            # the topology of structured datasets is only defined by their
+            # dimensions, which modify the dataset itself
+            objects.append(self)
+            if isinstance(self, _vtk.vtkExplicitStructuredGrid):
+                objects.append(self.GetCells())
+
+        if points:
+            if isinstance(self, _vtk.vtkPointSet):
+                objects.append(self.GetPoints())
+            elif isinstance(self, _vtk.vtkRectilinearGrid):
+                objects.extend(
+                    [self.GetXCoordinates(), self.GetYCoordinates(), self.GetZCoordinates()]
+                )
+
+        # calling the vtkObject method returns the modification time of this
+        # dataset alone, excluding its attributes
+        return tuple(
+            (obj.__this__, _vtk.vtkObject.GetMTime(obj) if obj is self else obj.GetMTime())
+            for obj in objects
+            if obj is not None
+        )
+
+    def _get_locator(self, locator_type: str, kind: str = 'cell'):
+        """Return a cached locator, building it if needed.
+
+        Parameters
+        ----------
+        locator_type : str
+            Type of the locator. One of the keys of ``POINT_LOCATORS`` when
+            ``kind='point'`` or ``CELL_LOCATORS`` when ``kind='cell'``.
+
+        kind : str, default: 'cell'
+            Either ``'point'`` or ``'cell'``.
+
+        Returns
+        -------
+        vtk.vtkLocator
+            Locator built for the current geometry of this dataset.
+
+        """
+        locators = POINT_LOCATORS if kind == 'point' else CELL_LOCATORS
+        if locator_type not in locators:
+            raise ValueError(
+                f'Invalid {kind} locator type "{locator_type}". '
+                f'Must be one of: {list(locators.keys())}'
+            )
+
+        key = f'{kind}_{locator_type}'
+        state = self._get_mesh_state()
+        if key in self._locators:
+            locator, build_state = self._locators[key]
+            if build_state == state:
+                return locator
+
+        # Locators hold a reference to their dataset. Build the locator on a
+        # structural copy to avoid a reference cycle keeping this dataset
+        # alive. The copy shares the points and cells with this dataset.
+        structure = self.NewInstance()
+        structure.CopyStructure(self)
+
+        locator = getattr(_vtk, locators[locator_type])()
+        locator.SetDataSet(structure)
+        locator.BuildLocator()
+        self._locators[key] = (locator, state)
+        return locator
+
+    def _get_point_locator(self, default: str = 'point'):
+        """Return the cached point locator used for point queries."""
+        return self._get_locator(self._point_locator_type or default, kind='point')
+
+    def _get_cell_locator(self, default: str = 'cell'):
+        """Return the cached cell locator used for cell queries."""
+        return self._get_locator(self._cell_locator_type or default, kind='cell')
+
+    def build_locators(
+        self, point_locator: Optional[str] = None, cell_locator: Optional[str] = None
+    ):
+        """Build and cache the point and cell locators of this dataset.
+
+        Spatial queries such as :func:`DataSet.find_closest_point` and
+        :func:`DataSet.find_closest_cell` use locators which are built on
+        the first query and reused by subsequent queries until the points
+        or cells of this dataset are modified. Use this method to select
+        the type of the locators and to build them ahead of time.
+
+        .. versionadded:: 0.40.0
+
+        Parameters
+        ----------
+        point_locator : str, optional
+            Type of the point locator. One of ``'point'``
+            (``vtkPointLocator``), ``'static'`` (``vtkStaticPointLocator``)
+            or ``'octree'`` (``vtkOctreePointLocator``). Defaults to
+            ``'point'``.
+
+        cell_locator : str, optional
+            Type of the cell locator. One of ``'cell'``
+            (``vtkCellLocator``), ``'static'`` (``vtkStaticCellLocator``),
+            ``'tree'`` (``vtkCellTreeLocator``), ``'bsp'``
+            (``vtkModifiedBSPTree``) or ``'obb'`` (``vtkOBBTree``).
+            Not every locator supports every query. By default,
+            ``vtkCellLocator`` is used for all queries except
+            :func:`DataSet.find_cells_within_bounds`, which uses
+            ``vtkCellTreeLocator``.
+
+        See Also
+        --------
+        DataSet.clear_locators
+
+        Examples
+        --------
+        Build static locators ahead of many queries.
+
+        >>> import pyvista
+        >>> mesh = pyvista.Sphere()
+        >>> mesh.build_locators(point_locator='static', cell_locator='static')
+        >>> mesh.find_closest_cell([0.1, 0.2, 0.3])
+        591
+
+        """
+        if point_locator is not None and point_locator not in POINT_LOCATORS:
+            raise ValueError(
+                f'Invalid point locator type "{point_locator}". '
+                f'Must be one of: {list(POINT_LOCATORS.keys())}'
+            )
+        if cell_locator is not None and cell_locator not in CELL_LOCATORS:
+            raise ValueError(
+                f'Invalid cell locator type "{cell_locator}". '
+                f'Must be one of: {list(CELL_LOCATORS.keys())}'
+            )
+        self._point_locator_type = point_locator
+        self._cell_locator_type = cell_locator
+        self._get_point_locator()
+        self._get_cell_locator()
+
+    def clear_locators(self):
+        """Free the point and cell locators cached by this dataset.
+
+        The locator types selected with :func:`DataSet.build_locators`
+        are reset to their defaults.
+
+        .. versionadded:: 0.40.0
+
+        See Also
+        --------
+        DataSet.build_locators
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> mesh = pyvista.Sphere()
+        >>> mesh.find_closest_point((0, 1, 0))
+        212
+        >>> mesh.clear_locators()
+
+        """
+        self._locators.clear()
+        self._point_locator_type = None
+        self._cell_locator_type = None
+
     def find_closest_point(self, point: Iterable[float], n=1) -> int:
         """Find index of closest point in this mesh to the given point.
 
-        If wanting to query many points, use a KDTree with scipy or another
-        library as those implementations will be easier to work with.
-
-        See: https://github.com/pyvista/pyvista-support/issues/107
+        If wanting to query many points, use :func:`DataSet.query_nearest`.
 
         Parameters
         ----------
@@ -2182,6 +2390,7 @@ class DataSet(DataSetFilters, DataObject):
 
         See Also
         --------
+        DataSet.query_nearest
         DataSet.find_closest_cell
         DataSet.find_containing_cell
         DataSet.find_cells_along_line
@@ -2210,15 +2419,268 @@ class DataSet(DataSetFilters, DataObject):
         if n < 1:
             raise ValueError("`n` must be a positive integer.")
 
-        locator = _vtk.vtkPointLocator()
-        locator.SetDataSet(self)
-        locator.BuildLocator()
+        locator = self._get_point_locator()
         if n > 1:
             id_list = _vtk.vtkIdList()
             locator.FindClosestNPoints(n, point, id_list)
             return vtk_id_list_to_array(id_list)
         return locator.FindClosestPoint(point)
 
+    def _get_kdtree(self):
+        """Return a cached ``scipy.spatial.cKDTree`` of the points.
+
+        Returns ``None`` when ``scipy`` is not installed.
+        """
+        try:
+            from scipy.spatial import cKDTree
+        except ImportError:  # pragma: no cover
+            return None
+
+        state = self._get_mesh_state()
+        if 'point_kdtree' in self._locators:
+            tree, build_state = self._locators['point_kdtree']
+            if build_state == state:
+                return tree
+
+        tree = cKDTree(np.asarray(self.points, dtype=float))
+        self._locators['point_kdtree'] = (tree, state)
+        return tree
+
+    def _query_closest_vtk(self, points: np.ndarray) -> np.ndarray:
+        """Find the closest point to each query point in a single VTK pass."""
+        # the Voronoi kernel interpolates the value of the closest point, so
+        # interpolating the point ids returns the closest point of each query
+        # point. Floating point ids are exact and are not truncated to float.
+        source = _vtk.vtkPolyData()
+        source.SetPoints(self.GetPoints())
+        ids = _vtk.numpy_to_vtk(np.arange(self.n_points, dtype=float), deep=True)
+        ids.SetName('ids')
+        source.GetPointData().AddArray(ids)
+
+        alg = _vtk.vtkPointInterpolator()
+        alg.SetSourceData(source)
+        alg.SetInputData(pyvista.PolyData(points, deep=False))
+        alg.SetKernel(_vtk.vtkVoronoiKernel())
+        alg.SetNullPointsStrategyToClosestPoint()
+        alg.Update()
+        ids = alg.GetOutput().GetPointData().GetArray('ids')
+        return _vtk.vtk_to_numpy(ids).astype(pyvista.ID_TYPE)
+
+    def query_nearest(
+        self, points: Union[VectorArray, NumericArray], k: int = 1, workers: int = 1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the ``k`` closest points of this mesh to many query points.
+
+        All the query points are evaluated at once by a KD-tree of the
+        points of this mesh, which is cached until the mesh is modified.
+        This requires ``scipy``. Without ``scipy``, the closest points are
+        found in a single ``vtkPointInterpolator`` pass for ``k=1``, and
+        one query point at a time with a cached ``vtkStaticPointLocator``
+        otherwise.
+
+        .. versionadded:: 0.40.0
+
+        Parameters
+        ----------
+        points : array_like[float]
+            Coordinates of the query points with shape ``(m, 3)``, or a
+            single point with shape ``(3,)``.
+
+        k : int, default: 1
+            Number of closest points to find for each query point.
+
+        workers : int, default: 1
+            Number of threads used by the KD-tree to evaluate the queries.
+            ``-1`` uses one thread per CPU. Ignored without ``scipy``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Indices of the closest points with shape ``(m, k)``, sorted
+            by increasing distance. When the mesh has fewer than ``k``
+            points, missing neighbors are set to ``-1``.
+
+        numpy.ndarray
+            Distances to the closest points with shape ``(m, k)``.
+            Distances of missing neighbors are ``numpy.inf``.
+
+        See Also
+        --------
+        DataSet.find_closest_point
+        DataSet.query_radius
+
+        Examples
+        --------
+        Find the three closest points of a sphere to two points.
+
+        >>> import pyvista
+        >>> mesh = pyvista.Sphere()
+        >>> indices, distances = mesh.query_nearest(
+        ...     [[0, 0, 1], [0, 0, -1]], k=3
+        ... )
+        >>> indices.shape
+        (2, 3)
+
+        The closest points are the poles of the sphere.
+
+        >>> indices[:, 0]
+        array([1, 0])
+        >>> distances[:, 0]
+        array([0.5, 0.5])
+
+        """
+        points, _ = _coerce_pointslike_arg(points, copy=False)
+        if not isinstance(k, (int, np.integer)) or k < 1:
+            raise ValueError('`k` must be a positive integer.')
+        workers = _resolve_workers(workers)
+
+        n_queries = points.shape[0]
+        indices = np.full((n_queries, k), -1, dtype=pyvista.ID_TYPE)
+        if not self.n_points:
+            return indices, np.full(indices.shape, np.inf)
+
+        tree = self._get_kdtree()
+        if tree is not None:
+            distances, found = tree.query(points, k=np.arange(1, k + 1), workers=workers)
+            missing = found == self.n_points
+            indices[~missing] = found[~missing]
+            return indices, distances
+
+        if k == 1:
+            indices[:, 0] = self._query_closest_vtk(points)
+        else:
+            locator = self._get_locator('static', kind='point')
+            id_list = _vtk.vtkIdList()
+            for i in range(n_queries):
+                locator.FindClosestNPoints(k, points[i], id_list)
+                found = vtk_id_list_to_array(id_list)
+                indices[i, : found.size] = found
+        distances = np.linalg.norm(self.points[indices] - points[:, np.newaxis], axis=-1)
+        distances[indices < 0] = np.inf
+        return indices, distances
+
+    def query_radius(
+        self,
+        points: Union[VectorArray, NumericArray],
+        radius: Union[float, NumericArray],
+        sort: bool = False,
+        workers: int = 1,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Find the points of this mesh within a radius of many query points.
+
+        Since each query point may have a different number of neighbors,
+        the results are returned in compressed sparse row (CSR) format:
+        the neighbors of query point ``i`` are
+        ``indices[offsets[i]:offsets[i + 1]]``.
+
+        All the query points are evaluated at once by a KD-tree of the
+        points of this mesh, which is cached until the mesh is modified.
+        This requires ``scipy``. Without ``scipy``, the query points are
+        evaluated one at a time with a cached ``vtkStaticPointLocator``.
+
+        .. versionadded:: 0.40.0
+
+        Parameters
+        ----------
+        points : array_like[float]
+            Coordinates of the query points with shape ``(m, 3)``, or a
+            single point with shape ``(3,)``.
+
+        radius : float | array_like[float]
+            Search radius, either for all query points or one radius per
+            query point with shape ``(m,)``.
+
+        sort : bool, default: False
+            Sort the neighbors of each query point by increasing distance.
+
+        workers : int, default: 1
+            Number of threads used by the KD-tree to evaluate the queries
+            with one radius per query point. ``-1`` uses one thread per
+            CPU. Ignored without ``scipy``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Offsets of the neighbors of each query point with shape
+            ``(m + 1,)``.
+
+        numpy.ndarray
+            Indices of the neighbors of all query points.
+
+        numpy.ndarray
+            Distances of the neighbors of all query points.
+
+        See Also
+        --------
+        DataSet.query_nearest
+
+        Examples
+        --------
+        Count the points of a sphere within a radius of two points.
+
+        >>> import numpy as np
+        >>> import pyvista
+        >>> mesh = pyvista.Sphere()
+        >>> offsets, indices, distances = mesh.query_radius(
+        ...     [[0, 0, 0.5], [0, 0, 0]], 0.1
+        ... )
+        >>> np.diff(offsets)
+        array([31,  0])
+
+        """
+        points, _ = _coerce_pointslike_arg(points, copy=False)
+        n_queries = points.shape[0]
+        radii = np.broadcast_to(np.asarray(radius, dtype=float), (n_queries,))
+        if np.any(radii < 0):
+            raise ValueError('`radius` must be non-negative.')
+        workers = _resolve_workers(workers)
+
+        tree = self._get_kdtree() if self.n_points else None
+        distances = None
+        if tree is not None and np.ndim(radius) == 0:
+            # a tree of the query points finds all the pairs within a single
+            # radius at once, without creating one list per query point
+            from scipy.spatial import cKDTree
+
+            pairs = cKDTree(points).sparse_distance_matrix(tree, radius, output_type='ndarray')
+            order = np.argsort(pairs['i'], kind='stable')
+            counts = np.bincount(pairs['i'], minlength=n_queries).astype(pyvista.ID_TYPE)
+            indices = pairs['j'][order].astype(pyvista.ID_TYPE)
+            distances = pairs['v'][order]
+        elif tree is not None:
+            neighbors = tree.query_ball_point(points, radii, workers=workers)
+            counts = np.fromiter(map(len, neighbors), dtype=pyvista.ID_TYPE, count=n_queries)
+            indices = np.fromiter(
+                itertools.chain.from_iterable(neighbors),
+                dtype=pyvista.ID_TYPE,
+                count=int(counts.sum()),
+            )
+        elif not self.n_points:
+            counts = np.zeros(n_queries, dtype=pyvista.ID_TYPE)
+            indices = np.empty(0, dtype=pyvista.ID_TYPE)
+        else:
+            locator = self._get_locator('static', kind='point')
+            id_list = _vtk.vtkIdList()
+            neighbors = []
+            for i in range(n_queries):
+                locator.FindPointsWithinRadius(radii[i], points[i], id_list)
+                neighbors.append(vtk_id_list_to_array(id_list))
+            counts = np.fromiter(map(len, neighbors), dtype=pyvista.ID_TYPE, count=n_queries)
+            indices = np.concatenate(neighbors) if neighbors else np.empty(0, pyvista.ID_TYPE)
+            indices = indices.astype(pyvista.ID_TYPE, copy=False)
+
+        offsets = np.zeros(n_queries + 1, dtype=pyvista.ID_TYPE)
+        np.cumsum(counts, out=offsets[1:])
+
+        rows = np.repeat(np.arange(n_queries), counts)
+        if distances is None:
+            distances = np.linalg.norm(self.points[indices] - points[rows], axis=-1)
+        if sort:
+            order = np.lexsort((distances, rows))
+            indices = indices[order]
+            distances = distances[order]
+        return offsets, indices, distances
+
     def find_closest_cell(
         self,
         point: Union[VectorArray, NumericArray],
@@ -2324,9 +2786,7 @@ class DataSet(DataSetFilters, DataObject):
         """
         point, singular = _coerce_pointslike_arg(point, copy=False)
 
-        locator = _vtk.vtkCellLocator()
-        locator.SetDataSet(self)
-        locator.BuildLocator()
+        locator = self._get_cell_locator()
 
         cell = _vtk.vtkGenericCell()
 
@@ -2410,9 +2870,7 @@ class DataSet(DataSetFilters, DataObject):
         """
         point, singular = _coerce_pointslike_arg(point, copy=False)
 
-        locator = _vtk.vtkCellLocator()
-        locator.SetDataSet(self)
-        locator.BuildLocator()
+        locator = self._get_cell_locator()
 
         containing_cells = [locator.FindCell(node) for node in point]
         return containing_cells[0] if singular else np.array(containing_cells)
@@ -2471,9 +2929,7 @@ class DataSet(DataSetFilters, DataObject):
             raise TypeError("Point A must be a length three tuple of floats.")
         if np.array(pointb).size != 3:
             raise TypeError("Point B must be a length three tuple of floats.")
-        locator = _vtk.vtkCellLocator()
-        locator.SetDataSet(self)
-        locator.BuildLocator()
+        locator = self._get_cell_locator()
         id_list = _vtk.vtkIdList()
         locator.FindCellsAlongLine(pointa, pointb, tolerance, id_list)
         return vtk_id_list_to_array(id_list)
@@ -2529,9 +2985,7 @@ class DataSet(DataSetFilters, DataObject):
             raise TypeError("Point A must be a length three tuple of floats.")
         if np.array(pointb).size != 3:
             raise TypeError("Point B must be a length three tuple of floats.")
-        locator = _vtk.vtkCellLocator()
-        locator.SetDataSet(self)
-        locator.BuildLocator()
+        locator = self._get_cell_locator()
         id_list = _vtk.vtkIdList()
         points = _vtk.vtkPoints()
         cell = _vtk.vtkGenericCell()
@@ -2570,9 +3024,7 @@ class DataSet(DataSetFilters, DataObject):
         """
         if np.array(bounds).size != 6:
             raise TypeError("Bounds must be a length three tuple of floats.")
-        locator = _vtk.vtkCellTreeLocator()
-        locator.SetDataSet(self)
-        locator.BuildLocator()
+        locator = self._get_cell_locator(default='tree')
         id_list = _vtk.vtkIdList()
         locator.FindCellsWithinBounds(list(bounds), id_list)
         return vtk_id_list_to_array(id_list)
@@ -2675,6 +3127,46 @@ class DataSet(DataSetFilters, DataObject):
         for i in range(self.n_cells):
             yield self.get_cell(i)
 
+    @property
+    def cells_view(self) -> pyvista.CellsView:
+        """Return a columnar view of all the cells of the dataset.
+
+        The view exposes the connectivity, offsets, types, point counts,
+        bounds and centers of all cells as NumPy arrays and can be indexed
+        with slices, index arrays or boolean masks. Prefer it to
+        :attr:`pyvista.DataSet.cell` and the ``cell_*`` methods when working
+        with many cells.
+
+        .. versionadded:: 0.40.0
+
+        Returns
+        -------
+        pyvista.CellsView
+            Columnar view of the cells.
+
+        See Also
+        --------
+        pyvista.DataSet.cell
+        pyvista.DataSet.get_cell
+
+        Examples
+        --------
+        Get the number of points and the bounds of the cells of a
+        hexahedral beam.
+
+        >>> from pyvista import examples
+        >>> mesh = examples.load_hexbeam()
+        >>> view = mesh.cells_view
+        >>> view.n_points[:4]
+        array([8, 8, 8, 8])
+        >>> view[:2].bounds
+        array([[0. , 0.5, 0. , 0.5, 0. , 0.5],
+               [0.5, 1. , 0. , 0.5, 0. , 0.5]])
+
+        """
+        offsets, connectivity, celltypes = self._get_cell_arrays()
+        return pyvista.CellsView(self.points, offsets, connectivity, celltypes)
+
     def cell_n_points(self, ind: int) -> int:
         """Return the number of points in a cell.
 
@@ -3016,11 +3508,18 @@ class DataSet(DataSetFilters, DataObject):
         Returns
         -------
         generator[list[[int]]
-            A generator of list of neighbor points IDs for the ind-th point.
+            A generator of sorted lists of neighbor points IDs for the
+            ind-th point.
+
+        Notes
+        -----
+        The levels are computed with a breadth first search over the
+        cached graph returned by :func:`pyvista.DataSet.point_adjacency`.
 
         See Also
         --------
         pyvista.DataSet.point_neighbors
+        pyvista.DataSet.point_neighbors_hops
 
         Examples
         --------
@@ -3032,11 +3531,11 @@ class DataSet(DataSetFilters, DataObject):
         >>> pt_nbr_levels = mesh.point_neighbors_levels(0, 3)
         >>> pt_nbr_levels = list(pt_nbr_levels)
         >>> pt_nbr_levels[0]
-        [2, 226, 198, 170, 142, 114, 86, 30, 58, 254]
+        [2, 30, 58, 86, 114, 142, 170, 198, 226, 254]
         >>> pt_nbr_levels[1]
-        [3, 227, 255, 199, 171, 143, 115, 87, 59, 31]
+        [3, 31, 59, 87, 115, 143, 171, 199, 227, 255]
         >>> pt_nbr_levels[2]
-        [256, 32, 4, 228, 200, 172, 144, 116, 88, 60]
+        [4, 32, 60, 88, 116, 144, 172, 200, 228, 256]
 
         Visualize these points IDs.
 
@@ -3071,8 +3570,9 @@ class DataSet(DataSetFilters, DataObject):
         >>> pl.camera.zoom(4.0)
         >>> pl.show()
         """
-        method = self.point_neighbors
-        return self._get_levels_neihgbors(ind, n_levels, method)
+        if ind + 1 > self.n_points:
+            raise IndexError(f'Invalid index {ind} for a dataset with {self.n_points} points.')
+        return self._get_levels_neighbors(ind, n_levels, *self.point_adjacency())
 
     def cell_neighbors_levels(
         self, ind: int, connections: str = "points", n_levels: int = 1
@@ -3096,15 +3596,21 @@ class DataSet(DataSetFilters, DataObject):
         Returns
         -------
         generator[list[int]]
-            A generator of list of cell IDs for each level.
+            A generator of sorted lists of cell IDs for each level.
 
         Warnings
         --------
         For a :class:`pyvista.ExplicitStructuredGrid`, use :func:`pyvista.ExplicitStructuredGrid.neighbors`.
 
+        Notes
+        -----
+        The levels are computed with a breadth first search over the
+        cached graph returned by :func:`pyvista.DataSet.cell_adjacency`.
+
         See Also
         --------
         pyvista.DataSet.cell_neighbors
+        pyvista.DataSet.cell_neighbors_hops
 
         Examples
         --------
@@ -3118,11 +3624,11 @@ class DataSet(DataSetFilters, DataObject):
         ... )
         >>> nbr_levels = list(nbr_levels)
         >>> nbr_levels[0]
-        [1, 21, 9]
+        [1, 9, 21]
         >>> nbr_levels[1]
-        [2, 8, 74, 75, 20, 507]
+        [2, 8, 20, 74, 75, 507]
         >>> nbr_levels[2]
-        [128, 129, 3, 453, 7, 77, 23, 506]
+        [3, 7, 23, 77, 128, 129, 453, 506]
 
         Visualize these cells IDs.
 
@@ -3171,31 +3677,363 @@ class DataSet(DataSetFilters, DataObject):
         >>> pl.camera.zoom(6.0)
         >>> pl.show()
         """
-        method = partial(self.cell_neighbors, connections=connections)
-        return self._get_levels_neihgbors(ind, n_levels, method)
+        if isinstance(self, _vtk.vtkExplicitStructuredGrid):
+            raise TypeError("For an ExplicitStructuredGrid, use the `neighbors` method")
+        if ind + 1 > self.n_cells:
+            raise IndexError(f'Invalid index {ind} for a dataset with {self.n_cells} cells.')
+        return self._get_levels_neighbors(ind, n_levels, *self.cell_adjacency(connections))
+
+    def point_neighbors_hops(
+        self,
+        ind: Union[int, Iterable[int]],
+        n_levels: Optional[int] = None,
+        connections: str = 'cells',
+        return_sources: bool = False,
+    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """Get the number of hops from the nearest seed point to every point.
+
+        All seed points are processed at once by a breadth first search
+        over the cached graph returned by
+        :func:`pyvista.DataSet.point_adjacency`.
+
+        .. versionadded:: 0.40.0
+
+        Parameters
+        ----------
+        ind : int | sequence[int]
+            Seed point ID or IDs.
+
+        n_levels : int, optional
+            Maximum number of hops. By default, all points connected to the
+            seeds are reached.
+
+        connections : str, default: "cells"
+            Describe how the neighbor points must be connected. Either
+            ``'cells'`` or ``'edges'``. See
+            :func:`pyvista.DataSet.point_adjacency`.
+
+        return_sources : bool, default: False
+            Also return the seed point from which each point was reached,
+            which labels the region grown from each seed.
+
+        Returns
+        -------
+        numpy.ndarray
+            Number of hops from the nearest seed to each point, ``0`` for
+            the seeds and ``-1`` for the points which are not reached.
+
+        numpy.ndarray
+            Seed point from which each point was reached, ``-1`` for the
+            points which are not reached. Only returned when
+            ``return_sources=True``.
+
+        See Also
+        --------
+        pyvista.DataSet.point_neighbors_levels
+        pyvista.DataSet.cell_neighbors_hops
+
+        Examples
+        --------
+        Get the points up to two edges away from the poles of a sphere.
+
+        >>> import numpy as np
+        >>> import pyvista as pv
+        >>> mesh = pv.Sphere(theta_resolution=10)
+        >>> hops = mesh.point_neighbors_hops(
+        ...     [0, 1], n_levels=2, connections='edges'
+        ... )
+        >>> np.bincount(hops[hops >= 0])
+        array([ 2, 20, 20])
+
+        """
+        seeds = np.atleast_1d(np.asarray(ind))
+        if seeds.size and (seeds.min() < 0 or seeds.max() >= self.n_points):
+            raise IndexError(f'Invalid index {ind} for a dataset with {self.n_points} points.')
+        offsets, indices = self.point_adjacency(connections)
+        return adjacency.hop_distance(
+            offsets, indices, seeds, n_levels=n_levels, return_sources=return_sources
+        )
+
+    def cell_neighbors_hops(
+        self,
+        ind: Union[int, Iterable[int]],
+        connections: str = 'points',
+        n_levels: Optional[int] = None,
+        return_sources: bool = False,
+    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """Get the number of hops from the nearest seed cell to every cell.
+
+        All seed cells are processed at once by a breadth first search
+        over the cached graph returned by
+        :func:`pyvista.DataSet.cell_adjacency`.
+
+        .. versionadded:: 0.40.0
+
+        Parameters
+        ----------
+        ind : int | sequence[int]
+            Seed cell ID or IDs.
+
+        connections : str, default: "points"
+            Describe how the neighbor cells must be connected.
+            Can be either ``'points'``, ``'edges'`` or ``'faces'``.
+
+        n_levels : int, optional
+            Maximum number of hops. By default, all cells connected to the
+            seeds are reached.
+
+        return_sources : bool, default: False
+            Also return the seed cell from which each cell was reached,
+            which labels the region grown from each seed.
+
+        Returns
+        -------
+        numpy.ndarray
+            Number of hops from the nearest seed to each cell, ``0`` for
+            the seeds and ``-1`` for the cells which are not reached.
+
+        numpy.ndarray
+            Seed cell from which each cell was reached, ``-1`` for the
+            cells which are not reached. Only returned when
+            ``return_sources=True``.
+
+        See Also
+        --------
+        pyvista.DataSet.cell_neighbors_levels
+        pyvista.DataSet.point_neighbors_hops
+
+        Examples
+        --------
+        Grow regions from two cells of a sphere and label each cell
+        with the seed it was reached from.
+
+        >>> import pyvista as pv
+        >>> mesh = pv.Sphere()
+        >>> hops, sources = mesh.cell_neighbors_hops(
+        ...     [0, 1000], connections='edges', return_sources=True
+        ... )
+        >>> mesh['region'] = sources
+        >>> hops.max() > 0
+        True
 
-    def _get_levels_neihgbors(
-        self, ind: int, n_levels: int, method: Callable
+        """
+        seeds = np.atleast_1d(np.asarray(ind))
+        if seeds.size and (seeds.min() < 0 or seeds.max() >= self.n_cells):
+            raise IndexError(f'Invalid index {ind} for a dataset with {self.n_cells} cells.')
+        offsets, indices = self.cell_adjacency(connections)
+        return adjacency.hop_distance(
+            offsets, indices, seeds, n_levels=n_levels, return_sources=return_sources
+        )
+
+    @staticmethod
+    def _get_levels_neighbors(
+        ind: int, n_levels: int, offsets: np.ndarray, indices: np.ndarray
     ) -> Generator[List[int], None, None]:
-        """Provide helper method that yields neighbors ids."""
-        neighbors = set(method(ind))
-        yield list(neighbors)
-
-        # Keep track of visited points or cells
-        all_visited = neighbors.copy()
-        all_visited.add(ind)
-
-        for _ in range(n_levels - 1):
-            # Get the neighbors for the next level.
-            new_visited = set()
-            for n in neighbors:
-                new_neighbors = method(n)
-                new_visited.update(new_neighbors)
-            neighbors = new_visited
-
-            # Only return the ones that have not been visited yet
-            yield list(neighbors.difference(all_visited))
-            all_visited.update(neighbors)
+        """Yield the sorted neighbor ids of each level of a CSR adjacency graph."""
+        hops = adjacency.hop_distance(offsets, indices, [ind], n_levels=n_levels)
+        reached = np.flatnonzero(hops > 0)
+        reached = reached[np.argsort(hops[reached], kind='stable')]
+        counts = np.bincount(hops[reached] - 1, minlength=n_levels)
+        for level in np.split(reached, np.cumsum(counts)[:-1]):
+            yield level.tolist()
+
+    def _get_cell_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the offsets, connectivity and cell types of all cells.
+
+        Returns
+        -------
+        numpy.ndarray
+            Offsets of each cell in the connectivity array with length
+            ``n_cells + 1``.
+
+        numpy.ndarray
+            Point ids of all cells.
+
+        numpy.ndarray
+            VTK cell type of each cell.
+
+        """
+        if isinstance(self, _vtk.vtkUnstructuredGrid):
+            cells = self.GetCells()
+            return (
+                _vtk.vtk_to_numpy(cells.GetOffsetsArray()),
+                _vtk.vtk_to_numpy(cells.GetConnectivityArray()),
+                _vtk.vtk_to_numpy(self.GetCellTypesArray()),
+            )
+
+        if not isinstance(self, _vtk.vtkPolyData):
+            return self.cast_to_unstructured_grid()._get_cell_arrays()
+
+        # polydata cells are ordered as vertices, lines, polygons and strips
+        offsets = [np.zeros(1, dtype=pyvista.ID_TYPE)]
+        connectivity = []
+        celltypes = []
+        types_by_size = [
+            ({1: CellType.VERTEX}, CellType.POLY_VERTEX),
+            ({2: CellType.LINE}, CellType.POLY_LINE),
+            ({3: CellType.TRIANGLE, 4: CellType.QUAD}, CellType.POLYGON),
+            ({}, CellType.TRIANGLE_STRIP),
+        ]
+        cell_arrays = [self.GetVerts(), self.GetLines(), self.GetPolys(), self.GetStrips()]
+        for cell_array, (fixed_types, default_type) in zip(cell_arrays, types_by_size):
+            if cell_array is None or cell_array.GetNumberOfCells() == 0:
+                continue
+            cell_offsets = _vtk.vtk_to_numpy(cell_array.GetOffsetsArray())
+            offsets.append(cell_offsets[1:] + offsets[-1][-1])
+            connectivity.append(_vtk.vtk_to_numpy(cell_array.GetConnectivityArray()))
+
+            sizes = np.diff(cell_offsets)
+            types = np.full(sizes.size, default_type, dtype=np.uint8)
+            for size, celltype in fixed_types.items():
+                types[sizes == size] = celltype
+            celltypes.append(types)
+
+        return (
+            np.concatenate(offsets).astype(pyvista.ID_TYPE, copy=False),
+            np.concatenate(connectivity or [np.empty(0, dtype=pyvista.ID_TYPE)]),
+            np.concatenate(celltypes or [np.empty(0, dtype=np.uint8)]),
+        )
+
+    def _get_adjacency(self, kind: str, connections: str, sparse: bool):
+        """Return a cached point or cell adjacency graph, computing it if needed."""
+        key = (kind, connections)
+        state = self._get_mesh_state(points=False)
+        if key in self._adjacency and self._adjacency[key][0] == state:
+            offsets, indices = self._adjacency[key][1]
+        else:
+            cell_arrays = self._get_cell_arrays()
+            if kind == 'point':
+                offsets, indices = adjacency.point_adjacency(
+                    *cell_arrays, self.n_points, connections, get_cell=self.get_cell
+                )
+            else:
+                offsets, indices = adjacency.cell_adjacency(
+                    *cell_arrays, connections, get_cell=self.get_cell
+                )
+            # cached arrays are shared between calls
+            offsets.flags.writeable = False
+            indices.flags.writeable = False
+            self._adjacency[key] = (state, (offsets, indices))
+
+        if sparse:
+            try:
+                from scipy.sparse import csr_matrix
+            except ImportError:  # pragma: no cover
+                raise ImportError('Install ``scipy`` to return a sparse matrix.')
+            n = offsets.size - 1
+            data = np.ones(indices.size, dtype=bool)
+            return csr_matrix((data, indices, offsets), shape=(n, n))
+        return offsets, indices
+
+    def point_adjacency(self, connections: str = 'cells', sparse: bool = False):
+        """Return the neighbors of all points of this dataset.
+
+        The neighbors are returned as a graph in compressed sparse row
+        (CSR) format: the neighbors of point ``i`` are
+        ``indices[offsets[i]:offsets[i + 1]]``. The graph is computed
+        with vectorized operations over all cells and is cached until the
+        cells of this dataset are modified.
+
+        .. versionadded:: 0.40.0
+
+        Parameters
+        ----------
+        connections : str, default: "cells"
+            Describe how the neighbor points must be connected to a point.
+            With ``'cells'``, points sharing a cell are neighbors, as
+            with :func:`DataSet.point_neighbors`. With ``'edges'``, only
+            points sharing an edge are neighbors.
+
+        sparse : bool, default: False
+            Return the graph as a :class:`scipy.sparse.csr_matrix`
+            instead. Requires ``scipy``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Offsets of the neighbors of each point with length
+            ``n_points + 1``.
+
+        numpy.ndarray
+            Sorted neighbor ids of all points.
+
+        See Also
+        --------
+        DataSet.point_neighbors
+        DataSet.cell_adjacency
+
+        Examples
+        --------
+        Get the neighbors of the 0-th point.
+
+        >>> import pyvista as pv
+        >>> mesh = pv.Sphere(theta_resolution=10)
+        >>> offsets, indices = mesh.point_adjacency()
+        >>> indices[offsets[0] : offsets[1]]
+        array([  2,  30,  58,  86, 114, 142, 170, 198, 226, 254])
+
+        """
+        needed = ['cells', 'edges']
+        if connections not in needed:
+            raise ValueError(f'`connections` must be one of: {needed} (got "{connections}")')
+        return self._get_adjacency('point', connections, sparse)
+
+    def cell_adjacency(self, connections: str = 'points', sparse: bool = False):
+        """Return the neighbors of all cells of this dataset.
+
+        The neighbors are returned as a graph in compressed sparse row
+        (CSR) format: the neighbors of cell ``i`` are
+        ``indices[offsets[i]:offsets[i + 1]]``. The graph is computed
+        with vectorized operations over all cells and is cached until the
+        cells of this dataset are modified.
+
+        .. versionadded:: 0.40.0
+
+        Parameters
+        ----------
+        connections : str, default: "points"
+            Describe how the neighbor cells must be connected to a cell.
+            Can be either ``'points'``, ``'edges'`` or ``'faces'``, as with
+            :func:`DataSet.cell_neighbors`.
+
+        sparse : bool, default: False
+            Return the graph as a :class:`scipy.sparse.csr_matrix`
+            instead. Requires ``scipy``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Offsets of the neighbors of each cell with length
+            ``n_cells + 1``.
+
+        numpy.ndarray
+            Sorted neighbor ids of all cells.
+
+        See Also
+        --------
+        DataSet.cell_neighbors
+        DataSet.point_adjacency
+
+        Examples
+        --------
+        Get the neighbors of the 0-th cell sharing an edge.
+
+        >>> from pyvista import examples
+        >>> mesh = examples.load_airplane()
+        >>> offsets, indices = mesh.cell_adjacency("edges")
+        >>> indices[offsets[0] : offsets[1]]
+        array([ 1,  3, 12])
+
+        Count the neighbors of each cell.
+
+        >>> import numpy as np
+        >>> n_neighbors = np.diff(offsets)
+
+        """
+        needed = ['points', 'edges', 'faces']
+        if connections not in needed:
+            raise ValueError(f'`connections` must be one of: {needed} (got "{connections}")')
+        return self._get_adjacency('cell', connections, sparse)
 
     def point_cell_ids(self, ind: int) -> List[int]:
         """Get the cell IDs that use the ind-th point.
@@ -24,24 +24,31 @@ Example
 """
 # flake8: noqa: F401
 
+import time
+
 import pyvista
+from pyvista.core.utilities import profiling
 from pyvista.core.utilities.helpers import wrap
 from pyvista.core.utilities.observers import ProgressMonitor
 
 
 def _update_alg(alg, progress_bar=False, message=''):
     """Update an algorithm with or without a progress bar."""
+    start = time.perf_counter()
     if progress_bar:
         with ProgressMonitor(alg, message=message):
             alg.Update()
     else:
         alg.Update()
+    if profiling._hooks:
+        profiling._emit(alg, 'update', start)
 
 
 def _get_output(
     algorithm, iport=0, iconnection=0, oport=0, active_scalars=None, active_scalars_field='point'
 ):
     """Get the algorithm's output and copy input's pyvista meta info."""
+    start = time.perf_counter()
     ido = wrap(algorithm.GetInputDataObject(iport, iconnection))
     data = wrap(algorithm.GetOutputDataObject(oport))
     if not isinstance(data, pyvista.MultiBlock):
@@ -52,7 +59,9 @@ def _get_output(
             data.set_active_scalars(active_scalars, preference=active_scalars_field)
     # return a PointSet if input is a pointset
     if isinstance(ido, pyvista.PointSet):
-        return data.cast_to_pointset()
+        data = data.cast_to_pointset()
+    if profiling._hooks:
+        profiling._emit(algorithm, 'output', start, data)
     return data
 
 
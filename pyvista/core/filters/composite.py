@@ -95,6 +95,12 @@ class CompositeFilters:
 
     slice_along_line = DataSetFilters.slice_along_line
 
+    threshold = DataSetFilters.threshold
+
+    contour = DataSetFilters.contour
+
+    extract_surface = DataSetFilters.extract_surface
+
     extract_all_edges = DataSetFilters.extract_all_edges
 
     elevation = DataSetFilters.elevation
@@ -109,6 +115,8 @@ class CompositeFilters:
 
     triangulate = DataSetFilters.triangulate
 
+    pipeline = DataSetFilters.pipeline
+
     def outline(self, generate_faces=False, nested=False, progress_bar=False):
         """Produce an outline of the full extent for the all blocks in this composite dataset.
 
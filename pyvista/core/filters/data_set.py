@@ -1,9 +1,9 @@
 """Filters module with a class of common filters that can be applied to any vtkDataSet."""
 import collections.abc
+import functools
 from typing import Optional, Sequence, Union
 import warnings
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 import pyvista
@@ -18,10 +18,49 @@ from pyvista.core.utilities.arrays import (
     set_default_active_scalars,
     vtkmatrix_from_array,
 )
-from pyvista.core.utilities.cells import numpy_to_idarr
+from pyvista.core.utilities.cells import _selection_mask, numpy_to_idarr
+from pyvista.core.utilities.filter_cache import _cached_filter
 from pyvista.core.utilities.geometric_objects import NORMALS
 from pyvista.core.utilities.helpers import generate_plane, wrap
-from pyvista.core.utilities.misc import abstract_class, assert_empty_kwargs
+from pyvista.core.utilities.misc import _map_chunks, abstract_class, assert_empty_kwargs
+
+
+def _combine_slices(slices):
+    """Append slices into one mesh with a cell array of the slice indices."""
+    slices = [slc.copy(deep=False) for slc in slices]
+    for i, slc in enumerate(slices):
+        slc.cell_data['slice_index'] = np.full(slc.n_cells, i)
+    # empty slices have no arrays, which would remove them from the output
+    meshes = [slc for slc in slices if slc.n_cells] or slices[:1]
+    return meshes[0].append_polydata(*meshes[1:])
+
+
+def _filter_as_composite(dataset, filter_func, **kwargs):
+    """Filter a dataset as the only block of a composite dataset.
+
+    Some filters use a different VTK algorithm for some types of datasets
+    than for composite datasets. Filtering the blocks one at a time this
+    way gives the same outputs as filtering the whole composite dataset.
+    """
+    result = filter_func(pyvista.MultiBlock([dataset]), **kwargs)
+    if isinstance(result, tuple):
+        return tuple(output[0] for output in result)
+    return result[0]
+
+
+def _filter_with_scalars(dataset, filter_func, output_type, scalars, preference, **kwargs):
+    """Filter a block of a composite dataset on an array which it may lack.
+
+    Like the composite VTK algorithms, blocks without the array, or
+    without any array when ``scalars`` is ``None``, give an empty output.
+    """
+    if scalars is None:
+        missing = not dataset.point_data.keys() and not dataset.cell_data.keys()
+    else:
+        missing = get_array(dataset, scalars, preference=preference, err=False) is None
+    if missing:
+        return output_type()
+    return filter_func(dataset, scalars=scalars, preference=preference, **kwargs)
 
 
 @abstract_class
@@ -185,6 +224,7 @@ class DataSetFilters:
         return_clipped=False,
         progress_bar=False,
         crinkle=False,
+        workers=1,
     ):
         """Clip a dataset by a plane by specifying the origin and normal.
 
@@ -223,6 +263,13 @@ class DataSetFilters:
             attribute that tracks the original cell IDs of the original
             dataset.
 
+        workers : int, default: 1
+            Number of processes used to filter the blocks of a
+            :class:`pyvista.MultiBlock` concurrently. ``-1`` uses one
+            process per CPU. This has no effect on other datasets.
+
+            .. versionadded:: 0.40.0
+
         Returns
         -------
         pyvista.PolyData or tuple(pyvista.PolyData)
@@ -256,18 +303,35 @@ class DataSetFilters:
         # find center of data if origin not specified
         if origin is None:
             origin = self.center
-        # create the plane for clipping
-        function = generate_plane(normal, origin)
-        # run the clip
-        result = DataSetFilters._clip_with_function(
-            self,
-            function,
-            invert=invert,
-            value=value,
-            return_clipped=return_clipped,
-            progress_bar=progress_bar,
-            crinkle=crinkle,
-        )
+        if isinstance(self, pyvista.MultiBlock) and workers != 1:
+            result = self.map(
+                functools.partial(
+                    _filter_as_composite,
+                    filter_func=DataSetFilters.clip,
+                    normal=normal,
+                    origin=origin,
+                    invert=invert,
+                    value=value,
+                    return_clipped=return_clipped,
+                    crinkle=crinkle,
+                    progress_bar=progress_bar,
+                ),
+                workers=workers,
+                executor='process',
+            )
+        else:
+            # create the plane for clipping
+            function = generate_plane(normal, origin)
+            # run the clip
+            result = DataSetFilters._clip_with_function(
+                self,
+                function,
+                invert=invert,
+                value=value,
+                return_clipped=return_clipped,
+                progress_bar=progress_bar,
+                crinkle=crinkle,
+            )
         if inplace:
             if return_clipped:
                 self.copy_from(result[0], deep=False)
@@ -690,7 +754,13 @@ class DataSetFilters:
         return output
 
     def slice(
-        self, normal='x', origin=None, generate_triangles=False, contour=False, progress_bar=False
+        self,
+        normal='x',
+        origin=None,
+        generate_triangles=False,
+        contour=False,
+        progress_bar=False,
+        workers=1,
     ):
         """Slice a dataset by a plane at the specified origin and normal vector orientation.
 
@@ -718,6 +788,13 @@ class DataSetFilters:
         progress_bar : bool, default: False
             Display a progress bar to indicate progress.
 
+        workers : int, default: 1
+            Number of processes used to filter the blocks of a
+            :class:`pyvista.MultiBlock` concurrently. ``-1`` uses one
+            process per CPU. This has no effect on other datasets.
+
+            .. versionadded:: 0.40.0
+
         Returns
         -------
         pyvista.PolyData
@@ -743,6 +820,20 @@ class DataSetFilters:
         # find center of data if origin not specified
         if origin is None:
             origin = self.center
+        if isinstance(self, pyvista.MultiBlock) and workers != 1:
+            return self.map(
+                functools.partial(
+                    _filter_as_composite,
+                    filter_func=DataSetFilters.slice,
+                    normal=normal,
+                    origin=origin,
+                    generate_triangles=generate_triangles,
+                    contour=contour,
+                    progress_bar=progress_bar,
+                ),
+                workers=workers,
+                executor='process',
+            )
         # create the plane for clipping
         plane = generate_plane(normal, origin)
         return DataSetFilters.slice_implicit(
@@ -753,8 +844,143 @@ class DataSetFilters:
             progress_bar=progress_bar,
         )
 
+    def _slice_axis_planes(self, planes, generate_triangles=False, progress_bar=False):
+        """Slice a dataset by several axis-aligned planes in a single pass.
+
+        The extent of every cell along each axis is computed once, so that
+        each plane only cuts the cells it intersects rather than the whole
+        dataset.
+
+        Parameters
+        ----------
+        planes : sequence[tuple[int, float]]
+            Axis index and location of each plane.
+
+        generate_triangles : bool, default: False
+            When ``True``, the output will be triangles. Otherwise the output
+            will be the intersection polygons.
+
+        progress_bar : bool, default: False
+            Display a progress bar to indicate progress.
+
+        Returns
+        -------
+        list[pyvista.PolyData]
+            One slice for each plane.
+
+        """
+
+        def _cut(axis, value, dataset):
+            origin = np.zeros(3)
+            origin[axis] = value
+            alg = _vtk.vtkCutter()
+            alg.SetInputDataObject(dataset)
+            alg.SetCutFunction(generate_plane(NORMALS['xyz'[axis]], origin))
+            alg.SetGenerateTriangles(generate_triangles)
+            _update_alg(alg, progress_bar, 'Slicing')
+            return _get_output(alg)
+
+        # a single plane along an axis is cut in one pass anyway, and cutting
+        # a subset of the cells of structured grids or surfaces does not
+        # merge the points of triangulated slices
+        axes = [axis for axis, _ in planes]
+        single_pass = [axes.count(axis) > 1 for axis in range(3)]
+        if (
+            pyvista.vtk_version_info < (9, 1, 0)
+            or isinstance(self, pyvista.PointSet)
+            or self.n_cells == 0
+            or (generate_triangles and not isinstance(self, pyvista.UnstructuredGrid))
+        ):
+            single_pass = [False] * 3
+
+        slices = [None] * len(planes)
+        for i, (axis, value) in enumerate(planes):
+            if not single_pass[axis]:
+                slices[i] = _cut(axis, value, self)
+        if not any(single_pass):
+            return slices
+
+        offsets, connectivity, _ = self._get_cell_arrays()
+        sizes = np.diff(offsets)
+        # cells of a single size are reduced as rows rather than segments
+        cell_size = sizes[0] if sizes.size and (sizes == sizes[0]).all() else None
+        points = self.points
+        dtype = points.dtype if isinstance(self, _vtk.vtkPointSet) else np.dtype(np.float32)
+
+        def extent(coords, start, stop):
+            # extent of the cells ``start:stop`` along ``coords``
+            coords = coords[connectivity[offsets[start] : offsets[stop]]]
+            if cell_size:
+                coords = coords.reshape(-1, cell_size)
+                lower, upper = coords[:, 0].copy(), coords[:, 0].copy()
+                for j in range(1, cell_size):
+                    np.minimum(lower, coords[:, j], out=lower)
+                    np.maximum(upper, coords[:, j], out=upper)
+                return lower, upper
+            if not coords.size:
+                return np.full(stop - start, np.inf), np.full(stop - start, -np.inf)
+            indices = np.minimum(offsets[start:stop] - offsets[start], coords.size - 1)
+            lower = np.minimum.reduceat(coords, indices)
+            upper = np.maximum.reduceat(coords, indices)
+            empty = sizes[start:stop] == 0
+            lower[empty] = np.inf
+            upper[empty] = -np.inf
+            return lower, upper
+
+        for axis in range(3):
+            if not single_pass[axis]:
+                continue
+            plane_ids = [i for i, (plane_axis, _) in enumerate(planes) if plane_axis == axis]
+            values = np.array([planes[i][1] for i in plane_ids], dtype=float)
+            order = np.argsort(values)
+            values = values[order]
+
+            coords = np.ascontiguousarray(points[:, axis])
+            chunks = _map_chunks(
+                functools.partial(extent, coords), self.n_cells, chunk_size=2**20
+            )
+            lower = np.concatenate([chunk[0] for chunk in chunks])
+            upper = np.concatenate([chunk[1] for chunk in chunks])
+
+            # group the cells by the planes between their lower and upper extent
+            first = np.searchsorted(values, lower, 'left')
+            counts = np.maximum(np.searchsorted(values, upper, 'right') - first, 0)
+            cell_ids = np.repeat(np.arange(self.n_cells, dtype=pyvista.ID_TYPE), counts)
+            plane_index = np.repeat(first - np.cumsum(counts) + counts, counts)
+            plane_index += np.arange(cell_ids.size)
+            cell_order = np.argsort(plane_index, kind='stable')
+            cell_ids = cell_ids[cell_order]
+            bounds = np.searchsorted(plane_index[cell_order], np.arange(values.size + 1))
+
+            for i, value in enumerate(values):
+                ids = cell_ids[bounds[i] : bounds[i + 1]]
+                extract = _vtk.vtkExtractCells()
+                extract.SetInputData(self)
+                extract.SetCellIds(ids, ids.size)
+                extract.Update()
+                subset = wrap(extract.GetOutputDataObject(0))
+                # the extracted points are always in double precision, while
+                # cutting keeps the precision of the points of point sets and
+                # outputs single precision points otherwise
+                if subset.points.dtype != dtype:
+                    subset.points = subset.points.astype(dtype)
+
+                slc = _cut(axis, value, subset)
+                if 'vtkOriginalCellIds' not in self.cell_data:
+                    slc.cell_data.pop('vtkOriginalCellIds', None)
+                slices[plane_ids[order[i]]] = slc
+        return slices
+
     def slice_orthogonal(
-        self, x=None, y=None, z=None, generate_triangles=False, contour=False, progress_bar=False
+        self,
+        x=None,
+        y=None,
+        z=None,
+        generate_triangles=False,
+        contour=False,
+        progress_bar=False,
+        workers=1,
+        combine=False,
     ):
         """Create three orthogonal slices through the dataset on the three cartesian planes.
 
@@ -781,9 +1007,23 @@ class DataSetFilters:
         progress_bar : bool, default: False
             Display a progress bar to indicate progress.
 
+        workers : int, default: 1
+            Number of processes used to filter the blocks of a
+            :class:`pyvista.MultiBlock` concurrently. ``-1`` uses one
+            process per CPU. This has no effect on other datasets.
+
+            .. versionadded:: 0.40.0
+
+        combine : bool, default: False
+            Return a single :class:`pyvista.PolyData` with a
+            ``'slice_index'`` cell array holding the index of the slice of
+            each cell instead of a :class:`pyvista.MultiBlock`.
+
+            .. versionadded:: 0.40.0
+
         Returns
         -------
-        pyvista.PolyData
+        pyvista.MultiBlock or pyvista.PolyData
             Sliced dataset.
 
         Examples
@@ -805,42 +1045,32 @@ class DataSetFilters:
             y = self.center[1]
         if z is None:
             z = self.center[2]
-        output = pyvista.MultiBlock()
         if isinstance(self, pyvista.MultiBlock):
-            for i in range(self.n_blocks):
-                output.append(
-                    self[i].slice_orthogonal(
-                        x=x, y=y, z=z, generate_triangles=generate_triangles, contour=contour
-                    )
-                )
-            return output
-        output.append(
-            self.slice(
-                normal='x',
-                origin=[x, y, z],
-                generate_triangles=generate_triangles,
-                progress_bar=progress_bar,
-            ),
-            'YZ',
-        )
-        output.append(
-            self.slice(
-                normal='y',
-                origin=[x, y, z],
-                generate_triangles=generate_triangles,
-                progress_bar=progress_bar,
-            ),
-            'XZ',
-        )
-        output.append(
-            self.slice(
-                normal='z',
-                origin=[x, y, z],
-                generate_triangles=generate_triangles,
-                progress_bar=progress_bar,
-            ),
-            'XY',
+            return self.map(
+                functools.partial(
+                    DataSetFilters.slice_orthogonal,
+                    x=x,
+                    y=y,
+                    z=z,
+                    generate_triangles=generate_triangles,
+                    contour=contour,
+                    combine=combine,
+                    progress_bar=progress_bar,
+                ),
+                workers=workers,
+                executor='process',
+            )
+        slices = DataSetFilters._slice_axis_planes(
+            self,
+            [(0, x), (1, y), (2, z)],
+            generate_triangles=generate_triangles,
+            progress_bar=progress_bar,
         )
+        if combine:
+            return _combine_slices(slices)
+        output = pyvista.MultiBlock()
+        for slc, name in zip(slices, ['YZ', 'XZ', 'XY']):
+            output.append(slc, name)
         return output
 
     def slice_along_axis(
@@ -853,6 +1083,8 @@ class DataSetFilters:
         bounds=None,
         center=None,
         progress_bar=False,
+        workers=1,
+        combine=False,
     ):
         """Create many slices of the input dataset along a specified axis.
 
@@ -893,9 +1125,23 @@ class DataSetFilters:
         progress_bar : bool, default: False
             Display a progress bar to indicate progress.
 
+        workers : int, default: 1
+            Number of processes used to filter the blocks of a
+            :class:`pyvista.MultiBlock` concurrently. ``-1`` uses one
+            process per CPU. This has no effect on other datasets.
+
+            .. versionadded:: 0.40.0
+
+        combine : bool, default: False
+            Return a single :class:`pyvista.PolyData` with a
+            ``'slice_index'`` cell array holding the index of the slice of
+            each cell instead of a :class:`pyvista.MultiBlock`.
+
+            .. versionadded:: 0.40.0
+
         Returns
         -------
-        pyvista.PolyData
+        pyvista.MultiBlock or pyvista.PolyData
             Sliced dataset.
 
         Examples
@@ -941,31 +1187,36 @@ class DataSetFilters:
         rng = np.linspace(bounds[ax_index * 2] + tolerance, bounds[ax_index * 2 + 1] - tolerance, n)
         center = list(center)
         # Make each of the slices
-        output = pyvista.MultiBlock()
         if isinstance(self, pyvista.MultiBlock):
-            for i in range(self.n_blocks):
-                output.append(
-                    self[i].slice_along_axis(
-                        n=n,
-                        axis=ax_label,
-                        tolerance=tolerance,
-                        generate_triangles=generate_triangles,
-                        contour=contour,
-                        bounds=bounds,
-                        center=center,
-                    )
-                )
-            return output
-        for i in range(n):
-            center[ax_index] = rng[i]
-            slc = DataSetFilters.slice(
-                self,
-                normal=ax_label,
-                origin=center,
-                generate_triangles=generate_triangles,
-                contour=contour,
-                progress_bar=progress_bar,
+            return self.map(
+                functools.partial(
+                    DataSetFilters.slice_along_axis,
+                    n=n,
+                    axis=ax_label,
+                    tolerance=tolerance,
+                    generate_triangles=generate_triangles,
+                    contour=contour,
+                    bounds=bounds,
+                    center=center,
+                    combine=combine,
+                    progress_bar=progress_bar,
+                ),
+                workers=workers,
+                executor='process',
             )
+        # all the slices are cut in a single pass over the cells
+        slices = DataSetFilters._slice_axis_planes(
+            self,
+            [(ax_index, value) for value in rng],
+            generate_triangles=generate_triangles,
+            progress_bar=progress_bar,
+        )
+        if contour:
+            slices = [slc.contour() for slc in slices]
+        if combine:
+            return _combine_slices(slices)
+        output = pyvista.MultiBlock()
+        for i, slc in enumerate(slices):
             output.append(slc, f'slice{i}')
         return output
 
@@ -1047,6 +1298,7 @@ class DataSetFilters:
             return output.contour()
         return output
 
+    @_cached_filter
     def threshold(
         self,
         value=None,
@@ -1059,6 +1311,7 @@ class DataSetFilters:
         component=0,
         method='upper',
         progress_bar=False,
+        workers=1,
     ):
         """Apply a ``vtkThreshold`` filter to the input dataset.
 
@@ -1142,6 +1395,16 @@ class DataSetFilters:
         progress_bar : bool, default: False
             Display a progress bar to indicate progress.
 
+        workers : int, default: 1
+            Number of processes used to filter the blocks of a
+            :class:`pyvista.MultiBlock` concurrently. ``-1`` uses one
+            process per CPU. This has no effect on other datasets.
+            When filtering a :class:`pyvista.MultiBlock` by a named array
+            without a ``value``, the range of the array over all the blocks
+            is used.
+
+            .. versionadded:: 0.40.0
+
         Returns
         -------
         pyvista.UnstructuredGrid
@@ -1195,49 +1458,45 @@ class DataSetFilters:
         See :ref:`common_filter_example` for more examples using this filter.
 
         """
-        # set the scalars to threshold on
-        if scalars is None:
-            set_default_active_scalars(self)
-            _, scalars = self.active_scalars_info
-        arr = get_array(self, scalars, preference=preference, err=False)
-        if arr is None:
-            raise ValueError('No arrays present to threshold.')
-
-        field = get_array_association(self, scalars, preference=preference)
+        if isinstance(self, pyvista.MultiBlock):
+            if value is None and scalars is not None:
+                value = self.get_data_range(scalars, allow_missing=True)
+            return self.map(
+                functools.partial(
+                    _filter_with_scalars,
+                    filter_func=DataSetFilters.threshold,
+                    output_type=pyvista.UnstructuredGrid,
+                    value=value,
+                    scalars=scalars,
+                    invert=invert,
+                    continuous=continuous,
+                    preference=preference,
+                    all_scalars=all_scalars,
+                    component_mode=component_mode,
+                    component=component,
+                    method=method,
+                    progress_bar=progress_bar,
+                ),
+                workers=workers,
+                executor='process',
+            )
 
         # Run a standard threshold algorithm
         alg = _vtk.vtkThreshold()
-        alg.SetAllScalars(all_scalars)
         alg.SetInputDataObject(self)
-        alg.SetInputArrayToProcess(
-            0, 0, 0, field.value, scalars
-        )  # args: (idx, port, connection, field, name)
-        # set thresholding parameters
-        alg.SetUseContinuousCellRange(continuous)
-        # use valid range if no value given
-        if value is None:
-            value = self.get_data_range(scalars)
-
-        _set_threshold_limit(alg, value, method, invert)
-
-        if component_mode == "component":
-            alg.SetComponentModeToUseSelected()
-            dim = arr.shape[1]
-            if not isinstance(component, (int, np.integer)):
-                raise TypeError("component must be int")
-            if component > (dim - 1) or component < 0:
-                raise ValueError(
-                    f"scalars has {dim} components: supplied component {component} not in range"
-                )
-            alg.SetSelectedComponent(component)
-        elif component_mode == "all":
-            alg.SetComponentModeToUseAll()
-        elif component_mode == "any":
-            alg.SetComponentModeToUseAny()
-        else:
-            raise ValueError(
-                f"component_mode must be 'component', 'all', or 'any' got: {component_mode}"
-            )
+        _set_threshold_parameters(
+            alg,
+            self,
+            value=value,
+            scalars=scalars,
+            invert=invert,
+            continuous=continuous,
+            preference=preference,
+            all_scalars=all_scalars,
+            component_mode=component_mode,
+            component=component,
+            method=method,
+        )
 
         # Run the threshold
         _update_alg(alg, progress_bar, 'Thresholding')
@@ -1446,6 +1705,7 @@ class DataSetFilters:
         _update_alg(alg, progress_bar, 'Producing an Outline of the Corners')
         return wrap(alg.GetOutputDataObject(0))
 
+    @_cached_filter
     def extract_geometry(self, extent: Optional[Sequence[float]] = None, progress_bar=False):
         """Extract the outer surface of a volume or structured grid dataset.
 
@@ -1671,6 +1931,7 @@ class DataSetFilters:
             output.point_data.active_scalars_name = self.point_data.active_scalars_name
         return output
 
+    @_cached_filter
     def contour(
         self,
         isosurfaces=10,
@@ -1682,6 +1943,7 @@ class DataSetFilters:
         preference='point',
         method='contour',
         progress_bar=False,
+        workers=1,
     ):
         """Contour an input self by an array.
 
@@ -1727,6 +1989,16 @@ class DataSetFilters:
         progress_bar : bool, default: False
             Display a progress bar to indicate progress.
 
+        workers : int, default: 1
+            Number of processes used to filter the blocks of a
+            :class:`pyvista.MultiBlock` concurrently. ``-1`` uses one
+            process per CPU. This has no effect on other datasets.
+            When contouring a :class:`pyvista.MultiBlock` by a named array
+            without a ``rng``, the range of the array over all the blocks
+            is used.
+
+            .. versionadded:: 0.40.0
+
         Returns
         -------
         pyvista.PolyData
@@ -1796,14 +2068,31 @@ class DataSetFilters:
         else:
             raise ValueError(f"Method '{method}' is not supported")
 
-        if rng is not None:
-            if not isinstance(rng, (np.ndarray, collections.abc.Sequence)):
-                raise TypeError(f'Array-like rng expected, got {type(rng).__name__}.')
-            rng_shape = np.shape(rng)
-            if rng_shape != (2,):
-                raise ValueError(f'rng must be a two-length array-like, not {rng}.')
-            if rng[0] > rng[1]:
-                raise ValueError(f'rng must be a sorted min-max pair, not {rng}.')
+        _check_contour_range(rng)
+
+        if isinstance(self, pyvista.MultiBlock):
+            if scalars is not None and not isinstance(scalars, str):
+                raise TypeError('`scalars` must be the name of an array to contour a MultiBlock.')
+            if isinstance(isosurfaces, int) and rng is None and scalars is not None:
+                rng = self.get_data_range(scalars, allow_missing=True)
+            return self.map(
+                functools.partial(
+                    _filter_with_scalars,
+                    filter_func=DataSetFilters.contour,
+                    output_type=pyvista.PolyData,
+                    isosurfaces=isosurfaces,
+                    scalars=scalars,
+                    compute_normals=compute_normals,
+                    compute_gradients=compute_gradients,
+                    compute_scalars=compute_scalars,
+                    rng=rng,
+                    preference=preference,
+                    method=method,
+                    progress_bar=progress_bar,
+                ),
+                workers=workers,
+                executor='process',
+            )
 
         if isinstance(scalars, str):
             scalars_name = scalars
@@ -1816,42 +2105,18 @@ class DataSetFilters:
                 'a numpy.ndarray, a string, or None.'
             )
 
-        # Make sure the input has scalars to contour on
-        if self.n_arrays < 1:
-            raise ValueError('Input dataset for the contour filter must have scalar.')
-
         alg.SetInputDataObject(self)
-        alg.SetComputeNormals(compute_normals)
-        alg.SetComputeGradients(compute_gradients)
-        alg.SetComputeScalars(compute_scalars)
-        # set the array to contour on
-        if scalars is None:
-            set_default_active_scalars(self)
-            field, scalars_name = self.active_scalars_info
-        else:
-            field = get_array_association(self, scalars_name, preference=preference)
-        # NOTE: only point data is allowed? well cells works but seems buggy?
-        if field != FieldAssociation.POINT:
-            raise TypeError('Contour filter only works on point data.')
-        alg.SetInputArrayToProcess(
-            0,
-            0,
-            0,
-            field.value,
-            scalars_name,
-        )  # args: (idx, port, connection, field, name)
-        # set the isosurfaces
-        if isinstance(isosurfaces, int):
-            # generate values
-            if rng is None:
-                rng = self.get_data_range(scalars_name)
-            alg.GenerateValues(isosurfaces, rng)
-        elif isinstance(isosurfaces, (np.ndarray, collections.abc.Sequence)):
-            alg.SetNumberOfContours(len(isosurfaces))
-            for i, val in enumerate(isosurfaces):
-                alg.SetValue(i, val)
-        else:
-            raise TypeError('isosurfaces not understood.')
+        scalars_name = _set_contour_parameters(
+            alg,
+            self,
+            isosurfaces=isosurfaces,
+            scalars=None if scalars is None else scalars_name,
+            compute_normals=compute_normals,
+            compute_gradients=compute_gradients,
+            compute_scalars=compute_scalars,
+            rng=rng,
+            preference=preference,
+        )
         _update_alg(alg, progress_bar, 'Computing Contour')
         output = _get_output(alg)
 
@@ -2070,6 +2335,7 @@ class DataSetFilters:
         _update_alg(alg, progress_bar, 'Computing Cell Sizes')
         return _get_output(alg)
 
+    @_cached_filter
     def cell_centers(self, vertex=True, progress_bar=False):
         """Generate points at the center of the cells in this dataset.
 
@@ -2823,6 +3089,7 @@ class DataSetFilters:
             self, pass_point_data=pass_point_data, progress_bar=progress_bar, **kwargs
         )
 
+    @_cached_filter
     def triangulate(self, inplace=False, progress_bar=False):
         """Return an all triangle mesh.
 
@@ -3949,6 +4216,8 @@ class DataSetFilters:
         distance = sampled['Distance']
 
         # Remainder is plotting
+        import matplotlib.pyplot as plt
+
         if figure:
             plt.figure(figsize=figsize)
         # Plot it in 2D
@@ -4280,6 +4549,8 @@ class DataSetFilters:
         distance = sampled['Distance']
 
         # create the matplotlib figure
+        import matplotlib.pyplot as plt
+
         if figure:
             plt.figure(figsize=figsize)
         # Plot it in 2D
@@ -4406,6 +4677,8 @@ class DataSetFilters:
         distance = sampled['Distance']
 
         # create the matplotlib figure
+        import matplotlib.pyplot as plt
+
         if figure:
             plt.figure(figsize=figsize)
         # Plot it in 2D
@@ -4434,8 +4707,10 @@ class DataSetFilters:
 
         Parameters
         ----------
-        ind : sequence[int]
-            Numpy array of cell indices to be extracted.
+        ind : sequence[int] | sequence[bool]
+            Numpy array of cell indices to be extracted. The array can
+            also be a boolean array of the same size as the number of
+            cells.
 
         invert : bool, default: False
             Invert the selection.
@@ -4464,9 +4739,10 @@ class DataSetFilters:
         >>> pl.show()
 
         """
-        if invert:
-            _, ind = numpy_to_idarr(ind, return_ind=True)
-            ind = [i for i in range(self.n_cells) if i not in ind]
+        ind = np.asarray(ind)
+        if invert or ind.dtype == np.bool_:
+            mask = _selection_mask(ind, self.n_cells, 'cells')
+            ind = np.flatnonzero(~mask if invert else mask)
 
         # Create selection objects
         selectionNode = _vtk.vtkSelectionNode()
@@ -4497,8 +4773,10 @@ class DataSetFilters:
 
         Parameters
         ----------
-        ind : sequence[int]
-            Sequence of point indices to be extracted.
+        ind : sequence[int] | sequence[bool]
+            Sequence of point indices to be extracted. The array can
+            also be a boolean array of the same size as the number of
+            points.
 
         adjacent_cells : bool, default: True
             If ``True``, extract the cells that contain at least one of
@@ -4533,13 +4811,14 @@ class DataSetFilters:
         selectionNode.SetContentType(_vtk.vtkSelectionNode.INDICES)
         if not include_cells:
             adjacent_cells = True
+        ind = np.asarray(ind)
         if not adjacent_cells:
             # Build array of point indices to be removed.
-            ind_rem = np.ones(self.n_points, dtype='bool')
-            ind_rem[ind] = False
-            ind = np.arange(self.n_points)[ind_rem]
+            ind = np.flatnonzero(~_selection_mask(ind, self.n_points, 'points'))
             # Invert selection
             selectionNode.GetProperties().Set(_vtk.vtkSelectionNode.INVERSE(), 1)
+        elif ind.dtype == np.bool_:
+            ind = np.flatnonzero(_selection_mask(ind, self.n_points, 'points'))
         selectionNode.SetSelectionList(numpy_to_idarr(ind))
         if include_cells:
             selectionNode.GetProperties().Set(_vtk.vtkSelectionNode.CONTAINING_CELLS(), 1)
@@ -4554,8 +4833,14 @@ class DataSetFilters:
         _update_alg(extract_sel, progress_bar, 'Extracting Points')
         return _get_output(extract_sel)
 
+    @_cached_filter
     def extract_surface(
-        self, pass_pointid=True, pass_cellid=True, nonlinear_subdivision=1, progress_bar=False
+        self,
+        pass_pointid=True,
+        pass_cellid=True,
+        nonlinear_subdivision=1,
+        progress_bar=False,
+        workers=1,
     ):
         """Extract surface mesh of the grid.
 
@@ -4589,6 +4874,13 @@ class DataSetFilters:
         progress_bar : bool, default: False
             Display a progress bar to indicate progress.
 
+        workers : int, default: 1
+            Number of processes used to filter the blocks of a
+            :class:`pyvista.MultiBlock` concurrently. ``-1`` uses one
+            process per CPU. This has no effect on other datasets.
+
+            .. versionadded:: 0.40.0
+
         Returns
         -------
         pyvista.PolyData
@@ -4608,6 +4900,18 @@ class DataSetFilters:
         See the :ref:`extract_surface_example` for more examples using this filter.
 
         """
+        if isinstance(self, pyvista.MultiBlock):
+            return self.map(
+                functools.partial(
+                    DataSetFilters.extract_surface,
+                    pass_pointid=pass_pointid,
+                    pass_cellid=pass_cellid,
+                    nonlinear_subdivision=nonlinear_subdivision,
+                    progress_bar=progress_bar,
+                ),
+                workers=workers,
+                executor='process',
+            )
         surf_filter = _vtk.vtkDataSetSurfaceFilter()
         surf_filter.SetInputData(self)
         surf_filter.SetPassThroughPointIds(pass_pointid)
@@ -4649,6 +4953,7 @@ class DataSetFilters:
         surf = DataSetFilters.extract_surface(self, pass_cellid=True, progress_bar=progress_bar)
         return surf.point_data['vtkOriginalPointIds']
 
+    @_cached_filter
     def extract_feature_edges(
         self,
         feature_angle=30.0,
@@ -5732,6 +6037,181 @@ class DataSetFilters:
         _update_alg(alg, progress_bar, 'Extracting cell types')
         return _get_output(alg)
 
+    def pipeline(self, release_data=False):
+        """Record a lazy pipeline of filters starting from this dataset.
+
+        Filters called on the returned :class:`pyvista.Pipeline` are
+        connected port to port and only run on
+        :func:`pyvista.Pipeline.execute`. Executing the pipeline again only
+        runs the filters whose parameters or input changed.
+
+        .. versionadded:: 0.40.0
+
+        Parameters
+        ----------
+        release_data : bool, default: False
+            Release the output of each filter once the next filter has
+            consumed it, reducing the peak memory of the pipeline at the
+            cost of running all the filters on every execution.
+
+        Returns
+        -------
+        pyvista.Pipeline
+            Empty pipeline with this dataset as input.
+
+        Examples
+        --------
+        Clip a mesh, extract its surface and smooth it in a single
+        execution.
+
+        >>> from pyvista import examples
+        >>> mesh = examples.load_uniform()
+        >>> smoothed = (
+        ...     mesh.pipeline()
+        ...     .clip(normal='x')
+        ...     .extract_surface()
+        ...     .smooth(n_iter=20)
+        ...     .execute()
+        ... )
+        >>> smoothed.n_cells
+        342
+
+        """
+        return pyvista.Pipeline(self, release_data=release_data)
+
+
+def _set_threshold_parameters(
+    alg,
+    dataset,
+    value,
+    scalars,
+    invert,
+    continuous,
+    preference,
+    all_scalars,
+    component_mode,
+    component,
+    method,
+):
+    """Set the array and the parameters of a vtkThreshold thresholding a dataset.
+
+    See :func:`DataSetFilters.threshold` for the description of the
+    parameters.
+
+    """
+    # set the scalars to threshold on
+    if scalars is None:
+        set_default_active_scalars(dataset)
+        _, scalars = dataset.active_scalars_info
+    arr = get_array(dataset, scalars, preference=preference, err=False)
+    if arr is None:
+        raise ValueError('No arrays present to threshold.')
+
+    field = get_array_association(dataset, scalars, preference=preference)
+
+    alg.SetAllScalars(all_scalars)
+    alg.SetInputArrayToProcess(
+        0, 0, 0, field.value, scalars
+    )  # args: (idx, port, connection, field, name)
+    # set thresholding parameters
+    alg.SetUseContinuousCellRange(continuous)
+    # use valid range if no value given
+    if value is None:
+        value = dataset.get_data_range(scalars)
+
+    _set_threshold_limit(alg, value, method, invert)
+
+    if component_mode == "component":
+        alg.SetComponentModeToUseSelected()
+        dim = arr.shape[1]
+        if not isinstance(component, (int, np.integer)):
+            raise TypeError("component must be int")
+        if component > (dim - 1) or component < 0:
+            raise ValueError(
+                f"scalars has {dim} components: supplied component {component} not in range"
+            )
+        alg.SetSelectedComponent(component)
+    elif component_mode == "all":
+        alg.SetComponentModeToUseAll()
+    elif component_mode == "any":
+        alg.SetComponentModeToUseAny()
+    else:
+        raise ValueError(
+            f"component_mode must be 'component', 'all', or 'any' got: {component_mode}"
+        )
+
+
+def _check_contour_range(rng):
+    """Check the range of the values of the isosurfaces of a contour."""
+    if rng is not None:
+        if not isinstance(rng, (np.ndarray, collections.abc.Sequence)):
+            raise TypeError(f'Array-like rng expected, got {type(rng).__name__}.')
+        rng_shape = np.shape(rng)
+        if rng_shape != (2,):
+            raise ValueError(f'rng must be a two-length array-like, not {rng}.')
+        if rng[0] > rng[1]:
+            raise ValueError(f'rng must be a sorted min-max pair, not {rng}.')
+
+
+def _set_contour_parameters(
+    alg,
+    dataset,
+    isosurfaces,
+    scalars,
+    compute_normals,
+    compute_gradients,
+    compute_scalars,
+    rng,
+    preference,
+):
+    """Set the array and the isosurfaces of a contour algorithm contouring a dataset.
+
+    See :func:`DataSetFilters.contour` for the description of the
+    parameters, where ``scalars`` is the name of the array or ``None``.
+
+    Returns
+    -------
+    str
+        Name of the contoured array.
+
+    """
+    # Make sure the input has scalars to contour on
+    if dataset.n_arrays < 1:
+        raise ValueError('Input dataset for the contour filter must have scalar.')
+
+    alg.SetComputeNormals(compute_normals)
+    alg.SetComputeGradients(compute_gradients)
+    alg.SetComputeScalars(compute_scalars)
+    # set the array to contour on
+    if scalars is None:
+        set_default_active_scalars(dataset)
+        field, scalars = dataset.active_scalars_info
+    else:
+        field = get_array_association(dataset, scalars, preference=preference)
+    # NOTE: only point data is allowed? well cells works but seems buggy?
+    if field != FieldAssociation.POINT:
+        raise TypeError('Contour filter only works on point data.')
+    alg.SetInputArrayToProcess(
+        0,
+        0,
+        0,
+        field.value,
+        scalars,
+    )  # args: (idx, port, connection, field, name)
+    # set the isosurfaces
+    if isinstance(isosurfaces, int):
+        # generate values
+        if rng is None:
+            rng = dataset.get_data_range(scalars)
+        alg.GenerateValues(isosurfaces, rng)
+    elif isinstance(isosurfaces, (np.ndarray, collections.abc.Sequence)):
+        alg.SetNumberOfContours(len(isosurfaces))
+        for i, val in enumerate(isosurfaces):
+            alg.SetValue(i, val)
+    else:
+        raise TypeError('isosurfaces not understood.')
+    return scalars
+
 
 def _set_threshold_limit(alg, value, method, invert):
     """Set vtkThreshold limits and function.
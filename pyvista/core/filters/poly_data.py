@@ -23,9 +23,12 @@ from pyvista.core.utilities.arrays import (
     set_default_active_scalars,
     vtk_id_list_to_array,
 )
+from pyvista.core.utilities.cells import _selection_mask
+from pyvista.core.utilities.filter_cache import _cached_filter
 from pyvista.core.utilities.geometric_objects import NORMALS
 from pyvista.core.utilities.helpers import generate_plane, wrap
 from pyvista.core.utilities.misc import abstract_class, assert_empty_kwargs
+from pyvista.core.utilities.ray_tracing import _RayBVH, _triangle_soup
 
 
 @abstract_class
@@ -737,6 +740,7 @@ class PolyDataFilters(DataSetFilters):
         kwargs.setdefault('scalar_bar_args', {'title': f'{curv_type.capitalize()} Curvature'})
         return self.plot(scalars=self.curvature(curv_type), **kwargs)
 
+    @_cached_filter
     def triangulate(self, inplace=False, progress_bar=False):
         """Return an all triangle mesh.
 
@@ -1426,6 +1430,7 @@ class PolyDataFilters(DataSetFilters):
 
         return submesh
 
+    @_cached_filter
     def decimate(
         self,
         target_reduction,
@@ -1564,6 +1569,7 @@ class PolyDataFilters(DataSetFilters):
 
         return mesh
 
+    @_cached_filter
     def compute_normals(
         self,
         cell_normals=True,
@@ -1864,6 +1870,7 @@ class PolyDataFilters(DataSetFilters):
             return self
         return mesh
 
+    @_cached_filter
     def clean(
         self,
         point_merging=True,
@@ -2115,12 +2122,31 @@ class PolyDataFilters(DataSetFilters):
         del sizes
         return distance
 
+    def _get_ray_bvh(self):
+        """Return the cached bounding volume hierarchy used to trace rays."""
+        state = self._get_mesh_state()
+        if 'ray_bvh' in self._locators:
+            bvh, build_state = self._locators['ray_bvh']
+            if build_state == state:
+                return bvh
+
+        bvh = _RayBVH(*_triangle_soup(self))
+        self._locators['ray_bvh'] = (bvh, state)
+        return bvh
+
     def ray_trace(self, origin, end_point, first_point=False, plot=False, off_screen=None):
         """Perform a single ray trace calculation.
 
         This requires a mesh and a line segment defined by an origin
         and end_point.
 
+        .. versionchanged:: 0.40.0
+            The segment is intersected with the triangles of the polygons
+            and strips of the mesh using the same cached bounding volume
+            hierarchy as :func:`PolyDataFilters.multi_ray_trace`. Vertices
+            and lines are no longer intersected. The intersection points
+            are still returned in single precision.
+
         Parameters
         ----------
         origin : sequence[float]
@@ -2141,8 +2167,8 @@ class PolyDataFilters(DataSetFilters):
         Returns
         -------
         intersection_points : numpy.ndarray
-            Location of the intersection points.  Empty array if no
-            intersections.
+            Location of the intersection points, sorted by increasing
+            distance to ``origin``.  Empty array if no intersections.
 
         intersection_cells : numpy.ndarray
             Indices of the intersection cells.  Empty array if no
@@ -2169,28 +2195,20 @@ class PolyDataFilters(DataSetFilters):
         See :ref:`ray_trace_example` for more examples using this filter.
 
         """
-        points = _vtk.vtkPoints()
-        cell_ids = _vtk.vtkIdList()
-        self.obbTree.IntersectWithLine(np.array(origin), np.array(end_point), points, cell_ids)
-
-        intersection_points = _vtk.vtk_to_numpy(points.GetData())
+        origin = np.asarray(origin, dtype=float).reshape(1, 3)
+        direction = np.asarray(end_point, dtype=float).reshape(1, 3) - origin
+        t, _, intersection_cells = self._get_ray_bvh().intersect(
+            origin, direction, t_max=1.0, first_hit=first_point
+        )
+        # single precision like the points of vtkOBBTree.IntersectWithLine
+        intersection_points = (origin + t[:, np.newaxis] * direction).astype(np.float32)
         if first_point and intersection_points.shape[0] >= 1:
             intersection_points = intersection_points[0]
 
-        intersection_cells = []
-        if intersection_points.any():
-            if first_point:
-                ncells = 1
-            else:
-                ncells = cell_ids.GetNumberOfIds()
-            for i in range(ncells):
-                intersection_cells.append(cell_ids.GetId(i))
-        intersection_cells = np.array(intersection_cells)
-
         if plot:
             plotter = pyvista.Plotter(off_screen=off_screen)
             plotter.add_mesh(self, label='Test Mesh')
-            segment = np.array([origin, end_point])
+            segment = np.array([origin[0], end_point])
             plotter.add_lines(segment, 'b', label='Ray Segment')
             plotter.add_mesh(intersection_points, 'r', point_size=10, label='Intersection Points')
             plotter.add_legend()
@@ -2199,21 +2217,21 @@ class PolyDataFilters(DataSetFilters):
 
         return intersection_points, intersection_cells
 
-    def multi_ray_trace(
-        self, origins, directions, first_point=False, retry=False
-    ):  # pragma: no cover
+    def multi_ray_trace(self, origins, directions, first_point=False, retry=False, workers=1):
         """Perform multiple ray trace calculations.
 
         This requires a mesh with only triangular faces, an array of
         origin points and an equal sized array of direction vectors to
         trace along.
 
-        The embree library used for vectorization of the ray traces is
-        known to occasionally return no intersections where the VTK
-        implementation would return an intersection.  If the result
-        appears to be missing some intersection points, set
-        ``retry=True`` to run a second pass over rays that returned no
-        intersections, using :func:`PolyDataFilters.ray_trace`.
+        The rays are traced with array operations over a bounding volume
+        hierarchy of the triangles, which is cached until the points or
+        the faces of the mesh are modified. Rays are traced in chunks,
+        optionally in parallel threads.
+
+        .. versionchanged:: 0.40.0
+            The rays are traced without the optional ``trimesh``,
+            ``rtree`` and ``pyembree`` dependencies.
 
         Parameters
         ----------
@@ -2227,8 +2245,17 @@ class PolyDataFilters(DataSetFilters):
             Returns intersection of first point only.
 
         retry : bool, default: False
-            Will retry rays that return no intersections using
-            :func:`PolyDataFilters.ray_trace`.
+            Has no effect.
+
+            .. deprecated:: 0.40.0
+                Rays are no longer traced with ``pyembree``, which missed
+                some intersections.
+
+        workers : int, default: 1
+            Number of threads used to trace the rays. ``-1`` uses one
+            thread per CPU.
+
+            .. versionadded:: 0.40.0
 
         Returns
         -------
@@ -2244,83 +2271,46 @@ class PolyDataFilters(DataSetFilters):
             Indices of the intersection cells.  Empty array if no
             intersections.
 
+        Intersections are sorted by ray, then by increasing distance to
+        the origin of the ray.
+
         Examples
         --------
         Compute the intersection between rays from the origin in
         directions ``[1, 0, 0]``, ``[0, 1, 0]`` and ``[0, 0, 1]``, and
         a sphere with radius 0.5 centered at the origin
 
-        >>> import pyvista as pv  # doctest:+SKIP
-        >>> sphere = pv.Sphere()  # doctest:+SKIP
+        >>> import pyvista as pv
+        >>> sphere = pv.Sphere()
         >>> points, rays, cells = sphere.multi_ray_trace(
         ...     [[0, 0, 0]] * 3,
         ...     [[1, 0, 0], [0, 1, 0], [0, 0, 1]],
         ...     first_point=True,
-        ... )  # doctest:+SKIP
+        ... )
         >>> string = ", ".join(
         ...     [
         ...         f"({point[0]:.3f}, {point[1]:.3f}, {point[2]:.3f})"
         ...         for point in points
         ...     ]
-        ... )  # doctest:+SKIP
-        >>> f'Rays intersected at {string}'  # doctest:+SKIP
+        ... )
+        >>> f'Rays intersected at {string}'
         'Rays intersected at (0.499, 0.000, 0.000), (0.000, 0.497, 0.000), (0.000, 0.000, 0.500)'
 
         """
         if not self.is_all_triangles:
             raise NotAllTrianglesError("Input mesh for multi_ray_trace must be all triangles.")
-
-        try:
-            import pyembree  # noqa
-            import rtree  # noqa
-            import trimesh  # noqa
-        except ImportError:
-            raise ImportError(
-                "To use multi_ray_trace please install trimesh, rtree and pyembree with:\n"
-                "\tconda install trimesh rtree pyembree"
-            )
-
-        origins = np.asarray(origins)
-        directions = np.asarray(directions)
-        faces_as_array = self.faces.reshape((self.n_faces, 4))[:, 1:]
-        tmesh = trimesh.Trimesh(self.points, faces_as_array)
-        locations, index_ray, index_tri = tmesh.ray.intersects_location(
-            origins, directions, multiple_hits=not first_point
-        )
         if retry:
-            # gather intersecting rays in lists
-            loc_lst = locations.tolist()
-            ray_lst = index_ray.tolist()
-            tri_lst = index_tri.tolist()
-
-            # find indices that trimesh failed on
-            all_ray_indices = np.arange(len(origins))
-            retry_ray_indices = np.setdiff1d(all_ray_indices, index_ray, assume_unique=True)
-
-            # compute ray points for all failed rays at once
-            origins_retry = origins[retry_ray_indices, :]  # shape (n_retry, 3)
-            directions_retry = directions[retry_ray_indices, :]
-            unit_directions = directions_retry / np.linalg.norm(
-                directions_retry, axis=1, keepdims=True
+            warnings.warn(
+                '`retry` is deprecated and has no effect.',
+                PyVistaDeprecationWarning,
             )
-            second_points = origins_retry + unit_directions * self.length  # shape (n_retry, 3)
-
-            for id_r, origin, second_point in zip(retry_ray_indices, origins_retry, second_points):
-                locs, indices = self.ray_trace(origin, second_point, first_point=first_point)
-                if locs.any():
-                    if first_point:
-                        locs = locs.reshape([1, 3])
-                    ray_lst.extend([id_r] * indices.size)
-                    tri_lst.extend(indices)
-                    loc_lst.extend(locs)
-
-            # sort result arrays by ray index
-            index_ray = np.array(ray_lst)
-            sorting_inds = index_ray.argsort()
-            index_ray = index_ray[sorting_inds]
-            index_tri = np.array(tri_lst)[sorting_inds]
-            locations = np.array(loc_lst)[sorting_inds]
 
+        origins = np.asarray(origins, dtype=float)
+        directions = np.asarray(directions, dtype=float)
+        t, index_ray, index_tri = self._get_ray_bvh().intersect(
+            origins, directions, first_hit=first_point, workers=workers
+        )
+        locations = origins[index_ray] + t[:, np.newaxis] * directions[index_ray]
         return locations, index_ray, index_tri
 
     def plot_boundaries(self, edge_color="red", line_width=None, progress_bar=False, **kwargs):
@@ -2484,19 +2474,7 @@ class PolyDataFilters(DataSetFilters):
         >>> reduced_sphere.plot(show_edges=True, line_width=3)
 
         """
-        remove = np.asarray(remove)
-
-        # np.asarray will eat anything, so we have to weed out bogus inputs
-        if not issubclass(remove.dtype.type, (np.bool_, np.integer)):
-            raise TypeError('Remove must be either a mask or an integer array-like')
-
-        if remove.dtype == np.bool_:
-            if remove.size != self.n_points:
-                raise ValueError('Mask different size than n_points')
-            remove_mask = remove
-        else:
-            remove_mask = np.zeros(self.n_points, np.bool_)
-            remove_mask[remove] = True
+        remove_mask = _selection_mask(remove, self.n_points, 'points')
 
         if not self.is_all_triangles:
             raise NotAllTrianglesError
@@ -2508,17 +2486,20 @@ class PolyDataFilters(DataSetFilters):
         else:
             fmask = ~(vmask).any(1)
 
-        # Regenerate face and point arrays
-        uni = np.unique(f.compress(fmask, 0), return_inverse=True)
-        new_points = self.points.take(uni[0], 0)
+        # Regenerate face and point arrays, renumbering the remaining
+        # points in linear time instead of sorting them
+        kept_faces = f.compress(fmask, 0)
+        used = np.zeros(self.n_points, np.bool_)
+        used[kept_faces] = True
+        ridx = np.flatnonzero(used)
+        new_ids = np.cumsum(used, dtype=pyvista.ID_TYPE) - 1
+        new_points = self.points.take(ridx, 0)
 
-        nfaces = fmask.sum()
-        faces = np.empty((nfaces, 4), dtype=pyvista.ID_TYPE)
+        faces = np.empty((kept_faces.shape[0], 4), dtype=pyvista.ID_TYPE)
         faces[:, 0] = 3
-        faces[:, 1:] = np.reshape(uni[1], (nfaces, 3))
+        faces[:, 1:] = new_ids[kept_faces]
 
         newmesh = pyvista.PolyData(new_points, faces, deep=True)
-        ridx = uni[0]
 
         # Add scalars back to mesh if requested
         if keep_scalars:
@@ -3386,6 +3367,11 @@ class PolyDataFilters(DataSetFilters):
         int
             Number of collisions.
 
+        See Also
+        --------
+        pyvista.collide_all
+            Detect the collisions between many meshes.
+
         Notes
         -----
         Due to the nature of the `vtk.vtkCollisionDetectionFilter
@@ -122,7 +122,7 @@ class RectilinearGrid(_vtk.vtkRectilinearGrid, Grid, RectilinearGridFilters):
 
     """
 
-    _WRITERS = {'.vtk': _vtk.vtkRectilinearGridWriter, '.vtr': _vtk.vtkXMLRectilinearGridWriter}
+    _WRITERS = {'.vtk': 'vtkRectilinearGridWriter', '.vtr': 'vtkXMLRectilinearGridWriter'}
 
     def __init__(self, *args, check_duplicates=False, deep=False, **kwargs):
         """Initialize the rectilinear grid."""
@@ -482,7 +482,7 @@ class ImageData(_vtk.vtkImageData, Grid, ImageDataFilters):
 
     """
 
-    _WRITERS = {'.vtk': _vtk.vtkDataSetWriter, '.vti': _vtk.vtkXMLImageDataWriter}
+    _WRITERS = {'.vtk': 'vtkDataSetWriter', '.vti': 'vtkXMLImageDataWriter'}
 
     def __init__(
         self,
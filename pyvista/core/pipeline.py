@@ -0,0 +1,497 @@
+"""Lazy pipelines of filters connected port to port."""
+import inspect
+from typing import Any, Dict, List, Optional, Tuple
+
+import pyvista
+from pyvista.core import _vtk_core as _vtk
+from pyvista.core.errors import PyVistaPipelineError
+
+from .filters import (
+    CompositeFilters,
+    DataSetFilters,
+    ImageDataFilters,
+    PolyDataFilters,
+    RectilinearGridFilters,
+    StructuredGridFilters,
+    UnstructuredGridFilters,
+    _update_alg,
+)
+from .filters.data_set import (
+    _check_contour_range,
+    _set_contour_parameters,
+    _set_threshold_parameters,
+)
+from .utilities.filter_cache import _normalize, _Uncacheable
+from .utilities.geometric_objects import NORMALS
+from .utilities.helpers import generate_plane, wrap
+
+_FILTER_CLASSES = (
+    DataSetFilters,
+    PolyDataFilters,
+    UnstructuredGridFilters,
+    ImageDataFilters,
+    RectilinearGridFilters,
+    StructuredGridFilters,
+    CompositeFilters,
+)
+
+
+def _keyword_arguments(name: str, args: Tuple, kwargs: Dict[str, Any]):
+    """Convert the positional arguments of a filter to keyword arguments.
+
+    The arguments are only converted when all the filter classes defining
+    the filter agree on the names of its positional parameters.
+    """
+    if not args:
+        return args, kwargs
+    names = set()
+    for cls in _FILTER_CLASSES:
+        func = getattr(cls, name, None)
+        if callable(func):
+            parameters = list(inspect.signature(func).parameters.values())[1 : len(args) + 1]
+            if any(param.kind != param.POSITIONAL_OR_KEYWORD for param in parameters):
+                return args, kwargs
+            names.add(tuple(param.name for param in parameters))
+    if len(names) != 1:
+        return args, kwargs
+    (names,) = names
+    if len(names) < len(args) or set(names) & kwargs.keys():
+        return args, kwargs
+    return (), {**dict(zip(names, args)), **kwargs}
+
+
+def _filter_parameters(name: str, input_type, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return all the parameters of a filter, including their default values.
+
+    Returns ``None`` when the filter does not accept these arguments, in
+    which case the filter is left to raise the error on execution.
+    """
+    try:
+        bound = inspect.signature(getattr(input_type, name)).bind(None, **kwargs)
+    except TypeError:
+        return None
+    bound.apply_defaults()
+    params = dict(bound.arguments)
+    del params[next(iter(params))]
+    return params
+
+
+# The following filters run as a single VTK algorithm connected port to port
+# with the neighboring filters. The algorithm of each filter is created when
+# the filter is recorded, from the type of its input, and it is configured
+# with its input right before it executes, which resolves the parameters
+# depending on the input such as the default origin of a plane or the range
+# of an array. Each function creating an algorithm returns ``None`` for the
+# arguments which are not supported by the algorithm alone.
+
+
+def _clip_algorithm(input_type, params):
+    if params['return_clipped'] or params['crinkle'] or params['inplace']:
+        return None
+    if issubclass(input_type, _vtk.vtkPolyData):
+        return _vtk.vtkClipPolyData(), pyvista.PolyData
+    return _vtk.vtkTableBasedClipDataSet(), pyvista.UnstructuredGrid
+
+
+def _configure_clip(alg, dataset, params):
+    normal = params['normal']
+    if isinstance(normal, str):
+        normal = NORMALS[normal.lower()]
+    origin = dataset.center if params['origin'] is None else params['origin']
+    alg.SetClipFunction(generate_plane(normal, origin))
+    alg.SetValue(params['value'])
+    alg.SetInsideOut(params['invert'])
+
+
+def _slice_algorithm(input_type, params):
+    if params['contour']:
+        return None
+    return _vtk.vtkCutter(), pyvista.PolyData
+
+
+def _configure_slice(alg, dataset, params):
+    normal = params['normal']
+    if isinstance(normal, str):
+        normal = NORMALS[normal.lower()]
+    origin = dataset.center if params['origin'] is None else params['origin']
+    alg.SetCutFunction(generate_plane(normal, origin))
+    alg.SetGenerateTriangles(params['generate_triangles'])
+
+
+def _threshold_algorithm(input_type, params):
+    return _vtk.vtkThreshold(), pyvista.UnstructuredGrid
+
+
+def _configure_threshold(alg, dataset, params):
+    del params['progress_bar'], params['workers']
+    _set_threshold_parameters(alg, dataset, **params)
+
+
+def _contour_algorithm(input_type, params):
+    # the other methods may not name the contoured array, which the filter
+    # then renames on its output
+    if params['method'] not in (None, 'contour'):
+        return None
+    if params['scalars'] is not None and not isinstance(params['scalars'], str):
+        return None
+    return _vtk.vtkContourFilter(), pyvista.PolyData
+
+
+def _configure_contour(alg, dataset, params):
+    _check_contour_range(params['rng'])
+    del params['progress_bar'], params['workers'], params['method']
+    _set_contour_parameters(alg, dataset, **params)
+
+
+def _extract_surface_algorithm(input_type, params):
+    return _vtk.vtkDataSetSurfaceFilter(), pyvista.PolyData
+
+
+def _configure_extract_surface(alg, dataset, params):
+    alg.SetPassThroughPointIds(params['pass_pointid'])
+    alg.SetPassThroughCellIds(params['pass_cellid'])
+    if params['nonlinear_subdivision'] != 1:
+        alg.SetNonlinearSubdivisionLevel(params['nonlinear_subdivision'])
+
+
+def _smooth_algorithm(input_type, params):
+    if not issubclass(input_type, pyvista.PolyData) or params['inplace']:
+        return None
+    return _vtk.vtkSmoothPolyDataFilter(), pyvista.PolyData
+
+
+def _configure_smooth(alg, dataset, params):
+    alg.SetNumberOfIterations(params['n_iter'])
+    alg.SetConvergence(params['convergence'])
+    alg.SetFeatureEdgeSmoothing(params['feature_smoothing'])
+    alg.SetFeatureAngle(params['feature_angle'])
+    alg.SetEdgeAngle(params['edge_angle'])
+    alg.SetBoundarySmoothing(params['boundary_smoothing'])
+    alg.SetRelaxationFactor(params['relaxation_factor'])
+
+
+_NATIVE_FILTERS = {
+    'clip': (_clip_algorithm, _configure_clip),
+    'contour': (_contour_algorithm, _configure_contour),
+    'extract_surface': (_extract_surface_algorithm, _configure_extract_surface),
+    'slice': (_slice_algorithm, _configure_slice),
+    'smooth': (_smooth_algorithm, _configure_smooth),
+    'threshold': (_threshold_algorithm, _configure_threshold),
+}
+
+
+def _native_algorithm(name: str, args: Tuple, kwargs: Dict[str, Any], input_type):
+    """Return the VTK algorithm of a filter and the type of its output.
+
+    Returns ``None`` when the filter cannot run as a single algorithm
+    connected port to port, for instance when its input type is unknown.
+    """
+    if (
+        name not in _NATIVE_FILTERS
+        or args
+        or input_type is None
+        or not issubclass(input_type, pyvista.DataSet)
+        or issubclass(input_type, pyvista.PointSet)
+    ):
+        return None
+    params = _filter_parameters(name, input_type, kwargs)
+    if params is None:
+        return None
+    return _NATIVE_FILTERS[name][0](input_type, params)
+
+
+def _configure_native(alg, event):
+    """Configure a VTK algorithm with its input right before it executes."""
+    alg.error = None
+    if alg.upstream is not None and alg.upstream.error is not None:
+        return
+    # exceptions raised by observers are not propagated by VTK, so they are
+    # reported by ``Pipeline.execute``
+    try:
+        dataset = wrap(alg.GetInputDataObject(0, 0))
+        params = _filter_parameters(alg.name, alg.input_type, alg.kwargs)
+        _NATIVE_FILTERS[alg.name][1](alg, dataset, params)
+    except Exception as e:
+        alg.error = e
+
+
+class _FilterAlgorithm(_vtk.VTKPythonAlgorithmBase):
+    """Algorithm applying a filter method to its input.
+
+    The type of the output is only known once the filter has run, so the
+    output data object is created during ``RequestData``.
+    """
+
+    def __init__(self, name: str, args: Tuple, kwargs: Dict[str, Any], upstream=None):
+        """Initialize algorithm."""
+        super().__init__(
+            nInputPorts=1, nOutputPorts=1, inputType='vtkDataObject', outputType='vtkDataObject'
+        )
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+        self.upstream = upstream
+        self.error: Optional[Exception] = None
+        self.input_type = None
+        self.output_type = None
+
+    def RequestDataObject(self, request, inInfo, outInfo):
+        """Defer the creation of the output to ``RequestData``."""
+        return 1
+
+    def RequestData(self, request, inInfo, outInfo):
+        """Perform algorithm execution."""
+        self.error = None
+        output = None
+        # failures are reported by ``Pipeline.execute`` rather than by VTK,
+        # and the following filters are skipped
+        if self.upstream is None or self.upstream.error is None:
+            try:
+                inp = wrap(self.GetInputData(inInfo, 0, 0))
+                output = getattr(inp, self.name)(*self.args, **self.kwargs)
+                if not isinstance(output, _vtk.vtkDataObject):
+                    raise PyVistaPipelineError(
+                        f'Filter `{self.name}` returned {type(output).__name__} '
+                        'instead of a dataset.'
+                    )
+            except Exception as e:
+                self.error = e
+                output = None
+
+        info = outInfo.GetInformationObject(0)
+        out = info.Get(_vtk.vtkDataObject.DATA_OBJECT())
+        if output is None:
+            if out is None:
+                info.Set(_vtk.vtkDataObject.DATA_OBJECT(), _vtk.vtkPolyData())
+            return 1
+        if out is None or out.GetClassName() != output.GetClassName():
+            out = type(output)()
+            info.Set(_vtk.vtkDataObject.DATA_OBJECT(), out)
+        out.ShallowCopy(output)
+        return 1
+
+
+class Pipeline:
+    """Lazy pipeline of filters.
+
+    Filters called on a pipeline are recorded rather than executed. Each
+    filter becomes a VTK algorithm connected to the output port of the
+    previous one, and nothing runs until :func:`Pipeline.execute`. The
+    VTK executive then only runs the filters whose parameters or inputs
+    changed since the previous execution.
+
+    The ``clip``, ``contour``, ``extract_surface``, ``slice``, ``smooth``
+    and ``threshold`` filters of a dataset run as their own VTK algorithm,
+    so that their outputs are neither wrapped nor copied, and are only
+    handed over to the next algorithm. This requires the type of their
+    input to be known when they are recorded, and a few of their options,
+    such as ``return_clipped``, are not supported this way.
+
+    Any other filter of :class:`pyvista.DataSetFilters`,
+    :class:`pyvista.PolyDataFilters` or of the filter classes of the
+    other dataset types can be recorded too, provided that it returns a
+    single dataset for the output of the previous filter. These filters
+    run as they do outside of a pipeline, from an algorithm calling them.
+
+    Create a pipeline with :func:`pyvista.DataSetFilters.pipeline`.
+
+    .. versionadded:: 0.40.0
+
+    Parameters
+    ----------
+    dataset : pyvista.DataSet | pyvista.MultiBlock
+        Input of the pipeline.
+
+    release_data : bool, default: False
+        Release the output of each filter once the next filter has
+        consumed it. This reduces the peak memory of the pipeline, at the
+        cost of running all the filters again on every execution.
+
+    Examples
+    --------
+    Record a pipeline, execute it, then change the parameters of its last
+    filter. Only the last filter runs again.
+
+    >>> import pyvista as pv
+    >>> from pyvista import examples
+    >>> mesh = examples.load_uniform()
+    >>> pipeline = (
+    ...     mesh.pipeline()
+    ...     .threshold(300)
+    ...     .extract_surface()
+    ...     .smooth(n_iter=10)
+    ... )
+    >>> pipeline
+    Pipeline(ImageData -> threshold(value=300) -> extract_surface() -> smooth(n_iter=10))
+    >>> output = pipeline.execute()
+    >>> pipeline.set_parameters(-1, n_iter=50)
+    >>> output = pipeline.execute()
+
+    """
+
+    def __init__(self, dataset, release_data: bool = False):
+        """Initialize the pipeline."""
+        self._input = dataset
+        self._release_data = release_data
+        self._algorithms: List[_FilterAlgorithm] = []
+
+    def __getattr__(self, name):
+        """Return a function recording a filter."""
+        if name.startswith('_') or not any(
+            callable(getattr(cls, name, None)) for cls in _FILTER_CLASSES
+        ):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute or filter '{name}'"
+            )
+
+        def add_filter(*args, **kwargs):
+            args, kwargs = _keyword_arguments(name, args, kwargs)
+            self._algorithms.append(
+                self._create_algorithm(len(self._algorithms), name, args, kwargs)
+            )
+            return self
+
+        return add_filter
+
+    def _create_algorithm(self, index: int, name: str, args: Tuple, kwargs: Dict[str, Any]):
+        """Create the algorithm of the filter at ``index`` and connect its input."""
+        upstream = self._algorithms[index - 1] if index else None
+        input_type = upstream.output_type if upstream is not None else type(self._input)
+        native = _native_algorithm(name, args, kwargs, input_type)
+        if native is None:
+            alg = _FilterAlgorithm(name, args, kwargs, upstream)
+        else:
+            alg, alg.output_type = native
+            alg.name = name
+            alg.args = args
+            alg.kwargs = kwargs
+            alg.upstream = upstream
+            alg.error = None
+            alg.AddObserver(_vtk.vtkCommand.StartEvent, _configure_native)
+        alg.input_type = input_type
+
+        if upstream is not None:
+            alg.SetInputConnection(upstream.GetOutputPort())
+        else:
+            alg.SetInputDataObject(self._input)
+        alg.GetExecutive().SetReleaseDataFlag(0, self._release_data)
+        return alg
+
+    def _rebuild(self, start: int):
+        """Create again the algorithms of the filters from ``start``."""
+        for index in range(start, len(self._algorithms)):
+            alg = self._algorithms[index]
+            self._algorithms[index] = self._create_algorithm(index, alg.name, alg.args, alg.kwargs)
+
+    def __len__(self) -> int:
+        """Return the number of filters of the pipeline."""
+        return len(self._algorithms)
+
+    def __repr__(self) -> str:
+        """Return the representation of the pipeline."""
+        stages = [type(self._input).__name__]
+        for name, args, kwargs in self.stages:
+            params = [repr(arg) for arg in args]
+            params += [f'{key}={value!r}' for key, value in kwargs.items()]
+            stages.append(f'{name}({", ".join(params)})')
+        return f'{type(self).__name__}({" -> ".join(stages)})'
+
+    @property
+    def input(self):
+        """Return or set the input of the pipeline.
+
+        Setting a new input runs all the filters on the next execution.
+
+        Returns
+        -------
+        pyvista.DataSet | pyvista.MultiBlock
+            Input of the pipeline.
+
+        """
+        return self._input
+
+    @input.setter
+    def input(self, dataset):
+        previous_type = type(self._input)
+        self._input = dataset
+        if not self._algorithms:
+            return
+        if type(dataset) is previous_type:
+            self._algorithms[0].SetInputDataObject(dataset)
+        else:
+            # the algorithms of the filters depend on the type of the input
+            self._rebuild(0)
+
+    @property
+    def stages(self) -> List[Tuple[str, Tuple, Dict[str, Any]]]:
+        """Return the name and arguments of the filters of the pipeline.
+
+        Returns
+        -------
+        list[tuple[str, tuple, dict]]
+            Name, positional and keyword arguments of each filter.
+
+        """
+        return [(alg.name, alg.args, dict(alg.kwargs)) for alg in self._algorithms]
+
+    def set_parameters(self, index: int, **kwargs):
+        """Change the keyword arguments of a filter of the pipeline.
+
+        The filter and the following ones only run again on the next
+        execution if the arguments actually changed.
+
+        Parameters
+        ----------
+        index : int
+            Index of the filter in the pipeline.
+
+        **kwargs : dict, optional
+            Keyword arguments of the filter to change.
+
+        """
+        index = range(len(self._algorithms))[index]
+        alg = self._algorithms[index]
+        params = {**alg.kwargs, **kwargs}
+        try:
+            if _normalize(params) == _normalize(alg.kwargs):
+                return
+        except _Uncacheable:
+            pass
+
+        # some arguments change the algorithm running the filter, in which
+        # case the algorithms of the filter and the following ones are
+        # created again
+        native = _native_algorithm(alg.name, alg.args, params, alg.input_type)
+        alg.kwargs = params
+        if type(alg) is not (_FilterAlgorithm if native is None else type(native[0])):
+            self._rebuild(index)
+        else:
+            alg.Modified()
+
+    def execute(self, progress_bar: bool = False):
+        """Run the filters of the pipeline which are out of date.
+
+        Parameters
+        ----------
+        progress_bar : bool, default: False
+            Display a progress bar to indicate progress.
+
+        Returns
+        -------
+        pyvista.DataSet | pyvista.MultiBlock
+            Output of the last filter, or a shallow copy of the input for an
+            empty pipeline.
+
+        """
+        if not self._algorithms:
+            return self._input.copy(deep=False)
+
+        last = self._algorithms[-1]
+        _update_alg(last, progress_bar, 'Executing pipeline')
+        for alg in self._algorithms:
+            if alg.error is not None:
+                error, alg.error = alg.error, None
+                # run the failed filter again on the next execution
+                alg.Modified()
+                raise error
+        return wrap(last.GetOutputDataObject(0)).copy(deep=False)
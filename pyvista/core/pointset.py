@@ -23,9 +23,9 @@ from .errors import (
     VTKVersionError,
 )
 from .filters import PolyDataFilters, StructuredGridFilters, UnstructuredGridFilters, _get_output
-from .utilities.cells import create_mixed_cells, get_mixed_cells, numpy_to_idarr
+from .utilities.cells import _selection_mask, create_mixed_cells, get_mixed_cells, numpy_to_idarr
 from .utilities.fileio import get_ext
-from .utilities.misc import abstract_class
+from .utilities.misc import _map_chunks, abstract_class
 from .utilities.points import vtk_points
 
 DEFAULT_INPLACE_WARNING = (
@@ -35,6 +35,10 @@ DEFAULT_INPLACE_WARNING = (
     'operation.'
 )
 
+# number of pairs of cells compared at once when computing the geometric
+# neighbors of the cells of an explicit structured grid
+_GEOMETRIC_NEIGHBOR_PAIRS = 2**20
+
 
 class _PointSet(DataSet):
     """PyVista's equivalent of vtk.vtkPointSet.
@@ -42,7 +46,7 @@ class _PointSet(DataSet):
     This holds methods common to PolyData and UnstructuredGrid.
     """
 
-    _WRITERS = {".xyz": _vtk.vtkSimplePointsWriter}
+    _WRITERS = {'.xyz': 'vtkSimplePointsWriter'}
 
     def center_of_mass(self, scalars_weight=False):
         """Return the coordinates for the center of mass of the mesh.
@@ -115,13 +119,8 @@ class _PointSet(DataSet):
         >>> removed = hex_mesh.remove_cells(range(10, 20))
         >>> removed.plot(color='lightblue', show_edges=True, line_width=3)
         """
-        if isinstance(ind, np.ndarray):
-            if ind.dtype == np.bool_ and ind.size != self.n_cells:
-                raise ValueError(
-                    f'Boolean array size must match the number of cells ({self.n_cells})'
-                )
-        ghost_cells = np.zeros(self.n_cells, np.uint8)
-        ghost_cells[ind] = _vtk.vtkDataSetAttributes.DUPLICATECELL
+        ghost_cells = _selection_mask(ind, self.n_cells, 'cells').view(np.uint8)
+        ghost_cells = ghost_cells * np.uint8(_vtk.vtkDataSetAttributes.DUPLICATECELL)
 
         if inplace:
             target = self
@@ -435,6 +434,10 @@ class PointSet(_vtk.vtkPointSet, _PointSet):
         """Raise cell operations are not supported."""
         raise PointSetCellOperationError
 
+    def _get_cell_arrays(self):
+        """Raise cell operations are not supported."""
+        raise PointSetCellOperationError
+
 
 class PolyData(_vtk.vtkPolyData, _PointSet, PolyDataFilters):
     """Dataset consisting of surface geometry (e.g. vertices, lines, and polygons).
@@ -567,10 +570,10 @@ class PolyData(_vtk.vtkPolyData, _PointSet, PolyDataFilters):
     """
 
     _WRITERS = {
-        '.ply': _vtk.vtkPLYWriter,
-        '.vtp': _vtk.vtkXMLPolyDataWriter,
-        '.stl': _vtk.vtkSTLWriter,
-        '.vtk': _vtk.vtkPolyDataWriter,
+        '.ply': 'vtkPLYWriter',
+        '.vtp': 'vtkXMLPolyDataWriter',
+        '.stl': 'vtkSTLWriter',
+        '.vtk': 'vtkPolyDataWriter',
     }
 
     def __init__(
@@ -1359,7 +1362,7 @@ class UnstructuredGrid(_vtk.vtkUnstructuredGrid, PointGrid, UnstructuredGridFilt
 
     """
 
-    _WRITERS = {'.vtu': _vtk.vtkXMLUnstructuredGridWriter, '.vtk': _vtk.vtkUnstructuredGridWriter}
+    _WRITERS = {'.vtu': 'vtkXMLUnstructuredGridWriter', '.vtk': 'vtkUnstructuredGridWriter'}
 
     def __init__(self, *args, deep=False, **kwargs) -> None:
         """Initialize the unstructured grid."""
@@ -1966,7 +1969,7 @@ class StructuredGrid(_vtk.vtkStructuredGrid, PointGrid, StructuredGridFilters):
 
     """
 
-    _WRITERS = {'.vtk': _vtk.vtkStructuredGridWriter, '.vts': _vtk.vtkXMLStructuredGridWriter}
+    _WRITERS = {'.vtk': 'vtkStructuredGridWriter', '.vts': 'vtkXMLStructuredGridWriter'}
 
     def __init__(self, uinput=None, y=None, z=None, *args, deep=False, **kwargs) -> None:
         """Initialize the structured grid."""
@@ -2309,7 +2312,7 @@ class ExplicitStructuredGrid(_vtk.vtkExplicitStructuredGrid, PointGrid):
 
     """
 
-    _WRITERS = {'.vtu': _vtk.vtkXMLUnstructuredGridWriter, '.vtk': _vtk.vtkUnstructuredGridWriter}
+    _WRITERS = {'.vtu': 'vtkXMLUnstructuredGridWriter', '.vtk': 'vtkUnstructuredGridWriter'}
 
     def __init__(self, *args, deep=False, **kwargs):
         """Initialize the explicit structured grid."""
@@ -2367,17 +2370,27 @@ class ExplicitStructuredGrid(_vtk.vtkExplicitStructuredGrid, PointGrid):
         shape0 = np.asanyarray(dims) - 1
         shape1 = 2 * shape0
         ncells = np.prod(shape0)
-        cells = 8 * np.ones((ncells, 9), dtype=int)
-        points, indices = np.unique(corners, axis=0, return_inverse=True)
+        # merge duplicate corners, sorting them as ``np.unique(corners, axis=0)``
+        # which is much slower on large grids
+        corners = np.asarray(corners)
+        order = np.lexsort(corners.T[::-1])
+        corners = corners[order]
+        is_new = np.ones(len(corners), dtype=bool)
+        is_new[1:] = np.any(corners[1:] != corners[:-1], axis=1)
+        points = corners[is_new]
+        indices = np.empty(len(corners), dtype=pyvista.ID_TYPE)
+        indices[order] = np.cumsum(is_new) - 1
+        # each cell owns a 2x2x2 block of the corners, so its points are
+        # gathered for all cells at once by slicing the corners with a step of 2
+        indices = indices.reshape(shape1, order='F')
         connectivity = np.asarray(
             [[0, 1, 1, 0, 0, 1, 1, 0], [0, 0, 1, 1, 0, 0, 1, 1], [0, 0, 0, 0, 1, 1, 1, 1]]
         )
-        for c in range(ncells):
-            i, j, k = np.unravel_index(c, shape0, order='F')
-            coord = (2 * i + connectivity[0], 2 * j + connectivity[1], 2 * k + connectivity[2])
-            cinds = np.ravel_multi_index(coord, shape1, order='F')  # type: ignore
-            cells[c, 1:] = indices[cinds]
-        cells = cells.flatten()
+        cells = np.empty((ncells, 9), dtype=pyvista.ID_TYPE)
+        cells[:, 0] = 8
+        for c, (i, j, k) in enumerate(connectivity.T, start=1):
+            cells[:, c] = indices[i::2, j::2, k::2].ravel(order='F')
+        cells = cells.ravel()
         points = vtk_points(points)
         cells = CellArray(cells, ncells)
         self.SetDimensions(dims)
@@ -2442,7 +2455,7 @@ class ExplicitStructuredGrid(_vtk.vtkExplicitStructuredGrid, PointGrid):
         Parameters
         ----------
         filename : str
-            Output file name. VTU and VTK extensions are supported.
+            Output file name. VTU, VTK and PVNPY extensions are supported.
 
         binary : bool, default: True
             If ``True``, write as binary, else ASCII.
@@ -2451,7 +2464,8 @@ class ExplicitStructuredGrid(_vtk.vtkExplicitStructuredGrid, PointGrid):
         -----
         VTK adds the ``'BLOCK_I'``, ``'BLOCK_J'`` and ``'BLOCK_K'``
         cell arrays. These arrays are required to restore the explicit
-        structured grid.
+        structured grid. The ``'.pvnpy'`` format stores the explicit
+        structured grid as is, see :func:`pyvista.save_pvnpy`.
 
         Examples
         --------
@@ -2472,6 +2486,9 @@ class ExplicitStructuredGrid(_vtk.vtkExplicitStructuredGrid, PointGrid):
         ... )  # doctest:+SKIP
 
         """
+        if get_ext(str(filename)) == '.pvnpy':
+            pyvista.save_pvnpy(filename, self)
+            return
         grid = self.cast_to_unstructured_grid()
         grid.save(filename, binary)
 
@@ -2752,93 +2769,161 @@ class ExplicitStructuredGrid(_vtk.vtkExplicitStructuredGrid, PointGrid):
 
         """
 
-        def connectivity(ind):
-            indices = []
-            cell_coords = self.cell_coords(ind)
-            cell_points = self.get_cell(ind).points
-            if cell_points.shape[0] == 8:
-                faces = [
-                    [(-1, 0, 0), (0, 4, 7, 3), (1, 5, 6, 2)],
-                    [(+1, 0, 0), (1, 2, 6, 5), (0, 3, 7, 4)],
-                    [(0, -1, 0), (0, 1, 5, 4), (3, 2, 6, 7)],
-                    [(0, +1, 0), (3, 7, 6, 2), (0, 4, 5, 1)],
-                    [(0, 0, -1), (0, 3, 2, 1), (4, 7, 6, 5)],
-                    [(0, 0, +1), (4, 5, 6, 7), (0, 1, 2, 3)],
-                ]
-                for f in faces:
-                    coords = np.sum([cell_coords, f[0]], axis=0)
-                    ind = self.cell_id(coords)
-                    if ind:
-                        points = self.get_cell(ind).points
-                        if points.shape[0] == 8:
-                            a1 = cell_points[f[1], :]
-                            a2 = points[f[2], :]
-                            if np.array_equal(a1, a2):
-                                indices.append(ind)
-            return indices
-
-        def topological(ind):
-            indices = []
-            cell_coords = self.cell_coords(ind)
-            cell_neighbors = [(-1, 0, 0), (1, 0, 0), (0, -1, 0), (0, 1, 0), (0, 0, -1), (0, 0, 1)]
-            for n in cell_neighbors:
-                coords = np.sum([cell_coords, n], axis=0)
-                ind = self.cell_id(coords)
-                if ind:
-                    indices.append(ind)
-            return indices
-
-        def geometric(ind):
-            indices = []
-            cell_coords = self.cell_coords(ind)
-            cell_points = self.get_cell(ind).points
-            if cell_points.shape[0] == 8:
-                for k in [-1, 1]:
-                    coords = np.sum([cell_coords, (0, 0, k)], axis=0)
-                    ind = self.cell_id(coords)
-                    if ind:
-                        indices.append(ind)
-                faces = [
-                    [(-1, 0, 0), (0, 4, 3, 7), (1, 5, 2, 6)],
-                    [(+1, 0, 0), (2, 6, 1, 5), (3, 7, 0, 4)],
-                    [(0, -1, 0), (1, 5, 0, 4), (2, 6, 3, 7)],
-                    [(0, +1, 0), (3, 7, 2, 6), (0, 4, 1, 5)],
-                ]
-                nk = self.dimensions[2]
-                for f in faces:
-                    cell_z = cell_points[f[1], 2]
-                    cell_z = np.abs(cell_z)
-                    cell_z = cell_z.reshape((2, 2))
-                    cell_zmin = cell_z.min(axis=1)
-                    cell_zmax = cell_z.max(axis=1)
-                    coords = np.sum([cell_coords, f[0]], axis=0)
-                    for k in range(nk):
-                        coords[2] = k
-                        ind = self.cell_id(coords)
-                        if ind:
-                            points = self.get_cell(ind).points
-                            if points.shape[0] == 8:
-                                z = points[f[2], 2]
-                                z = np.abs(z)
-                                z = z.reshape((2, 2))
-                                zmin = z.min(axis=1)
-                                zmax = z.max(axis=1)
-                                if (
-                                    (zmax[0] > cell_zmin[0] and zmin[0] < cell_zmax[0])
-                                    or (zmax[1] > cell_zmin[1] and zmin[1] < cell_zmax[1])
-                                    or (zmin[0] > cell_zmax[0] and zmax[1] < cell_zmin[1])
-                                    or (zmin[1] > cell_zmax[1] and zmax[0] < cell_zmin[0])
-                                ):
-                                    indices.append(ind)
-            return indices
-
         if isinstance(ind, int):
             ind = [ind]
-        rel = eval(rel)
-        indices = set()
-        for i in ind:
-            indices.update(rel(i))
-        return sorted(indices)
+        ind = np.asarray(ind, dtype=int).ravel()
+        if rel in ['topological', 'connectivity']:
+            indices = self._face_neighbors(ind, connected=rel == 'connectivity')
+        elif rel == 'geometric':
+            indices = self._geometric_neighbors(ind)
+        else:
+            raise ValueError(
+                f'`rel` must be one of: {["connectivity", "topological", "geometric"]} '
+                f'(got "{rel}")'
+            )
+        return list(np.unique(indices[indices >= 0]))
+
+    def face_neighbors(self, rel='connectivity') -> np.ndarray:
+        """Return the neighbors of all cells across each of their faces.
+
+        The neighbors are computed at once for all cells with vectorized
+        operations, which is much faster than calling
+        :func:`ExplicitStructuredGrid.neighbors` on large grids.
+
+        .. versionadded:: 0.40.0
+
+        Parameters
+        ----------
+        rel : str, default: "connectivity"
+            Defines the neighborhood relationship. If
+            ``'topological'``, returns the ``(i-1, j, k)``, ``(i+1, j,
+            k)``, ``(i, j-1, k)``, ``(i, j+1, k)``, ``(i, j, k-1)``
+            and ``(i, j, k+1)`` cells. If ``'connectivity'``
+            (default), returns only the topological neighbors
+            considering faces connectivity.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array with shape ``(n_cells, 6)`` containing the ID of the
+            neighbors of each cell in the ``-X``, ``+X``, ``-Y``,
+            ``+Y``, ``-Z`` and ``+Z`` directions respectively, or
+            ``-1`` where a cell has no neighbor.
+
+        See Also
+        --------
+        ExplicitStructuredGrid.neighbors : Return the indices of neighboring cells.
+
+        Examples
+        --------
+        >>> from pyvista import examples
+        >>> grid = examples.load_explicit_structured()
+        >>> neighbors = grid.face_neighbors()
+        >>> neighbors[0]
+        array([-1,  1, -1,  4, -1, 20])
+
+        Count the neighbors of each cell.
+
+        >>> n_neighbors = (neighbors >= 0).sum(axis=1)
+
+        """
+        if rel not in ['topological', 'connectivity']:
+            raise ValueError(
+                f'`rel` must be one of: {["connectivity", "topological"]} (got "{rel}")'
+            )
+        return self._face_neighbors(np.arange(self.n_cells), connected=rel == 'connectivity')
+
+    def _cell_point_ids(self) -> np.ndarray:
+        """Return the IDs of the 8 points of each cell."""
+        cells = self.GetCells()
+        return _vtk.vtk_to_numpy(cells.GetConnectivityArray()).reshape(-1, 8)
+
+    def _face_neighbors(self, ind: np.ndarray, connected: bool) -> np.ndarray:
+        """Return the neighbors of the cells ``ind`` in the -X, +X, -Y, +Y, -Z and +Z directions.
+
+        Neighbors are ``-1`` outside the grid or, when ``connected`` is
+        ``True``, when the faces shared with the neighbor do not match.
+
+        """
+        shape = np.array(self._dimensions()) - 1
+        coords = np.stack(np.unravel_index(ind, shape, order='F'), axis=1)
+        if connected:
+            cell_point_ids = self._cell_point_ids()
+            points = self.points
+
+        # offset of each neighbor, followed by the points of the face of
+        # the cell and of the face of the neighbor in the same order
+        faces = [
+            [(-1, 0, 0), (0, 4, 7, 3), (1, 5, 6, 2)],
+            [(+1, 0, 0), (1, 2, 6, 5), (0, 3, 7, 4)],
+            [(0, -1, 0), (0, 1, 5, 4), (3, 2, 6, 7)],
+            [(0, +1, 0), (3, 7, 6, 2), (0, 4, 5, 1)],
+            [(0, 0, -1), (0, 3, 2, 1), (4, 7, 6, 5)],
+            [(0, 0, +1), (4, 5, 6, 7), (0, 1, 2, 3)],
+        ]
+        neighbors = np.full((ind.size, 6), -1, dtype=int)
+        for f, (offset, cell_face, neighbor_face) in enumerate(faces):
+            neighbor_coords = coords + offset
+            valid = np.all((neighbor_coords >= 0) & (neighbor_coords < shape), axis=1)
+            cells = ind[valid]
+            neighbor = np.ravel_multi_index(neighbor_coords[valid].T, shape, order='F')
+            if connected:
+                a1 = cell_point_ids[cells[:, None], cell_face]
+                a2 = cell_point_ids[neighbor[:, None], neighbor_face]
+                # faces sharing their points match, others are compared by coordinates
+                match = np.all(a1 == a2, axis=1)
+                other = np.flatnonzero(~match)
+                match[other] = np.all(points[a1[other]] == points[a2[other]], axis=(1, 2))
+                neighbor[~match] = -1
+            neighbors[valid, f] = neighbor
+        return neighbors
+
+    def _geometric_neighbors(self, ind: np.ndarray) -> np.ndarray:
+        """Return the neighbors of the cells ``ind`` whose faces intersect."""
+        shape = np.array(self._dimensions()) - 1
+        cell_point_ids = self._cell_point_ids()
+        z = np.abs(self.points[:, 2])
+
+        # the cells of the (i-1, j), (i+1, j), (i, j-1) and (i, j+1)
+        # vertical cell groups are compared with all cells of these groups
+        faces = [
+            [(-1, 0, 0), (0, 4, 3, 7), (1, 5, 2, 6)],
+            [(+1, 0, 0), (2, 6, 1, 5), (3, 7, 0, 4)],
+            [(0, -1, 0), (1, 5, 0, 4), (2, 6, 3, 7)],
+            [(0, +1, 0), (3, 7, 2, 6), (0, 4, 1, 5)],
+        ]
+        k = np.arange(shape[2])
+
+        def neighbors_chunk(start, stop):
+            chunk = ind[start:stop]
+            coords = np.stack(np.unravel_index(chunk, shape, order='F'), axis=1)
+            # vertical neighbors
+            indices = [self._face_neighbors(chunk, connected=False)[:, 4:].ravel()]
+            for offset, cell_face, neighbor_face in faces:
+                neighbor_coords = coords + offset
+                valid = np.all((neighbor_coords >= 0) & (neighbor_coords < shape), axis=1)
+                cell_z = z[cell_point_ids[chunk[valid][:, None], cell_face]].reshape(-1, 1, 2, 2)
+                cell_zmin = cell_z.min(axis=3)
+                cell_zmax = cell_z.max(axis=3)
+
+                i, j = neighbor_coords[valid, :2].T
+                neighbor = np.ravel_multi_index((i[:, None], j[:, None], k), shape, order='F')
+                neighbor_z = z[cell_point_ids[neighbor[..., None], neighbor_face]]
+                neighbor_z = neighbor_z.reshape(neighbor.shape + (2, 2))
+                zmin = neighbor_z.min(axis=3)
+                zmax = neighbor_z.max(axis=3)
+                intersect = (
+                    ((zmax[..., 0] > cell_zmin[..., 0]) & (zmin[..., 0] < cell_zmax[..., 0]))
+                    | ((zmax[..., 1] > cell_zmin[..., 1]) & (zmin[..., 1] < cell_zmax[..., 1]))
+                    | ((zmin[..., 0] > cell_zmax[..., 0]) & (zmax[..., 1] < cell_zmin[..., 1]))
+                    | ((zmin[..., 1] > cell_zmax[..., 1]) & (zmax[..., 0] < cell_zmin[..., 0]))
+                )
+                indices.append(neighbor[intersect])
+            return np.unique(np.concatenate(indices))
+
+        # bound the number of compared pairs of cells, and thus the memory
+        chunk_size = max(_GEOMETRIC_NEIGHBOR_PAIRS // max(shape[2], 1), 1)
+        return np.concatenate(_map_chunks(neighbors_chunk, ind.size, chunk_size=chunk_size))
 
     def compute_connectivity(self, inplace=False) -> 'ExplicitStructuredGrid':
         """Compute the faces connectivity flags array.
@@ -2922,7 +3007,9 @@ class ExplicitStructuredGrid(_vtk.vtkExplicitStructuredGrid, PointGrid):
             if 'ConnectivityFlags' in self.cell_data:
                 array = self.cell_data['ConnectivityFlags']
             else:
-                grid = self.compute_connectivity(inplace=False)
+                # the flags are computed on a shallow copy to avoid copying the grid
+                grid = self.copy(deep=False)
+                grid.ComputeFacesConnectivityFlagsArray()
                 array = grid.cell_data['ConnectivityFlags']
             array = array.reshape((-1, 1))
             array = array.astype(np.uint8)
@@ -23,6 +23,7 @@ from .arrays import (
     vtkmatrix_from_array,
 )
 from .cells import create_mixed_cells, get_mixed_cells, ncells_from_cells, numpy_to_idarr
+from .collision import collide_all
 from .features import (
     cartesian_to_spherical,
     create_grid,
@@ -42,11 +43,14 @@ from .fileio import (
     read_legacy,
     read_meshio,
     read_plot3d,
+    read_pvnpy,
     read_texture,
     save_meshio,
+    save_pvnpy,
     set_pickle_format,
     set_vtkwriter_mode,
 )
+from .filter_cache import clear_filter_cache, filter_cache_info, set_filter_cache
 from .geometric_objects import (
     NORMALS,
     Arrow,
@@ -134,6 +138,7 @@ from .points import (
     vector_poly_data,
     vtk_points,
 )
+from .profiling import Profile, add_profile_hook, profile, remove_profile_hook
 from .reader import (
     AVSucdReader,
     BaseReader,
@@ -188,3 +193,4 @@ from .reader import (
     XMLUnstructuredGridReader,
     get_reader,
 )
+from .shared_memory import SharedMemoryHandle, from_shared_memory
@@ -0,0 +1,473 @@
+"""Vectorized adjacency of the points and cells of a dataset.
+
+The functions in this module operate on the flat cell arrays of a dataset,
+i.e. the ``offsets`` (of length ``n_cells + 1``), ``connectivity`` and
+``celltypes`` arrays, and return graphs in compressed sparse row (CSR)
+format as a pair of ``(offsets, indices)`` arrays.
+
+"""
+from functools import lru_cache
+
+import numpy as np
+
+import pyvista
+from pyvista.core import _vtk_core as _vtk
+from pyvista.core.celltype import CellType
+
+# maximum number of candidate pairs evaluated at once when building graphs
+_MAX_PAIRS = 2**24
+
+
+@lru_cache(maxsize=None)
+def _cell_type_tables(celltype):
+    """Return the local edges and faces of a cell type with a fixed number of points.
+
+    Parameters
+    ----------
+    celltype : int
+        VTK cell type.
+
+    Returns
+    -------
+    int
+        Number of points of the cell type, or ``0`` when cells of this
+        type do not have a fixed number of points.
+
+    numpy.ndarray
+        Local point indices of the end points of each edge with shape
+        ``(n_edges, 2)``.
+
+    numpy.ndarray
+        Local point indices of each face with shape ``(n_faces, n)``,
+        padded with ``-1``.
+
+    """
+    cell = _vtk.vtkGenericCell()
+    cell.SetCellType(celltype)
+    n_points = cell.GetNumberOfPoints()
+    if n_points == 0 or cell.RequiresExplicitFaceRepresentation():
+        return 0, None, None
+
+    point_ids = cell.GetPointIds()
+    for i in range(n_points):
+        point_ids.SetId(i, i)
+
+    edges = np.empty((cell.GetNumberOfEdges(), 2), dtype=pyvista.ID_TYPE)
+    for i in range(edges.shape[0]):
+        edge_ids = cell.GetEdge(i).GetPointIds()
+        edges[i] = edge_ids.GetId(0), edge_ids.GetId(1)
+
+    faces = []
+    for i in range(cell.GetNumberOfFaces()):
+        face_ids = cell.GetFace(i).GetPointIds()
+        faces.append([face_ids.GetId(j) for j in range(face_ids.GetNumberOfIds())])
+    width = max((len(face) for face in faces), default=0)
+    faces_table = np.full((len(faces), width), -1, dtype=pyvista.ID_TYPE)
+    for i, face in enumerate(faces):
+        faces_table[i, : len(face)] = face
+
+    return n_points, edges, faces_table
+
+
+def _ragged_local_index(sizes):
+    """Return the position of each item within its segment and the segment index."""
+    segment = np.repeat(np.arange(sizes.size), sizes)
+    local = np.arange(segment.size) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    return local, segment
+
+
+def _variable_edges(celltype, starts, sizes, connectivity):
+    """Return the edges of variable size polygons, polylines and strips."""
+    local, segment = _ragged_local_index(sizes)
+    if celltype in (CellType.POLYGON, CellType.POLY_LINE):
+        nxt = local + 1
+        if celltype == CellType.POLYGON:
+            nxt %= sizes[segment]
+        keep = nxt < sizes[segment]
+        pairs = [(local[keep], nxt[keep], segment[keep])]
+    else:  # triangle strip
+        pairs = []
+        for step in (1, 2):
+            keep = local + step < sizes[segment]
+            pairs.append((local[keep], local[keep] + step, segment[keep]))
+
+    edges = []
+    cells = []
+    for a, b, seg in pairs:
+        base = starts[seg]
+        edges.append(np.column_stack((connectivity[base + a], connectivity[base + b])))
+        cells.append(seg)
+    return np.concatenate(edges), np.concatenate(cells)
+
+
+def cell_edges(offsets, connectivity, celltypes, get_cell=None):
+    """Return the edges of each cell.
+
+    Parameters
+    ----------
+    offsets : numpy.ndarray
+        Offsets of each cell in ``connectivity`` with length ``n_cells + 1``.
+
+    connectivity : numpy.ndarray
+        Point ids of all cells.
+
+    celltypes : numpy.ndarray
+        VTK cell type of each cell.
+
+    get_cell : callable, optional
+        Function returning a :class:`pyvista.Cell` from a cell id. Used
+        for the cell types which cannot be processed with vectorized
+        operations, such as polyhedra and arbitrary order cells.
+
+    Returns
+    -------
+    numpy.ndarray
+        End point ids of each edge with shape ``(n_edges, 2)``.
+
+    numpy.ndarray
+        Id of the cell of each edge.
+
+    """
+    return _cell_entities(offsets, connectivity, celltypes, get_cell, faces=False)
+
+
+def cell_faces(offsets, connectivity, celltypes, get_cell=None):
+    """Return the faces of each three dimensional cell.
+
+    Parameters
+    ----------
+    offsets : numpy.ndarray
+        Offsets of each cell in ``connectivity`` with length ``n_cells + 1``.
+
+    connectivity : numpy.ndarray
+        Point ids of all cells.
+
+    celltypes : numpy.ndarray
+        VTK cell type of each cell.
+
+    get_cell : callable, optional
+        Function returning a :class:`pyvista.Cell` from a cell id. Used
+        for the cell types which cannot be processed with vectorized
+        operations, such as polyhedra and arbitrary order cells.
+
+    Returns
+    -------
+    numpy.ndarray
+        Point ids of each face with shape ``(n_faces, n)``, padded with
+        ``-1``.
+
+    numpy.ndarray
+        Id of the cell of each face.
+
+    """
+    return _cell_entities(offsets, connectivity, celltypes, get_cell, faces=True)
+
+
+def _cell_entities(offsets, connectivity, celltypes, get_cell, faces):
+    """Return the edges or faces of each cell, grouped by cell type."""
+    sizes = np.diff(offsets)
+    entities = []
+    cells = []
+    for celltype in np.unique(celltypes):
+        cell_ids = np.flatnonzero(celltypes == celltype)
+        n_points, edges_table, faces_table = _cell_type_tables(int(celltype))
+        table = faces_table if faces else edges_table
+
+        if n_points and np.all(sizes[cell_ids] == n_points):
+            if table.size == 0:
+                continue
+            # gather the points of the local table of every cell at once
+            index = offsets[cell_ids, np.newaxis, np.newaxis] + np.maximum(table, 0)
+            ids = connectivity[index]
+            ids[:, table < 0] = -1
+            entities.append(ids.reshape(-1, table.shape[1]))
+            cells.append(np.repeat(cell_ids, table.shape[0]))
+        elif not faces and celltype in (
+            CellType.POLYGON,
+            CellType.POLY_LINE,
+            CellType.TRIANGLE_STRIP,
+        ):
+            ids, segment = _variable_edges(
+                celltype, offsets[cell_ids], sizes[cell_ids], connectivity
+            )
+            entities.append(ids)
+            cells.append(cell_ids[segment])
+        elif faces and celltype in (
+            CellType.EMPTY_CELL,
+            CellType.POLY_VERTEX,
+            CellType.POLY_LINE,
+            CellType.TRIANGLE_STRIP,
+            CellType.POLYGON,
+            CellType.QUADRATIC_POLYGON,
+        ):
+            continue
+        elif celltype not in (CellType.EMPTY_CELL, CellType.POLY_VERTEX):
+            if get_cell is None:
+                raise ValueError(f'Unable to compute the cell entities of cell type {celltype}.')
+            for cell_id in cell_ids:
+                cell = get_cell(cell_id)
+                for entity in cell.faces if faces else cell.edges:
+                    point_ids = entity.point_ids
+                    entities.append(
+                        np.array([point_ids if faces else point_ids[:2]], dtype=pyvista.ID_TYPE)
+                    )
+                    cells.append(np.array([cell_id]))
+
+    width = 3 if faces else 2
+    if not entities:
+        return np.empty((0, width), dtype=pyvista.ID_TYPE), np.empty(0, dtype=pyvista.ID_TYPE)
+
+    width = max(ids.shape[1] for ids in entities)
+    padded = [
+        np.pad(ids, ((0, 0), (0, width - ids.shape[1])), constant_values=-1) for ids in entities
+    ]
+    return np.concatenate(padded), np.concatenate(cells).astype(pyvista.ID_TYPE)
+
+
+def _group_ids(keys):
+    """Return a group id for each row of ``keys``, equal for rows with the same ids.
+
+    Rows are compared regardless of the order of their ids.
+    """
+    keys = np.sort(keys, axis=1)
+    order = np.lexsort(keys.T[::-1])
+    sorted_keys = keys[order]
+    is_new = np.r_[True, np.any(sorted_keys[1:] != sorted_keys[:-1], axis=1)]
+    group_ids = np.empty(keys.shape[0], dtype=pyvista.ID_TYPE)
+    group_ids[order] = np.cumsum(is_new) - 1
+    return group_ids
+
+
+def pairs_to_csr(rows, cols, n):
+    """Convert pairs of ids to a CSR graph without duplicate entries.
+
+    Parameters
+    ----------
+    rows : numpy.ndarray
+        Source id of each pair.
+
+    cols : numpy.ndarray
+        Target id of each pair.
+
+    n : int
+        Number of nodes of the graph.
+
+    Returns
+    -------
+    numpy.ndarray
+        Offsets of the neighbors of each node with length ``n + 1``.
+
+    numpy.ndarray
+        Sorted neighbors of all nodes.
+
+    """
+    keys = np.unique(rows.astype(np.int64) * n + cols)
+    indices = (keys % n).astype(pyvista.ID_TYPE)
+    offsets = np.zeros(n + 1, dtype=pyvista.ID_TYPE)
+    np.cumsum(np.bincount(keys // n, minlength=n), out=offsets[1:])
+    return offsets, indices
+
+
+def shared_group_pairs(groups, members, n):
+    """Return the CSR graph linking the members sharing a group.
+
+    For example, two cells are linked when they share a point with
+    ``groups`` being the point ids and ``members`` the corresponding
+    cell ids.
+
+    Parameters
+    ----------
+    groups : numpy.ndarray
+        Group id of each entry.
+
+    members : numpy.ndarray
+        Member id of each entry.
+
+    n : int
+        Number of members.
+
+    Returns
+    -------
+    numpy.ndarray
+        Offsets of the neighbors of each member with length ``n + 1``.
+
+    numpy.ndarray
+        Sorted neighbors of all members.
+
+    """
+    if groups.size == 0:
+        return np.zeros(n + 1, dtype=pyvista.ID_TYPE), np.empty(0, dtype=pyvista.ID_TYPE)
+
+    order = np.argsort(groups, kind='stable')
+    groups = groups[order]
+    members = members[order]
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    sizes = np.diff(np.r_[starts, groups.size])
+
+    # process the groups in batches to bound the number of candidate pairs
+    batch = np.cumsum(sizes.astype(np.int64) ** 2) // _MAX_PAIRS
+    bounds = np.flatnonzero(np.r_[True, batch[1:] != batch[:-1], True])
+
+    keys = []
+    for first, last in zip(bounds[:-1], bounds[1:]):
+        batch_starts = starts[first:last]
+        batch_sizes = sizes[first:last]
+
+        # pair each entry with every entry of its group
+        entry_sizes = np.repeat(batch_sizes, batch_sizes)
+        entries = np.arange(batch_starts[0], batch_starts[0] + entry_sizes.size)
+        rows = np.repeat(members[entries], entry_sizes)
+        local, _ = _ragged_local_index(entry_sizes)
+        cols = members[np.repeat(np.repeat(batch_starts, batch_sizes), entry_sizes) + local]
+
+        different = rows != cols
+        keys.append(np.unique(rows[different].astype(np.int64) * n + cols[different]))
+
+    keys = np.concatenate(keys)
+    return pairs_to_csr(keys // n, keys % n, n)
+
+
+def point_adjacency(offsets, connectivity, celltypes, n_points, connections, get_cell=None):
+    """Return the CSR graph of the neighbors of each point.
+
+    Parameters
+    ----------
+    offsets : numpy.ndarray
+        Offsets of each cell in ``connectivity`` with length ``n_cells + 1``.
+
+    connectivity : numpy.ndarray
+        Point ids of all cells.
+
+    celltypes : numpy.ndarray
+        VTK cell type of each cell.
+
+    n_points : int
+        Number of points.
+
+    connections : str
+        ``'cells'`` to link the points sharing a cell or ``'edges'`` to
+        link the points sharing an edge.
+
+    get_cell : callable, optional
+        Function returning a :class:`pyvista.Cell` from a cell id.
+
+    Returns
+    -------
+    numpy.ndarray
+        Offsets of the neighbors of each point with length ``n_points + 1``.
+
+    numpy.ndarray
+        Sorted neighbors of all points.
+
+    """
+    if connections == 'cells':
+        cell_ids = np.repeat(np.arange(offsets.size - 1), np.diff(offsets))
+        return shared_group_pairs(cell_ids, connectivity, n_points)
+
+    edges, _ = cell_edges(offsets, connectivity, celltypes, get_cell)
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    rows = np.concatenate((edges[:, 0], edges[:, 1]))
+    cols = np.concatenate((edges[:, 1], edges[:, 0]))
+    return pairs_to_csr(rows, cols, n_points)
+
+
+def cell_adjacency(offsets, connectivity, celltypes, connections, get_cell=None):
+    """Return the CSR graph of the neighbors of each cell.
+
+    Parameters
+    ----------
+    offsets : numpy.ndarray
+        Offsets of each cell in ``connectivity`` with length ``n_cells + 1``.
+
+    connectivity : numpy.ndarray
+        Point ids of all cells.
+
+    celltypes : numpy.ndarray
+        VTK cell type of each cell.
+
+    connections : str
+        ``'points'``, ``'edges'`` or ``'faces'``. Cells are linked when
+        they share at least one point, an edge or a face respectively.
+
+    get_cell : callable, optional
+        Function returning a :class:`pyvista.Cell` from a cell id.
+
+    Returns
+    -------
+    numpy.ndarray
+        Offsets of the neighbors of each cell with length ``n_cells + 1``.
+
+    numpy.ndarray
+        Sorted neighbors of all cells.
+
+    """
+    n_cells = offsets.size - 1
+    if connections == 'points':
+        cell_ids = np.repeat(np.arange(n_cells), np.diff(offsets))
+        return shared_group_pairs(connectivity, cell_ids, n_cells)
+
+    extract = cell_faces if connections == 'faces' else cell_edges
+    entities, cell_ids = extract(offsets, connectivity, celltypes, get_cell)
+    return shared_group_pairs(_group_ids(entities), cell_ids, n_cells)
+
+
+def hop_distance(offsets, indices, seeds, n_levels=None, return_sources=False):
+    """Return the number of hops from the nearest seed to each node of a graph.
+
+    The graph is traversed with a breadth first search processing a whole
+    frontier of nodes at once.
+
+    Parameters
+    ----------
+    offsets : numpy.ndarray
+        Offsets of the neighbors of each node with length ``n + 1``.
+
+    indices : numpy.ndarray
+        Neighbors of all nodes.
+
+    seeds : numpy.ndarray
+        Ids of the seed nodes.
+
+    n_levels : int, optional
+        Maximum number of hops. By default, the traversal continues until
+        all reachable nodes are found.
+
+    return_sources : bool, default: False
+        Also return the seed from which each node was reached.
+
+    Returns
+    -------
+    numpy.ndarray
+        Number of hops from the nearest seed to each node, ``0`` for the
+        seeds and ``-1`` for the nodes which are not reached.
+
+    numpy.ndarray
+        Seed from which each node was reached, ``-1`` for the nodes which
+        are not reached. Only returned when ``return_sources=True``.
+
+    """
+    n = offsets.size - 1
+    hops = np.full(n, -1, dtype=pyvista.ID_TYPE)
+    sources = np.full(n, -1, dtype=pyvista.ID_TYPE)
+
+    frontier = np.unique(seeds)
+    hops[frontier] = 0
+    sources[frontier] = frontier
+
+    level = 0
+    while frontier.size and (n_levels is None or level < n_levels):
+        level += 1
+        starts = offsets[frontier]
+        sizes = offsets[frontier + 1] - starts
+        local, segment = _ragged_local_index(sizes)
+        neighbors = indices[starts[segment] + local]
+
+        unvisited = hops[neighbors] < 0
+        neighbors, first = np.unique(neighbors[unvisited], return_index=True)
+        hops[neighbors] = level
+        sources[neighbors] = sources[frontier[segment[unvisited][first]]]
+        frontier = neighbors
+
+    if return_sources:
+        return hops, sources
+    return hops
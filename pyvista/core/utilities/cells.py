@@ -43,6 +43,43 @@ def numpy_to_idarr(ind, deep=False, return_ind=False):
     return vtk_idarr
 
 
+def _selection_mask(ind, size, name):
+    """Return a boolean mask of length ``size`` from indices or a boolean mask.
+
+    Parameters
+    ----------
+    ind : sequence[int] | sequence[bool]
+        Indices of the selected items, or a boolean mask of length ``size``.
+
+    size : int
+        Number of items.
+
+    name : str
+        Name of the items, used in error messages.
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean mask of the selected items.
+
+    """
+    ind = np.asarray(ind)
+    if ind.size == 0:
+        return np.zeros(size, dtype=np.bool_)
+
+    # np.asarray will eat anything, so we have to weed out bogus inputs
+    if not issubclass(ind.dtype.type, (np.bool_, np.integer)):
+        raise TypeError('Indices must be either a mask or an integer array-like')
+
+    if ind.dtype == np.bool_:
+        if ind.size != size:
+            raise ValueError(f'Boolean array size must match the number of {name} ({size})')
+        return ind.ravel()
+    mask = np.zeros(size, dtype=np.bool_)
+    mask[ind] = True
+    return mask
+
+
 def create_mixed_cells(mixed_cell_dict, nr_points=None):
     """Generate the required cell arrays for the creation of a pyvista.UnstructuredGrid from a cell dictionary.
 
@@ -0,0 +1,355 @@
+"""Collision detection between many meshes."""
+import weakref
+
+import numpy as np
+
+import pyvista
+from pyvista.core import _vtk_core as _vtk
+
+# corners of the unit cube, used to transform the bounds of the meshes
+_CORNERS = np.array(np.meshgrid([0, 1], [0, 1], [0, 1], indexing='ij')).reshape(3, -1).T
+
+
+def _collision_surface(mesh):
+    """Return the cached triangulated surface used to detect collisions.
+
+    Parameters
+    ----------
+    mesh : pyvista.DataSet
+        Mesh to triangulate. The external surface of meshes which are not
+        :class:`pyvista.PolyData` is extracted.
+
+    Returns
+    -------
+    vtk.vtkPolyData
+        Triangulated surface.
+
+    numpy.ndarray or None
+        Index of the cell of ``mesh`` each triangle belongs to, or ``None``
+        when the triangles are the cells of ``mesh``.
+
+    """
+    state = mesh._get_mesh_state()
+    if 'collision_surface' in mesh._locators:
+        surface, build_state = mesh._locators['collision_surface']
+        if build_state == state:
+            return surface
+
+    # like locators, build the surface from a structural copy to avoid a
+    # reference cycle keeping the mesh alive
+    structure = mesh.NewInstance()
+    structure.CopyStructure(mesh)
+    polys = structure.GetPolys() if isinstance(structure, _vtk.vtkPolyData) else None
+    if (
+        polys is not None
+        and polys.GetNumberOfCells() == structure.GetNumberOfCells()
+        and polys.GetNumberOfConnectivityIds() == 3 * polys.GetNumberOfCells()
+    ):
+        surface = (structure, None)
+    else:
+        ids = _vtk.numpy_to_vtk(np.arange(mesh.n_cells, dtype=np.int64), deep=True)
+        ids.SetName('vtkOriginalCellIds')
+        structure.GetCellData().AddArray(ids)
+        if polys is None:
+            alg = _vtk.vtkDataSetSurfaceFilter()
+            alg.SetInputData(structure)
+            alg.Update()
+            structure = alg.GetOutput()
+        alg = _vtk.vtkTriangleFilter()
+        alg.SetInputData(structure)
+        alg.PassVertsOff()
+        alg.PassLinesOff()
+        alg.Update()
+        triangles = alg.GetOutput()
+        ids = _vtk.vtk_to_numpy(triangles.GetCellData().GetArray('vtkOriginalCellIds'))
+        triangles.GetCellData().Initialize()
+        surface = (triangles, ids.astype(np.int64))
+
+    mesh._locators['collision_surface'] = (surface, state)
+    return surface
+
+
+def _coerce_transforms(transforms, n_meshes):
+    """Return the transformation matrices of the meshes as a ``(n, 4, 4)`` array."""
+    if transforms is None:
+        return np.broadcast_to(np.eye(4), (n_meshes, 4, 4))
+    if isinstance(transforms, np.ndarray) and transforms.ndim == 3:
+        matrices = transforms.astype(float, copy=False)
+    else:
+        matrices = np.empty((len(transforms), 4, 4))
+        for i, transform in enumerate(transforms):
+            if transform is None:
+                matrices[i] = np.eye(4)
+            elif isinstance(transform, _vtk.vtkMatrix4x4):
+                matrices[i] = pyvista.array_from_vtkmatrix(transform)
+            elif isinstance(transform, _vtk.vtkTransform):
+                matrices[i] = pyvista.array_from_vtkmatrix(transform.GetMatrix())
+            else:
+                matrices[i] = np.asarray(transform, dtype=float)
+    if matrices.shape != (n_meshes, 4, 4):
+        raise ValueError(
+            f'`transforms` must contain one 4x4 transformation matrix for each of the '
+            f'{n_meshes} meshes.'
+        )
+    return matrices
+
+
+def _sweep_and_prune(lower, upper):
+    """Return the pairs of overlapping axis aligned bounding boxes.
+
+    Boxes are sorted by their lower bound along the axis where the boxes
+    are the most spread out. The candidates of each box are the following
+    boxes starting before it ends, which are then tested along all axes.
+
+    Parameters
+    ----------
+    lower : numpy.ndarray
+        Lower bounds of the boxes with shape ``(n_boxes, 3)``.
+
+    upper : numpy.ndarray
+        Upper bounds of the boxes with shape ``(n_boxes, 3)``.
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted indices ``(i, j)`` of the pairs of overlapping boxes with
+        ``i < j``, with shape ``(n_pairs, 2)``.
+
+    """
+    n_boxes = lower.shape[0]
+    if n_boxes < 2:
+        return np.empty((0, 2), dtype=np.intp)
+
+    axis = np.argmax(np.var(lower + upper, axis=0))
+    order = np.argsort(lower[:, axis], kind='stable')
+    stops = np.searchsorted(lower[order, axis], upper[order, axis], side='right')
+    counts = np.maximum(stops - np.arange(n_boxes) - 1, 0)
+    first = np.repeat(np.arange(n_boxes), counts)
+    second = first + 1 + np.arange(first.size) - np.repeat(np.cumsum(counts) - counts, counts)
+
+    a, b = order[first], order[second]
+    overlap = np.all((lower[a] <= upper[b]) & (lower[b] <= upper[a]), axis=1)
+    pairs = np.sort(np.column_stack((a[overlap], b[overlap])), axis=1)
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def _get_collision_filter(mesh_a, mesh_b, box_tolerance, n_cells_per_node):
+    """Return the cached narrow phase filter of a pair of meshes.
+
+    The filters of the pairs starting with ``mesh_a`` are cached by
+    ``mesh_a`` and keyed by a weak reference to the other mesh of the pair,
+    so that the OBB trees of a filter are only built again when one of its
+    meshes is modified.
+    """
+    filters = mesh_a._locators.setdefault('collision_filters', ({}, ()))[0]
+    state = (
+        mesh_a._get_mesh_state(),
+        mesh_b._get_mesh_state(),
+        box_tolerance,
+        n_cells_per_node,
+    )
+    if id(mesh_b) in filters:
+        ref, alg, build_state = filters[id(mesh_b)]
+        if ref() is mesh_b and build_state == state:
+            return alg
+
+    alg = _vtk.vtkCollisionDetectionFilter()
+    alg.SetBoxTolerance(box_tolerance)
+    alg.SetNumberOfCellsPerNode(n_cells_per_node)
+    # the filter builds its OBB trees again on its second execution, and
+    # whenever its box tolerance is modified, so execute it once on a
+    # single triangle before setting the surfaces. This is tested by
+    # ``test_collide_all_reuses_obb_trees``.
+    triangle = _vtk.vtkPolyData()
+    triangle.ShallowCopy(pyvista.Triangle())
+    for port in range(2):
+        alg.SetInputData(port, triangle)
+        alg.SetMatrix(port, _vtk.vtkMatrix4x4())
+    alg.Update()
+
+    for port, mesh in enumerate((mesh_a, mesh_b)):
+        alg.SetInputData(port, _collision_surface(mesh)[0])
+    filters[id(mesh_b)] = (weakref.ref(mesh_b), alg, state)
+    return alg
+
+
+def _evict_collision_filters(meshes, pairs):
+    """Free the cached filters of the pairs of meshes which no longer overlap."""
+    partners = {id(mesh): set() for mesh in meshes}
+    for i, j in pairs:
+        partners[id(meshes[i])].add(id(meshes[j]))
+    for mesh in meshes:
+        if 'collision_filters' in mesh._locators:
+            filters = mesh._locators['collision_filters'][0]
+            for key in filters.keys() - partners[id(mesh)]:
+                del filters[key]
+
+
+def collide_all(
+    meshes,
+    transforms=None,
+    contact_mode=0,
+    box_tolerance=0.001,
+    cell_tolerance=0.0,
+    n_cells_per_node=2,
+):
+    """Detect the collisions between all pairs of many meshes.
+
+    Pairs of meshes whose axis aligned bounding boxes overlap are first
+    found with a vectorized sweep and prune over the transformed bounds
+    of the meshes. Only the cells of these pairs are then tested for
+    collisions with the same ``vtkCollisionDetectionFilter`` as
+    :func:`PolyDataFilters.collision <pyvista.PolyDataFilters.collision>`.
+
+    The triangulated surfaces and the narrow phase filters of the
+    overlapping pairs, including their OBB trees, are cached by the meshes.
+    Calling this function again with updated ``transforms`` only updates
+    the matrices of the filters, so animations of rigid parts do not build
+    the OBB trees again. The filters of the pairs which no longer overlap
+    are freed. Each filter builds the OBB trees of both its meshes, so a
+    mesh overlapping several others has one OBB tree per pair.
+
+    .. versionadded:: 0.40.0
+
+    Parameters
+    ----------
+    meshes : sequence[pyvista.DataSet]
+        Meshes to test for collisions. The external surface of meshes which
+        are not :class:`pyvista.PolyData` is used, and surfaces are
+        triangulated.
+
+    transforms : sequence, optional
+        Transformation of each mesh from its coordinates to the world
+        coordinates, either as a ``vtk.vtkMatrix4x4``, a
+        ``vtk.vtkTransform``, a 4x4 array or ``None`` for the identity. A
+        single array with shape ``(n_meshes, 4, 4)`` is also accepted.
+        Defaults to the identity for all meshes.
+
+    contact_mode : int, default: 0
+        Contact mode.  One of the following:
+
+        * 0 - All contacts. Find all the contacting cell pairs.
+        * 1 - First contact. Quickly find the first contact of each pair
+          of meshes.
+        * 2 - Half contacts. Find all the contacting cell pairs with one
+          point per collision.
+
+    box_tolerance : float, default: 0.001
+        Oriented bounding box (OBB) tree tolerance in world coordinates.
+
+    cell_tolerance : float, default: 0.0
+        Cell tolerance (squared value).
+
+    n_cells_per_node : int, default: 2
+        Number of cells in each OBB.
+
+    Returns
+    -------
+    pyvista.Table
+        Table with one row for each contact, sorted by pair of meshes, and
+        the following columns:
+
+        * ``'mesh_a'`` - Index of the first mesh of the pair.
+        * ``'mesh_b'`` - Index of the second mesh, always greater than
+          ``'mesh_a'``.
+        * ``'cell_a'`` - Index of the contacting cell of the first mesh.
+        * ``'cell_b'`` - Index of the contacting cell of the second mesh.
+        * ``'point'`` - Contact point in world coordinates. For all
+          contacts, this is the center of the segment where the two cells
+          intersect.
+
+    See Also
+    --------
+    pyvista.PolyDataFilters.collision
+        Detect the collisions between two meshes.
+
+    Notes
+    -----
+    The cached filters are released by :func:`DataSet.clear_locators
+    <pyvista.DataSet.clear_locators>`.
+
+    Examples
+    --------
+    Detect the collisions between a row of spheres, where only neighboring
+    spheres overlap.
+
+    >>> import numpy as np
+    >>> import pyvista
+    >>> sphere = pyvista.Sphere()
+    >>> meshes = [sphere.copy() for _ in range(4)]
+    >>> transforms = np.tile(np.eye(4), (4, 1, 1))
+    >>> transforms[:, 0, 3] = [0, 0.9, 1.8, 5]
+    >>> contacts = pyvista.collide_all(meshes, transforms)
+    >>> np.unique(np.column_stack((contacts['mesh_a'], contacts['mesh_b'])), axis=0)
+    array([[0, 1],
+           [1, 2]])
+
+    Move the last sphere next to the third one. The OBB trees of the first
+    pairs are reused.
+
+    >>> transforms[3, 0, 3] = 2.7
+    >>> contacts = pyvista.collide_all(meshes, transforms)
+    >>> np.unique(np.column_stack((contacts['mesh_a'], contacts['mesh_b'])), axis=0)
+    array([[0, 1],
+           [1, 2],
+           [2, 3]])
+
+    """
+    meshes = [mesh if isinstance(mesh, pyvista.DataSet) else pyvista.wrap(mesh) for mesh in meshes]
+    matrices = _coerce_transforms(transforms, len(meshes))
+
+    # broad phase over the bounds of the meshes in world coordinates
+    bounds = np.array([mesh.bounds for mesh in meshes], dtype=float).reshape(-1, 3, 2)
+    corners = bounds[:, np.arange(3), _CORNERS]
+    corners = np.einsum('nij,nkj->nki', matrices[:, :3, :3], corners)
+    corners += matrices[:, np.newaxis, :3, 3]
+    padding = box_tolerance + np.sqrt(cell_tolerance)
+    has_cells = np.array([mesh.n_cells > 0 for mesh in meshes], dtype=bool)
+    candidates = np.flatnonzero(has_cells)
+    pairs = _sweep_and_prune(
+        corners[candidates].min(axis=1) - padding, corners[candidates].max(axis=1) + padding
+    )
+    pairs = candidates[pairs]
+
+    # narrow phase over the overlapping pairs only
+    _evict_collision_filters(meshes, pairs)
+    contacts = []
+    for i, j in pairs:
+        alg = _get_collision_filter(meshes[i], meshes[j], box_tolerance, n_cells_per_node)
+        alg.GetMatrix(0).DeepCopy(matrices[i].ravel())
+        alg.GetMatrix(1).DeepCopy(matrices[j].ravel())
+        alg.SetCellTolerance(cell_tolerance)
+        alg.SetCollisionMode(contact_mode)
+        alg.Update()
+        n_contacts = alg.GetNumberOfContacts()
+        if n_contacts == 0:
+            contacts.append((np.empty(0, dtype=np.int64),) * 2 + (np.empty((0, 3)),))
+            continue
+        output = alg.GetContactsOutput()
+        cells = output.GetLines() if output.GetNumberOfLines() else output.GetVerts()
+        connectivity = _vtk.vtk_to_numpy(cells.GetConnectivityArray())
+        points = _vtk.vtk_to_numpy(output.GetPoints().GetData())
+        contacts.append(
+            (
+                _vtk.vtk_to_numpy(alg.GetContactCells(0))[:n_contacts].astype(np.int64),
+                _vtk.vtk_to_numpy(alg.GetContactCells(1))[:n_contacts].astype(np.int64),
+                points[connectivity].reshape(n_contacts, -1, 3).mean(axis=1),
+            )
+        )
+
+    mesh_a, mesh_b, cell_a, cell_b, points = [], [], [], [], []
+    for (i, j), (cells_i, cells_j, contact_points) in zip(pairs, contacts):
+        for index, cells, cell_list in ((i, cells_i, cell_a), (j, cells_j, cell_b)):
+            original_ids = _collision_surface(meshes[index])[1]
+            cell_list.append(cells if original_ids is None else original_ids[cells])
+        mesh_a.append(np.full(cells_i.size, i, dtype=np.int64))
+        mesh_b.append(np.full(cells_i.size, j, dtype=np.int64))
+        points.append(contact_points)
+
+    table = pyvista.Table()
+    table['mesh_a'] = np.concatenate(mesh_a) if mesh_a else np.empty(0, dtype=np.int64)
+    table['mesh_b'] = np.concatenate(mesh_b) if mesh_b else np.empty(0, dtype=np.int64)
+    table['cell_a'] = np.concatenate(cell_a) if cell_a else np.empty(0, dtype=np.int64)
+    table['cell_b'] = np.concatenate(cell_b) if cell_b else np.empty(0, dtype=np.int64)
+    table['point'] = np.concatenate(points) if points else np.empty((0, 3))
+    return table
@@ -1,8 +1,10 @@
 """Contains a dictionary that maps file extensions to VTK readers."""
 
+import json
 import os
 import pathlib
 import warnings
+import zipfile
 
 import numpy as np
 
@@ -14,8 +16,20 @@ from .observers import Observer
 
 
 def set_pickle_format(format: str):
-    """Set the format used to serialize :class:`pyvista.DataObject` when pickled."""
-    supported = {'xml', 'legacy'}
+    """Set the format used to serialize :class:`pyvista.DataObject` when pickled.
+
+    Parameters
+    ----------
+    format : str
+        One of ``'xml'``, ``'legacy'`` or ``'binary'``. The ``'binary'``
+        format pickles the points, cells and data arrays as NumPy arrays,
+        avoiding any serialization copy with pickle protocol 5.
+
+        .. versionchanged:: 0.40.0
+            Added the ``'binary'`` format.
+
+    """
+    supported = {'xml', 'legacy', 'binary'}
     format = format.lower()
     if format not in supported:
         raise ValueError(
@@ -102,7 +116,7 @@ def read_legacy(filename, progress_bar=False):
     return read(filename, progress_bar=progress_bar)
 
 
-def read(filename, attrs=None, force_ext=None, file_format=None, progress_bar=False):
+def read(filename, attrs=None, force_ext=None, file_format=None, progress_bar=False, mmap=False):
     """Read any file type supported by ``vtk`` or ``meshio``.
 
     .. deprecated:: 0.35.0
@@ -145,6 +159,13 @@ def read(filename, attrs=None, force_ext=None, file_format=None, progress_bar=Fa
     progress_bar : bool, default: False
         Optionally show a progress bar. Ignored when using ``meshio``.
 
+    mmap : bool, default: False
+        Memory map the arrays of the file instead of reading them. Only
+        supported by the ``'.pvnpy'`` format, see
+        :func:`pyvista.read_pvnpy`.
+
+        .. versionadded:: 0.40.0
+
     Returns
     -------
     pyvista.DataSet
@@ -177,9 +198,13 @@ def read(filename, attrs=None, force_ext=None, file_format=None, progress_bar=Fa
                 name = os.path.basename(str(each))
             else:
                 name = None
-            multi.append(read(each, attrs=attrs, file_format=file_format), name)
+            multi.append(read(each, attrs=attrs, file_format=file_format, mmap=mmap), name)
         return multi
     filename = os.path.abspath(os.path.expanduser(str(filename)))
+    if _get_ext_force(filename, force_ext) == '.pvnpy':
+        return read_pvnpy(filename, mmap=mmap)
+    if mmap:
+        raise ValueError('Memory mapping is only supported by the ".pvnpy" format.')
     if not os.path.isfile(filename):
         raise FileNotFoundError(f'File ({filename}) not found')
 
@@ -465,6 +490,67 @@ def is_meshio_mesh(obj):
         return False
 
 
+def _polyhedra_to_cells(polyhedra):
+    """Convert meshio polyhedra, given as lists of faces, to VTK face streams.
+
+    Return the legacy cell array of the polyhedra, where each cell is
+    ``[n, n_faces, n_points_face_0, point_ids_face_0..., ...]``.
+    """
+    faces = [np.asarray(face).ravel() for cell in polyhedra for face in cell]
+    n_faces = np.fromiter(map(len, polyhedra), dtype=np.int64, count=len(polyhedra))
+    face_sizes = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+    face_cells = np.repeat(np.arange(len(polyhedra)), n_faces)
+
+    # each cell is its size, its number of faces, then each face as its
+    # number of points followed by the point ids
+    face_lengths = face_sizes + 1
+    cell_lengths = 2 + np.bincount(face_cells, weights=face_lengths, minlength=len(polyhedra))
+    cell_lengths = cell_lengths.astype(np.int64)
+    cell_starts = np.cumsum(cell_lengths) - cell_lengths
+    face_offsets = np.cumsum(face_lengths) - face_lengths
+    first_faces = np.cumsum(n_faces) - n_faces
+    face_starts = cell_starts[face_cells] + 2 + face_offsets - face_offsets[first_faces][face_cells]
+
+    stream = np.empty(cell_lengths.sum(), dtype=np.int64)
+    stream[cell_starts] = cell_lengths - 1
+    stream[cell_starts + 1] = n_faces
+    stream[face_starts] = face_sizes
+    if faces:
+        id_offsets = np.cumsum(face_sizes) - face_sizes
+        positions = np.repeat(face_starts + 1 - id_offsets, face_sizes) + np.arange(
+            face_sizes.sum()
+        )
+        stream[positions] = np.concatenate(faces)
+    return stream
+
+
+def _cells_to_polyhedra(mesh, cell_ids):
+    """Return the faces of polyhedral cells as lists of point ids arrays."""
+    faces = _vtk.vtk_to_numpy(mesh.GetFaces())
+    position = _vtk.vtk_to_numpy(mesh.GetFaceLocations())[cell_ids]
+    n_faces = faces[position]
+    position = position + 1
+
+    # walk the face streams of all the cells at once, one face at a time
+    face_cells, face_starts, face_sizes = [], [], []
+    for i in range(n_faces.max(initial=0)):
+        cells = np.flatnonzero(n_faces > i)
+        sizes = faces[position[cells]]
+        face_cells.append(cells)
+        face_starts.append(position[cells] + 1)
+        face_sizes.append(sizes)
+        position[cells] += sizes + 1
+
+    order = np.argsort(np.concatenate(face_cells), kind='stable')
+    face_starts = np.concatenate(face_starts)[order]
+    face_sizes = np.concatenate(face_sizes)[order]
+    id_offsets = np.cumsum(face_sizes) - face_sizes
+    ids = faces[np.repeat(face_starts - id_offsets, face_sizes) + np.arange(face_sizes.sum())]
+    face_list = np.split(ids, np.cumsum(face_sizes)[:-1])
+    bounds = np.cumsum(n_faces)
+    return [face_list[stop - n : stop] for n, stop in zip(n_faces, bounds)]
+
+
 def from_meshio(mesh):
     """Convert a ``meshio`` mesh instance to a PyVista mesh."""
     try:  # meshio<5.0 compatibility
@@ -477,11 +563,16 @@ def from_meshio(mesh):
     cells = []
     cell_type = []
     for c in mesh.cells:
-        vtk_type = meshio_to_vtk_type[c.type]
-        numnodes = vtk_type_to_numnodes[vtk_type]
-        fill_values = np.full((len(c.data), 1), numnodes, dtype=c.data.dtype)
-        cells.append(np.hstack((fill_values, c.data)).ravel())
-        cell_type += [vtk_type] * len(c.data)
+        if c.type.startswith('polyhedron'):
+            vtk_type = meshio_to_vtk_type['polyhedron']
+            cells.append(_polyhedra_to_cells(c.data))
+        else:
+            vtk_type = meshio_to_vtk_type[c.type]
+            data = np.asarray(c.data)
+            numnodes = data.shape[1] if data.ndim == 2 else vtk_type_to_numnodes[vtk_type]
+            fill_values = np.full((len(data), 1), numnodes, dtype=data.dtype)
+            cells.append(np.hstack((fill_values, data.reshape(len(data), -1))).ravel())
+        cell_type.append(np.full(len(c.data), vtk_type, dtype=np.uint8))
 
     # Extract cell data from meshio.Mesh object
     cell_data = {k: np.concatenate(v) for k, v in mesh.cell_data.items()}
@@ -495,8 +586,8 @@ def from_meshio(mesh):
         points = np.hstack((points, zero_points))
 
     grid = pyvista.UnstructuredGrid(
-        np.concatenate(cells).astype(np.int64, copy=False),
-        np.array(cell_type),
+        np.concatenate(cells).astype(np.int64, copy=False) if cells else np.empty(0, np.int64),
+        np.concatenate(cell_type) if cell_type else np.empty(0, np.uint8),
         np.array(points, np.float64),
     )
 
@@ -562,9 +653,13 @@ def save_meshio(filename, mesh, file_format=None, **kwargs):
 
     try:  # for meshio<5.0 compatibility
         from meshio.vtk._vtk import vtk_to_meshio_type
+
+        polygon_type = 'polygon{}'
     except:  # noqa: E722 pragma: no cover
         from meshio._vtk_common import vtk_to_meshio_type
 
+        polygon_type = 'polygon'
+
     # Make sure relative paths will work
     filename = os.path.abspath(os.path.expanduser(str(filename)))
 
@@ -574,46 +669,45 @@ def save_meshio(filename, mesh, file_format=None, **kwargs):
 
     # Copy useful arrays to avoid repeated calls to properties
     vtk_offset = mesh.offset
-    vtk_cells = mesh.cells
+    vtk_connectivity = mesh.cell_connectivity
     vtk_cell_type = mesh.celltypes
+    vtk_cell_size = np.diff(vtk_offset)
 
     # Check that meshio supports all cell types in input mesh
-    pixel_voxel = {8, 11}  # Handle pixels and voxels
+    pixel_voxel = {8: [0, 1, 3, 2], 11: [0, 1, 3, 2, 4, 5, 7, 6]}  # Handle pixels and voxels
     for cell_type in np.unique(vtk_cell_type):
         if cell_type not in vtk_to_meshio_type.keys() and cell_type not in pixel_voxel:
             raise TypeError(f"meshio does not support VTK type {cell_type}.")
 
-    # Get cells
+    # Get cells as blocks of consecutive cells of the same type and size
+    breaks = (vtk_cell_type[1:] != vtk_cell_type[:-1]) | (vtk_cell_size[1:] != vtk_cell_size[:-1])
+    blocks = np.concatenate(([0], np.flatnonzero(breaks) + 1, [len(vtk_cell_type)]))
     cells = []
-    c = 0
-    for offset, cell_type in zip(vtk_offset, vtk_cell_type):
-        numnodes = vtk_cells[offset + c]
-        cell = vtk_cells[offset + 1 + c : offset + 1 + c + numnodes]
-        c += 1
-        cell = (
-            cell
-            if cell_type not in pixel_voxel
-            else cell[[0, 1, 3, 2]]
-            if cell_type == 8
-            else cell[[0, 1, 3, 2, 4, 5, 7, 6]]
+    for start, stop in zip(blocks[:-1], blocks[1:]):
+        if start == stop:
+            continue
+        cell_type = vtk_cell_type[start]
+        numnodes = vtk_cell_size[start]
+        if cell_type == 42:
+            polyhedra = _cells_to_polyhedra(mesh, np.arange(start, stop))
+            cells.append((f"polyhedron{numnodes}", polyhedra))
+            continue
+        cell = vtk_connectivity[vtk_offset[start] : vtk_offset[stop]]
+        cell = cell.reshape(stop - start, numnodes)
+        if cell_type in pixel_voxel:
+            cell = cell[:, pixel_voxel[cell_type]]
+            cell_type += 1
+        cell_type = (
+            vtk_to_meshio_type[cell_type] if cell_type != 7 else polygon_type.format(numnodes)
         )
-        cell_type = cell_type if cell_type not in pixel_voxel else cell_type + 1
-        cell_type = vtk_to_meshio_type[cell_type] if cell_type != 7 else f"polygon{numnodes}"
-
-        if len(cells) > 0 and cells[-1][0] == cell_type:
-            cells[-1][1].append(cell)
-        else:
-            cells.append((cell_type, [cell]))
-
-    for k, c in enumerate(cells):
-        cells[k] = (c[0], np.array(c[1]))
+        cells.append((cell_type, cell))
 
     # Get point data
     point_data = {k.replace(" ", "_"): v for k, v in mesh.point_data.items()}
 
     # Get cell data
     vtk_cell_data = mesh.cell_data
-    n_cells = np.cumsum([len(c[1]) for c in cells[:-1]])
+    n_cells = blocks[1:-1]
     cell_data = (
         {k.replace(" ", "_"): np.split(v, n_cells) for k, v in vtk_cell_data.items()}
         if vtk_cell_data
@@ -632,6 +726,205 @@ def save_meshio(filename, mesh, file_format=None, **kwargs):
     )
 
 
+# name of the JSON header of the pvnpy format
+_PVNPY_HEADER = 'header.json'
+_PVNPY_VERSION = 1
+
+
+def save_pvnpy(filename, dataobject):
+    """Save a data object in the memory-mappable ``.pvnpy`` format.
+
+    The ``.pvnpy`` format is a directory containing a small JSON header
+    describing the data object and one raw ``.npy`` file for each of the
+    points, cell connectivity, offsets and types, and each data array.
+    It can be read with :func:`pyvista.read_pvnpy` without parsing or
+    copying the arrays.
+
+    A ``.pvnpy`` directory archived without compression, for example with
+    ``zip -0 -r mesh.zip mesh.pvnpy``, can also be read and memory mapped.
+
+    .. versionadded:: 0.40.0
+
+    Parameters
+    ----------
+    filename : str | pathlib.Path
+        Path of the directory to write. Existing ``.npy`` files written
+        by a previous save in this directory are replaced.
+
+    dataobject : pyvista.DataObject
+        Dataset, table or composite dataset to save.
+
+    Examples
+    --------
+    >>> import pyvista
+    >>> sphere = pyvista.Sphere()
+    >>> pyvista.save_pvnpy('sphere.pvnpy', sphere)  # doctest:+SKIP
+
+    """
+    from . import serialization
+
+    path = pathlib.Path(_process_filename(filename))
+    if path.exists() and not path.is_dir():
+        raise FileExistsError(f'{path} exists and is not a directory.')
+    path.mkdir(parents=True, exist_ok=True)
+    for old in path.glob('*.npy'):
+        if old.stem.isdigit():
+            old.unlink()
+
+    n_arrays = 0
+
+    def encode(value):
+        nonlocal n_arrays
+        if isinstance(value, _vtk.vtkDataObject):
+            value._store_metadata()
+            state = serialization.to_arrays(value)
+            value._restore_metadata()
+            return {'type': type(value).__name__, 'state': encode(state)}
+        if isinstance(value, np.ndarray):
+            if value.dtype.hasobject:
+                return {'strings': value.tolist()}
+            array_name = f'{n_arrays}.npy'
+            np.save(path / array_name, value, allow_pickle=False)
+            n_arrays += 1
+            return {'array': array_name}
+        if isinstance(value, dict):
+            return {'dict': [[encode(key), encode(item)] for key, item in value.items()]}
+        if isinstance(value, tuple):
+            return {'tuple': [encode(item) for item in value]}
+        if isinstance(value, list):
+            return [encode(item) for item in value]
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    header = {'version': _PVNPY_VERSION, 'dataobject': encode(dataobject)}
+    with open(path / _PVNPY_HEADER, 'w') as fid:
+        json.dump(header, fid)
+
+
+def _load_npy(filename, offset=0, mmap=True):
+    """Load or memory map a ``.npy`` file starting at ``offset`` in a file."""
+    with open(filename, 'rb') as fid:
+        fid.seek(offset)
+        version = np.lib.format.read_magic(fid)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(fid)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(fid)
+        order = 'F' if fortran_order else 'C'
+        count = int(np.prod(shape, dtype=np.int64))
+        if mmap and count:
+            # copy-on-write, as VTK may modify the arrays it wraps
+            return np.memmap(
+                filename, dtype=dtype, mode='c', offset=fid.tell(), shape=shape, order=order
+            )
+        array = np.fromfile(fid, dtype=dtype, count=count)
+    return array.reshape(shape, order=order)
+
+
+def read_pvnpy(filename, mmap=True):
+    """Read a data object saved in the ``.pvnpy`` format.
+
+    With ``mmap=True``, the arrays of the data object are memory mapped
+    rather than read, so that reading takes a time independent of the size
+    of the arrays and only the parts of the arrays which are accessed are
+    loaded from disk. The mapping is copy-on-write: modifying the data
+    object does not modify the file.
+
+    .. versionadded:: 0.40.0
+
+    Parameters
+    ----------
+    filename : str | pathlib.Path
+        Path of a ``.pvnpy`` directory written by
+        :func:`pyvista.save_pvnpy`, or of a zip archive of such a
+        directory. Compressed arrays of zip archives are read into
+        memory.
+
+    mmap : bool, default: True
+        Memory map the arrays instead of reading them.
+
+    Returns
+    -------
+    pyvista.DataObject
+        Data object saved in the file.
+
+    Examples
+    --------
+    Save and memory map a sphere.
+
+    >>> import pyvista
+    >>> sphere = pyvista.Sphere()
+    >>> sphere.save('sphere.pvnpy')  # doctest:+SKIP
+    >>> mesh = pyvista.read_pvnpy('sphere.pvnpy')  # doctest:+SKIP
+
+    """
+    from . import serialization
+
+    path = pathlib.Path(_process_filename(filename))
+    if path.is_dir():
+        with open(path / _PVNPY_HEADER) as fid:
+            header = json.load(fid)
+
+        def load(array_name):
+            return _load_npy(path / array_name, mmap=mmap)
+
+    elif zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            members = {info.filename: info for info in archive.infolist()}
+            header_names = [name for name in members if name.rsplit('/', 1)[-1] == _PVNPY_HEADER]
+            if len(header_names) != 1:
+                raise ValueError(f'{path} is not a zip archive of a .pvnpy directory.')
+            prefix = header_names[0][: -len(_PVNPY_HEADER)]
+            header = json.loads(archive.read(header_names[0]))
+
+            def load(array_name):
+                info = members[prefix + array_name]
+                if info.compress_type != zipfile.ZIP_STORED or not mmap:
+                    with zipfile.ZipFile(path) as archive:
+                        with archive.open(info) as fid:
+                            return np.lib.format.read_array(fid, allow_pickle=False)
+                # the data of a stored member follows its local file header
+                with open(path, 'rb') as fid:
+                    fid.seek(info.header_offset)
+                    local_header = fid.read(30)
+                name_length = int.from_bytes(local_header[26:28], 'little')
+                extra_length = int.from_bytes(local_header[28:30], 'little')
+                offset = info.header_offset + 30 + name_length + extra_length
+                return _load_npy(path, offset=offset, mmap=True)
+
+    elif path.exists():
+        raise ValueError(f'{path} is neither a .pvnpy directory nor a zip archive.')
+    else:
+        raise FileNotFoundError(f'File ({path}) not found')
+
+    if header.get('version', 0) > _PVNPY_VERSION:
+        raise ValueError(
+            f'{path} was written with version {header["version"]} of the pvnpy format, '
+            f'which is newer than the supported version {_PVNPY_VERSION}.'
+        )
+
+    def decode(value):
+        if isinstance(value, list):
+            return [decode(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        if 'array' in value:
+            return load(value['array'])
+        if 'strings' in value:
+            return np.array(value['strings'], dtype=object)
+        if 'dict' in value:
+            return {decode(key): decode(item) for key, item in value['dict']}
+        if 'tuple' in value:
+            return tuple(decode(item) for item in value['tuple'])
+        dataobject = getattr(pyvista, value['type'])()
+        serialization.from_arrays(dataobject, decode(value['state']))
+        dataobject._restore_metadata()
+        return dataobject
+
+    return decode(header['dataobject'])
+
+
 def _process_filename(filename):
     return os.path.abspath(os.path.expanduser(str(filename)))
 
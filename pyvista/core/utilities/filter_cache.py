@@ -0,0 +1,292 @@
+"""Process-wide cache of filter outputs."""
+import collections
+import functools
+import inspect
+import threading
+from typing import NamedTuple, Optional
+import weakref
+
+import numpy as np
+
+import pyvista
+
+# arguments which do not change the output of a filter
+_IGNORED_ARGUMENTS = {'progress_bar', 'workers'}
+
+# largest array argument hashed into a cache key, in bytes
+_MAX_ARRAY_NBYTES = 1024**2
+
+
+class _FilterCacheInfo(NamedTuple):
+    """Statistics of the filter cache."""
+
+    hits: int
+    misses: int
+    n_items: int
+    nbytes: int
+    max_bytes: int
+
+
+class _Uncacheable(Exception):
+    """Raised when the arguments of a filter cannot be used as a cache key."""
+
+
+def _normalize(value):
+    """Return a hashable representation of a filter argument."""
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject or value.nbytes > _MAX_ARRAY_NBYTES:
+            raise _Uncacheable
+        return ('ndarray', value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_normalize(item) for item in value))
+    if isinstance(value, dict):
+        return ('dict', tuple(sorted((key, _normalize(item)) for key, item in value.items())))
+    if hasattr(value, 'GetMTime'):
+        # VTK objects, for instance implicit functions or other datasets
+        return ('vtk', id(value), value.GetMTime())
+    try:
+        hash(value)
+    except TypeError:
+        raise _Uncacheable from None
+    return value
+
+
+class _FilterCache:
+    """Least recently used cache of filter outputs under a byte budget."""
+
+    def __init__(self):
+        self.max_bytes = 0
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        # key -> (weak reference to the input or None, output, size in bytes)
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+        # id of a returned output -> (weak reference to it, key, modification time)
+        self._sources: dict = {}
+        # reentrant since the weak reference callbacks may run while locked
+        self._lock = threading.RLock()
+
+    def get(self, key, dataset):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[0] is None or entry[0]() is dataset):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def put(self, key, dataset, output):
+        nbytes = output.actual_memory_size * 1024
+        if nbytes > self.max_bytes:
+            return False
+        with self._lock:
+            self.discard(key)
+            ref = None
+            if dataset is not None:
+                ref = weakref.ref(dataset, lambda _, key=key: self.discard(key))
+            self._entries[key] = (ref, output, nbytes)
+            self.nbytes += nbytes
+            self.evict(self.max_bytes)
+        return True
+
+    def tag(self, output, key):
+        # the callback only drops the tag of the output it was created for
+        def release(ref, ident=id(output)):
+            with self._lock:
+                if ident in self._sources and self._sources[ident][0] is ref:
+                    del self._sources[ident]
+
+        with self._lock:
+            self._sources[id(output)] = (weakref.ref(output, release), key, output.GetMTime())
+
+    def source(self, dataset):
+        with self._lock:
+            source = self._sources.get(id(dataset))
+        if source is not None and source[0]() is dataset and source[2] == dataset.GetMTime():
+            return source[1]
+        return None
+
+    def discard(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.nbytes -= entry[2]
+
+    def evict(self, max_bytes):
+        with self._lock:
+            while self._entries and self.nbytes > max_bytes:
+                _, (_, _, nbytes) = self._entries.popitem(last=False)
+                self.nbytes -= nbytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sources.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return _FilterCacheInfo(
+                self.hits, self.misses, len(self._entries), self.nbytes, self.max_bytes
+            )
+
+
+_filter_cache = _FilterCache()
+
+
+def set_filter_cache(max_bytes: Optional[int] = 256 * 1024**2):
+    """Enable or disable the cache of filter outputs.
+
+    When enabled, the outputs of the most common filters, such as
+    :func:`pyvista.DataSetFilters.extract_surface`,
+    :func:`pyvista.DataSetFilters.threshold`,
+    :func:`pyvista.DataSetFilters.contour` or
+    :func:`pyvista.PolyDataFilters.compute_normals`, are cached for the
+    whole process. Calling a filter again on the same unmodified dataset
+    with the same arguments returns a deep copy of the cached output
+    instead of running the filter. The cache holds its own copy of each
+    output, so the returned outputs can be modified in place without
+    affecting the following calls, at the cost of copying their arrays.
+
+    A dataset is considered modified when its modification time changes,
+    see :func:`pyvista.DataObject.Modified`. Arrays modified in place
+    through NumPy do not update the modification time of the dataset.
+
+    The least recently used outputs are evicted so that their total
+    :attr:`pyvista.DataObject.actual_memory_size` stays within
+    ``max_bytes``.
+
+    .. versionadded:: 0.40.0
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Memory budget of the cache in bytes. ``None`` or ``0`` disables
+        the cache and releases all cached outputs.
+
+    Examples
+    --------
+    Enable a cache of 64 MiB and run the same filter twice.
+
+    >>> import pyvista as pv
+    >>> pv.set_filter_cache(64 * 1024**2)
+    >>> mesh = pv.Sphere()
+    >>> normals = mesh.compute_normals()
+    >>> normals = mesh.compute_normals()
+    >>> pv.filter_cache_info().hits
+    1
+
+    Disable the cache.
+
+    >>> pv.set_filter_cache(None)
+
+    """
+    max_bytes = int(max_bytes or 0)
+    if max_bytes < 0:
+        raise ValueError('`max_bytes` must be positive.')
+    _filter_cache.max_bytes = max_bytes
+    if max_bytes:
+        _filter_cache.evict(max_bytes)
+    else:
+        _filter_cache.clear()
+
+
+def filter_cache_info():
+    """Return the statistics of the filter cache.
+
+    .. versionadded:: 0.40.0
+
+    Returns
+    -------
+    tuple
+        Named tuple with the number of ``hits`` and ``misses`` of the
+        cache, the number of cached outputs ``n_items``, their total
+        size ``nbytes`` and the memory budget ``max_bytes`` in bytes.
+
+    Examples
+    --------
+    >>> import pyvista as pv
+    >>> pv.filter_cache_info()
+    _FilterCacheInfo(hits=0, misses=0, n_items=0, nbytes=0, max_bytes=0)
+
+    """
+    return _filter_cache.info()
+
+
+def clear_filter_cache():
+    """Release all the outputs of the filter cache and reset its statistics.
+
+    .. versionadded:: 0.40.0
+
+    Examples
+    --------
+    >>> import pyvista as pv
+    >>> pv.clear_filter_cache()
+
+    """
+    _filter_cache.clear()
+
+
+def _source(dataset):
+    """Return the key identifying the content of a dataset and its owner.
+
+    Outputs returned by the cache are identified by the key of the filter
+    which produced them while they are not modified, so that chains of
+    filters are cached as well. Other datasets are identified by their
+    identity and modification time, and are owned by the cache entries.
+    """
+    source = _filter_cache.source(dataset)
+    if source is not None:
+        return source, None
+    return (id(dataset), dataset.GetMTime()), dataset
+
+
+def _cached_filter(func):
+    """Cache the output of a filter method when the filter cache is enabled."""
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not _filter_cache.max_bytes or isinstance(self, pyvista.MultiBlock):
+            return func(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        del arguments[next(iter(signature.parameters))]
+        if arguments.get('inplace'):
+            return func(self, *args, **kwargs)
+        try:
+            params = _normalize(
+                {key: value for key, value in arguments.items() if key not in _IGNORED_ARGUMENTS}
+            )
+        except _Uncacheable:
+            return func(self, *args, **kwargs)
+
+        source, owner = _source(self)
+        key = (func.__qualname__, source, params)
+        output = _filter_cache.get(key, owner)
+        if output is not None:
+            # the arrays of the cached output are never shared, so that
+            # modifying a returned output does not modify the cache
+            output = output.copy(deep=True)
+        else:
+            output = func(self, *args, **kwargs)
+            if not isinstance(output, pyvista.DataObject):
+                return output
+            # some filters set the default active scalars of their input
+            source, owner = _source(self)
+            key = (func.__qualname__, source, params)
+            if _filter_cache.put(key, owner, output):
+                output = output.copy(deep=True)
+        _filter_cache.tag(output, key)
+        return output
+
+    return wrapper
@@ -1,8 +1,10 @@
 """Miscellaneous core utilities."""
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 import enum
 from functools import lru_cache
 import importlib
+import os
 import sys
 import threading
 import traceback
@@ -163,6 +165,53 @@ class conditional_decorator:
         return self.decorator(func)
 
 
+def _resolve_workers(workers):
+    """Return the number of worker threads to use.
+
+    ``None`` or ``1`` use the calling thread and ``-1`` uses one thread per CPU.
+    """
+    if workers is None:
+        return 1
+    if workers == -1:
+        return os.cpu_count() or 1
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError('`workers` must be a positive integer or -1.')
+    return workers
+
+
+def _map_chunks(func, n_items, workers=1, chunk_size=65536):
+    """Evaluate ``func(start, stop)`` over contiguous chunks of ``n_items``.
+
+    Parameters
+    ----------
+    func : callable
+        Function called with the start and stop index of each chunk.
+
+    n_items : int
+        Total number of items.
+
+    workers : int, default: 1
+        Number of threads used to evaluate the chunks. ``-1`` uses
+        one thread per CPU.
+
+    chunk_size : int, default: 65536
+        Maximum number of items per chunk.
+
+    Returns
+    -------
+    list
+        Results of ``func`` for each chunk, in order.
+
+    """
+    workers = _resolve_workers(workers)
+    n_chunks = max(-(-n_items // chunk_size), workers if n_items >= workers else 1)
+    bounds = [(n_items * i // n_chunks, n_items * (i + 1) // n_chunks) for i in range(n_chunks)]
+    if workers == 1 or n_chunks == 1:
+        return [func(start, stop) for start, stop in bounds]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda bound: func(*bound), bounds))
+
+
 def _check_range(value, rng, parm_name):
     """Check if a parameter is within a range."""
     if value < rng[0] or value > rng[1]:
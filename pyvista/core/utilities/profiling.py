@@ -0,0 +1,309 @@
+"""Profile the execution of filters."""
+import contextlib
+import inspect
+import json
+import os
+import threading
+import time
+from typing import Callable, List, NamedTuple, Optional
+
+import numpy as np
+
+import pyvista
+from pyvista.core import _vtk_core as _vtk
+
+# functions called with a ``ProfileEvent`` after each profiled step
+_hooks: tuple = ()
+_hooks_lock = threading.Lock()
+
+
+class ProfileEvent(NamedTuple):
+    """Timing and sizes of one step of a filter.
+
+    .. versionadded:: 0.40.0
+
+    Attributes
+    ----------
+    filter : str
+        Name of the public function running the algorithm, usually the
+        filter.
+    algorithm : str
+        Class name of the VTK algorithm.
+    phase : str
+        ``'update'`` for the execution of the algorithm, or ``'output'``
+        for wrapping its output and copying the metadata of the input.
+    start : float
+        Start time in seconds, see :func:`time.perf_counter`.
+    duration : float
+        Wall time of the step in seconds.
+    thread : int
+        Identifier of the thread running the step.
+    n_input_points : int
+        Number of points of the input of the algorithm.
+    n_input_cells : int
+        Number of cells of the input of the algorithm.
+    n_output_points : int
+        Number of points of the output of the algorithm.
+    n_output_cells : int
+        Number of cells of the output of the algorithm.
+    output_nbytes : int
+        Memory used by the output of the algorithm in bytes.
+
+    """
+
+    filter: str
+    algorithm: str
+    phase: str
+    start: float
+    duration: float
+    thread: int
+    n_input_points: int
+    n_input_cells: int
+    n_output_points: int
+    n_output_cells: int
+    output_nbytes: int
+
+
+def add_profile_hook(hook: Callable[[ProfileEvent], None]):
+    """Call a function after each step of every filter.
+
+    The hook is called with a :class:`ProfileEvent
+    <pyvista.core.utilities.profiling.ProfileEvent>` once the algorithm of
+    a filter has been updated, and once its output has been wrapped. Hooks
+    are called from the thread running the filter.
+
+    .. versionadded:: 0.40.0
+
+    Parameters
+    ----------
+    hook : callable
+        Function called with each event.
+
+    See Also
+    --------
+    pyvista.profile
+        Collect the events in a context.
+
+    """
+    global _hooks
+    with _hooks_lock:
+        _hooks = (*_hooks, hook)
+
+
+def remove_profile_hook(hook: Callable[[ProfileEvent], None]):
+    """Stop calling a function added with :func:`pyvista.add_profile_hook`.
+
+    .. versionadded:: 0.40.0
+
+    Parameters
+    ----------
+    hook : callable
+        Function to remove.
+
+    """
+    global _hooks
+    with _hooks_lock:
+        hooks = list(_hooks)
+        hooks.remove(hook)
+        _hooks = tuple(hooks)
+
+
+def _sizes(dataobject):
+    """Return the number of points and cells of a data object."""
+    if isinstance(dataobject, (_vtk.vtkDataSet, _vtk.vtkCompositeDataSet)):
+        return dataobject.GetNumberOfPoints(), dataobject.GetNumberOfCells()
+    return 0, 0
+
+
+def _filter_name(frame):
+    """Return the name of the public function running a filter.
+
+    Private helpers, such as ``DataSetFilters._clip_with_function`` called
+    by :func:`pyvista.DataSetFilters.clip`, are skipped.
+
+    Parameters
+    ----------
+    frame : frame
+        Frame of the function updating the algorithm or wrapping its output.
+
+    Returns
+    -------
+    str
+        Name of the first function of the stack not starting with an
+        underscore.
+
+    """
+    name = frame.f_code.co_name
+    while frame is not None:
+        if not frame.f_code.co_name.startswith('_'):
+            return frame.f_code.co_name
+        frame = frame.f_back
+    return name
+
+
+def _emit(alg, phase, start, output=None):
+    """Send an event to the hooks."""
+    duration = time.perf_counter() - start
+    # the frame of the function calling ``_update_alg`` or ``_get_output``,
+    # only inspected when profiling
+    frame = inspect.currentframe().f_back.f_back
+    try:
+        name = _filter_name(frame)
+    finally:
+        del frame
+    inp = None
+    if alg.GetNumberOfInputPorts() and alg.GetNumberOfInputConnections(0):
+        inp = alg.GetInputDataObject(0, 0)
+    if output is None and alg.GetNumberOfOutputPorts():
+        output = alg.GetOutputDataObject(0)
+    event = ProfileEvent(
+        name,
+        alg.GetClassName(),
+        phase,
+        start,
+        duration,
+        threading.get_ident(),
+        *_sizes(inp),
+        *_sizes(output),
+        output.GetActualMemorySize() * 1024 if output is not None else 0,
+    )
+    for hook in _hooks:
+        hook(event)
+
+
+class Profile:
+    """Events collected by :func:`pyvista.profile`.
+
+    .. versionadded:: 0.40.0
+
+    """
+
+    def __init__(self):
+        """Initialize an empty profile."""
+        self.events: List[ProfileEvent] = []
+
+    def __call__(self, event: ProfileEvent):
+        """Collect an event."""
+        self.events.append(event)
+
+    def __repr__(self) -> str:
+        """Return the representation of the profile."""
+        total = sum(event.duration for event in self.events)
+        return f'{type(self).__name__}({len(self.events)} events, {total:.3f} s)'
+
+    def to_table(self):
+        """Return the events as a table.
+
+        Returns
+        -------
+        pyvista.Table
+            Table with one row for each event and one column for each
+            field of :class:`ProfileEvent
+            <pyvista.core.utilities.profiling.ProfileEvent>`.
+
+        """
+        table = pyvista.Table()
+        for i, field in enumerate(ProfileEvent._fields):
+            values = [event[i] for event in self.events]
+            if field in ('filter', 'algorithm', 'phase'):
+                table[field] = np.array(values, dtype=str)
+            elif field in ('start', 'duration'):
+                table[field] = np.array(values, dtype=float)
+            else:
+                table[field] = np.array(values, dtype=np.int64)
+        return table
+
+    def to_chrome_trace(self, filename: Optional[str] = None) -> dict:
+        """Return the events in the Chrome trace event format.
+
+        The trace can be opened in ``chrome://tracing`` or in Perfetto.
+
+        Parameters
+        ----------
+        filename : str, optional
+            Also write the trace to this JSON file.
+
+        Returns
+        -------
+        dict
+            Trace with one complete event per profiled step.
+
+        """
+        origin = min((event.start for event in self.events), default=0.0)
+        trace = {
+            'traceEvents': [
+                {
+                    'name': event.filter,
+                    'cat': event.phase,
+                    'ph': 'X',
+                    'ts': (event.start - origin) * 1e6,
+                    'dur': event.duration * 1e6,
+                    'pid': os.getpid(),
+                    'tid': event.thread,
+                    'args': {
+                        key: value
+                        for key, value in event._asdict().items()
+                        if key not in ('filter', 'phase', 'start', 'duration', 'thread')
+                    },
+                }
+                for event in self.events
+            ],
+            'displayTimeUnit': 'ms',
+        }
+        if filename is not None:
+            with open(filename, 'w') as f:
+                json.dump(trace, f)
+        return trace
+
+
+@contextlib.contextmanager
+def profile():
+    """Profile the filters run within a context.
+
+    The time spent updating the VTK algorithm of each filter and wrapping
+    its output is recorded, along with the sizes of the input and output
+    of the algorithm. Filters run in other threads while the context is
+    active are recorded as well.
+
+    .. versionadded:: 0.40.0
+
+    Yields
+    ------
+    pyvista.Profile
+        Collected events, which can be exported with
+        :func:`pyvista.Profile.to_table` or
+        :func:`pyvista.Profile.to_chrome_trace`.
+
+    See Also
+    --------
+    pyvista.add_profile_hook
+        Process the events of all filters with a custom function.
+
+    Examples
+    --------
+    Profile a chain of filters and show the time spent in each step.
+
+    >>> import pyvista as pv
+    >>> from pyvista import examples
+    >>> mesh = examples.load_uniform()
+    >>> with pv.profile() as prof:
+    ...     surface = mesh.threshold(300).extract_surface()
+    ...
+    >>> table = prof.to_table()
+    >>> table['filter']
+    pyvista_ndarray(['threshold', 'threshold', 'extract_surface',
+                     'extract_surface'], dtype='<U15')
+    >>> table['phase']
+    pyvista_ndarray(['update', 'output', 'update', 'output'], dtype='<U6')
+
+    Save the events as a Chrome trace.
+
+    >>> _ = prof.to_chrome_trace('trace.json')  # doctest:+SKIP
+
+    """
+    collector = Profile()
+    add_profile_hook(collector)
+    try:
+        yield collector
+    finally:
+        remove_profile_hook(collector)
@@ -0,0 +1,273 @@
+"""Batched ray tracing over a bounding volume hierarchy of triangles.
+
+The hierarchy is a complete binary tree built by splitting the triangles of
+each node evenly at the median of their centroids, so that it is built and
+traversed with array operations only. Rays are traversed one tree level at a time as arrays
+of ``(ray, node)`` pairs, in chunks of rays which are optionally evaluated in
+parallel threads.
+
+"""
+import numpy as np
+
+from pyvista.core import _vtk_core as _vtk
+
+from .misc import _map_chunks
+
+# number of triangles in each leaf of the hierarchy
+_LEAF_SIZE = 8
+
+# number of rays traversed at once, which bounds the memory used by the pairs
+_CHUNK_SIZE = 4096
+
+
+def _triangle_soup(mesh):
+    """Return the triangles of the polygons and strips of a surface.
+
+    Parameters
+    ----------
+    mesh : pyvista.PolyData
+        Surface to triangulate. Vertices and lines are ignored.
+
+    Returns
+    -------
+    numpy.ndarray
+        Coordinates of the vertices of each triangle with shape
+        ``(n_triangles, 3, 3)``.
+
+    numpy.ndarray
+        Index of the cell of ``mesh`` each triangle belongs to.
+
+    """
+    polys = mesh.GetPolys()
+    n_other = mesh.GetNumberOfVerts() + mesh.GetNumberOfLines()
+    if (
+        mesh.GetNumberOfStrips() == 0
+        and polys.GetNumberOfConnectivityIds() == 3 * polys.GetNumberOfCells()
+    ):
+        connectivity = _vtk.vtk_to_numpy(polys.GetConnectivityArray()).reshape(-1, 3)
+        cell_ids = np.arange(n_other, n_other + connectivity.shape[0])
+        return np.asarray(mesh.points, dtype=float)[connectivity], cell_ids
+
+    # triangulate a structural copy carrying the original cell ids
+    structure = _vtk.vtkPolyData()
+    structure.CopyStructure(mesh)
+    ids = _vtk.numpy_to_vtk(np.arange(mesh.GetNumberOfCells(), dtype=np.int64), deep=True)
+    ids.SetName('vtkOriginalCellIds')
+    structure.GetCellData().AddArray(ids)
+
+    alg = _vtk.vtkTriangleFilter()
+    alg.SetInputData(structure)
+    alg.PassVertsOff()
+    alg.PassLinesOff()
+    alg.Update()
+    output = alg.GetOutput()
+    if output.GetNumberOfCells() == 0:
+        return np.empty((0, 3, 3)), np.empty(0, dtype=np.int64)
+
+    connectivity = _vtk.vtk_to_numpy(output.GetPolys().GetConnectivityArray()).reshape(-1, 3)
+    points = _vtk.vtk_to_numpy(output.GetPoints().GetData()).astype(float, copy=False)
+    cell_ids = _vtk.vtk_to_numpy(output.GetCellData().GetArray('vtkOriginalCellIds'))
+    return points[connectivity], cell_ids.astype(np.int64, copy=False)
+
+
+def _segments(n_items, level):
+    """Return the node of each item when splitting items evenly ``level`` times."""
+    starts = n_items * np.arange(1 << level) // (1 << level)
+    return np.repeat(np.arange(1 << level), np.diff(starts, append=n_items))
+
+
+class _RayBVH:
+    """Bounding volume hierarchy over a soup of triangles.
+
+    Parameters
+    ----------
+    triangles : numpy.ndarray
+        Coordinates of the vertices of each triangle with shape
+        ``(n_triangles, 3, 3)``.
+
+    cell_ids : numpy.ndarray
+        Index returned for the hits of each triangle.
+
+    leaf_size : int, default: 8
+        Number of triangles in each leaf.
+
+    """
+
+    def __init__(self, triangles, cell_ids, leaf_size=_LEAF_SIZE):
+        """Build the hierarchy."""
+        n_triangles = triangles.shape[0]
+        self.leaf_size = leaf_size
+        self.n_triangles = n_triangles
+        self.depth = int(np.ceil(np.log2(max(-(-n_triangles // leaf_size), 1))))
+        n_slots = leaf_size << self.depth
+
+        # split the triangles of each node at the median of their centroids
+        # along the longest axis, one level at a time
+        centroids = (triangles[:, 0] + triangles[:, 1] + triangles[:, 2]) / 3
+        order = np.arange(n_triangles)
+        for level in range(self.depth):
+            segment = _segments(n_triangles, level)
+            starts = np.flatnonzero(np.diff(segment, prepend=-1))
+            sorted_centroids = centroids[order]
+            lower = np.minimum.reduceat(sorted_centroids, starts)
+            extent = np.maximum.reduceat(sorted_centroids, starts) - lower
+            axis = np.argmax(extent, axis=1)
+            extent = extent[np.arange(axis.size), axis]
+            extent[extent == 0] = 1.0
+            # sorting the segment plus the position within its extent is much
+            # faster than sorting both keys with lexsort
+            position = sorted_centroids[np.arange(n_triangles), axis[segment]]
+            position = (position - lower[segment, axis[segment]]) / extent[segment]
+            order = order[np.argsort(segment + 0.5 * position)]
+        triangles = triangles[order]
+
+        lower = np.minimum(np.minimum(triangles[:, 0], triangles[:, 1]), triangles[:, 2])
+        upper = np.maximum(np.maximum(triangles[:, 0], triangles[:, 1]), triangles[:, 2])
+        if n_triangles:
+            diagonal = np.linalg.norm(upper.max(axis=0) - lower.min(axis=0))
+        else:
+            diagonal = 0.0
+        # distance below which hits of the same ray are merged, and padding
+        # of the boxes making them robust to rounding
+        self.tolerance = max(diagonal * 1e-9, np.finfo(float).tiny)
+
+        # each leaf holds up to ``leaf_size`` triangles, and the remaining
+        # slots hold degenerate triangles which are never hit
+        segment = _segments(n_triangles, self.depth)
+        first = np.flatnonzero(np.diff(segment, prepend=-1))
+        slots = leaf_size * segment + np.arange(n_triangles) - first[segment]
+        self.origins = np.zeros((n_slots, 3))
+        self.edges1 = np.zeros((n_slots, 3))
+        self.edges2 = np.zeros((n_slots, 3))
+        self.cell_ids = np.full(n_slots, -1, dtype=np.int64)
+        self.origins[slots] = triangles[:, 0]
+        self.edges1[slots] = triangles[:, 1] - triangles[:, 0]
+        self.edges2[slots] = triangles[:, 2] - triangles[:, 0]
+        self.cell_ids[slots] = np.asarray(cell_ids)[order]
+
+        # bounds of the nodes of each level, from the leaves to the root,
+        # with each axis stored contiguously which is faster to gather
+        first_lower = np.minimum.reduceat(lower - self.tolerance, first)
+        first_upper = np.maximum.reduceat(upper + self.tolerance, first)
+        self.lower = [np.ascontiguousarray(first_lower.T)]
+        self.upper = [np.ascontiguousarray(first_upper.T)]
+        for _ in range(self.depth):
+            self.lower.insert(0, np.minimum(self.lower[0][:, ::2], self.lower[0][:, 1::2]))
+            self.upper.insert(0, np.maximum(self.upper[0][:, ::2], self.upper[0][:, 1::2]))
+
+    def _candidates(self, origins, inverse, t_max):
+        """Return the pairs of rays and triangle slots whose leaves are hit."""
+        n_rays = origins.shape[0] if self.n_triangles else 0
+        rays = np.arange(n_rays)
+        nodes = np.zeros(n_rays, dtype=np.intp)
+        origins = np.ascontiguousarray(origins.T)
+        inverse = np.ascontiguousarray(inverse.T)
+        with np.errstate(invalid='ignore'):
+            for level in range(self.depth + 1):
+                lower, upper = self.lower[level], self.upper[level]
+                t_near = np.zeros(rays.size)
+                t_far = t_max[rays]
+                for axis in range(3):
+                    ray_origins = origins[axis][rays]
+                    ray_inverse = inverse[axis][rays]
+                    t_lower = (lower[axis][nodes] - ray_origins) * ray_inverse
+                    t_upper = (upper[axis][nodes] - ray_origins) * ray_inverse
+                    # the fmin and fmax ufuncs ignore the nan of rays parallel
+                    # to a slab with their origin on its plane
+                    np.fmax(t_near, np.fmin(t_lower, t_upper), out=t_near)
+                    t_far = np.fmin(t_far, np.fmax(t_lower, t_upper))
+                hit = t_near <= t_far
+                rays, nodes = rays[hit], nodes[hit]
+                if level < self.depth:
+                    rays = np.repeat(rays, 2)
+                    nodes = (2 * nodes[:, np.newaxis] + np.arange(2)).ravel()
+
+        slots = (self.leaf_size * nodes[:, np.newaxis] + np.arange(self.leaf_size)).ravel()
+        return np.repeat(rays, self.leaf_size), slots
+
+    def _intersect_chunk(self, origins, directions, t_max, first_hit):
+        """Intersect a chunk of rays with the triangles."""
+        with np.errstate(divide='ignore'):
+            inverse = 1.0 / directions
+        rays, slots = self._candidates(origins, inverse, t_max)
+
+        # Moller-Trumbore intersection of each candidate pair
+        ray_directions = directions[rays]
+        edges1 = self.edges1[slots]
+        edges2 = self.edges2[slots]
+        p = np.cross(ray_directions, edges2)
+        det = np.einsum('ij,ij->i', edges1, p)
+        valid = np.abs(det) > np.finfo(float).eps * np.einsum('ij,ij->i', edges1, edges1)
+        rays, slots, p, det = rays[valid], slots[valid], p[valid], det[valid]
+        edges1, edges2, ray_directions = edges1[valid], edges2[valid], ray_directions[valid]
+
+        s = origins[rays] - self.origins[slots]
+        q = np.cross(s, edges1)
+        u = np.einsum('ij,ij->i', s, p) / det
+        v = np.einsum('ij,ij->i', ray_directions, q) / det
+        t = np.einsum('ij,ij->i', edges2, q) / det
+        eps = 1e-10
+        hit = (u >= -eps) & (v >= -eps) & (u + v <= 1 + eps) & (t >= 0) & (t <= t_max[rays])
+        t, rays, slots = t[hit], rays[hit], slots[hit]
+
+        order = np.lexsort((t, rays))
+        t, rays, slots = t[order], rays[order], slots[order]
+        new_ray = np.ones(rays.size, dtype=bool)
+        new_ray[1:] = rays[1:] != rays[:-1]
+        if first_hit:
+            keep = new_ray
+        else:
+            # merge the hits of the triangles sharing an edge or a point
+            lengths = np.linalg.norm(directions[rays], axis=1)
+            keep = new_ray.copy()
+            keep[1:] |= (t[1:] - t[:-1]) * lengths[1:] > self.tolerance
+        return t[keep], rays[keep], self.cell_ids[slots[keep]]
+
+    def intersect(self, origins, directions, t_max=np.inf, first_hit=False, workers=1):
+        """Intersect rays with the triangles.
+
+        Parameters
+        ----------
+        origins : numpy.ndarray
+            Origin of each ray with shape ``(n_rays, 3)``.
+
+        directions : numpy.ndarray
+            Direction of each ray with shape ``(n_rays, 3)``. Points of the
+            rays are ``origins + t * directions`` for ``t >= 0``.
+
+        t_max : float | numpy.ndarray, default: numpy.inf
+            Maximum parameter ``t`` of the hits of all rays or of each ray.
+
+        first_hit : bool, default: False
+            Only return the closest hit of each ray.
+
+        workers : int, default: 1
+            Number of threads used to trace the rays. ``-1`` uses one
+            thread per CPU.
+
+        Returns
+        -------
+        numpy.ndarray
+            Parameter ``t`` of each hit.
+
+        numpy.ndarray
+            Index of the ray of each hit.
+
+        numpy.ndarray
+            Cell index of the triangle of each hit.
+
+        Hits are sorted by ray and by increasing ``t``.
+
+        """
+        origins = np.asarray(origins, dtype=float)
+        directions = np.asarray(directions, dtype=float)
+        t_max = np.broadcast_to(np.asarray(t_max, dtype=float), origins.shape[:1])
+
+        def trace_chunk(start, stop):
+            t, rays, cells = self._intersect_chunk(
+                origins[start:stop], directions[start:stop], t_max[start:stop], first_hit
+            )
+            return t, rays + start, cells
+
+        results = _map_chunks(trace_chunk, origins.shape[0], workers, chunk_size=_CHUNK_SIZE)
+        return tuple(np.concatenate(arrays) for arrays in zip(*results))
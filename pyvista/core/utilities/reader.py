@@ -1,11 +1,15 @@
 """Fine-grained control of reading data files."""
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import enum
 from functools import wraps
 import importlib
 import os
 import pathlib
+import queue
+import threading
 from typing import Any, Callable, List, Union
 from xml.etree import ElementTree
 
@@ -15,7 +19,7 @@ import pyvista
 
 from .fileio import _get_ext_force, _process_filename
 from .helpers import wrap
-from .misc import abstract_class
+from .misc import _resolve_workers, abstract_class
 
 HDF_HELP = 'https://kitware.github.io/vtk-examples/site/VTKFileFormats/#hdf-file-formats'
 
@@ -663,6 +667,175 @@ class TimeReader(ABC):
 
         """
 
+    def _array_selection_readers(self):
+        """Return the readers affected by a selection of point and cell arrays."""
+        return [self] if isinstance(self, PointCellDataSelection) else []
+
+    def _select_arrays(self, point_arrays=None, cell_arrays=None):
+        """Restrict the arrays read to the given point and cell arrays.
+
+        Return the previous status of the arrays of each reader.
+        """
+        status = []
+        for reader in self._array_selection_readers():
+            status.append((reader, reader.all_point_arrays_status, reader.all_cell_arrays_status))
+            for names, available, enable, disable in (
+                (
+                    point_arrays,
+                    reader.point_array_names,
+                    reader.enable_point_array,
+                    reader.disable_point_array,
+                ),
+                (
+                    cell_arrays,
+                    reader.cell_array_names,
+                    reader.enable_cell_array,
+                    reader.disable_cell_array,
+                ),
+            ):
+                if names is None:
+                    continue
+                for name in available:
+                    if name in names:
+                        enable(name)
+                    else:
+                        disable(name)
+        return status
+
+    def iter_time_steps(
+        self, start=0, stop=None, step=1, prefetch=2, point_arrays=None, cell_arrays=None
+    ):
+        """Iterate over the time steps, reading upcoming steps in the background.
+
+        While the caller processes a time step, up to ``prefetch`` of the
+        following time steps are read on a background thread, so that
+        reading from disk overlaps with the processing.
+
+        The active time value and the array selection of the reader are
+        restored once the iteration stops. The reader must not be used
+        otherwise during the iteration.
+
+        .. versionadded:: 0.40.0
+
+        Parameters
+        ----------
+        start : int, default: 0
+            Index of the first time point.
+
+        stop : int, optional
+            Index past the last time point. Defaults to
+            :attr:`number_time_points`.
+
+        step : int, default: 1
+            Step between the indices of the time points.
+
+        prefetch : int, default: 2
+            Maximum number of time steps read ahead. ``0`` reads each time
+            step when it is requested, without a background thread.
+
+        point_arrays : sequence[str], optional
+            Names of the point arrays to read. All other point arrays are
+            skipped. By default, the current selection of point arrays is
+            used. Ignored by readers that do not support array selection.
+
+        cell_arrays : sequence[str], optional
+            Names of the cell arrays to read. All other cell arrays are
+            skipped. By default, the current selection of cell arrays is
+            used. Ignored by readers that do not support array selection.
+
+        Yields
+        ------
+        float
+            Time value of the time step.
+
+        pyvista.DataSet | pyvista.MultiBlock
+            Dataset of the time step.
+
+        Examples
+        --------
+        Compute the mean of an array over all the time steps of a
+        series.
+
+        >>> import pyvista
+        >>> from pyvista import examples
+        >>> filename = examples.download_wavy(load=False)
+        >>> reader = pyvista.get_reader(filename)
+        >>> means = [
+        ...     mesh[0]['z'].mean()
+        ...     for time, mesh in reader.iter_time_steps(prefetch=4)
+        ... ]
+        >>> len(means)
+        15
+
+        """
+        if prefetch < 0:
+            raise ValueError(f'`prefetch` must be non-negative, got {prefetch}.')
+        time_points = range(self.number_time_points)[start:stop:step]
+        active_time_value = self.active_time_value
+
+        def read(time_point):
+            self.set_active_time_point(time_point)
+            status = self._select_arrays(point_arrays, cell_arrays)
+            try:
+                return self.time_point_value(time_point), self.read()
+            finally:
+                for reader, point_status, cell_status in status:
+                    for name, enabled in point_status.items():
+                        if enabled:
+                            reader.enable_point_array(name)
+                        else:
+                            reader.disable_point_array(name)
+                    for name, enabled in cell_status.items():
+                        if enabled:
+                            reader.enable_cell_array(name)
+                        else:
+                            reader.disable_cell_array(name)
+
+        if prefetch == 0:
+            try:
+                for time_point in time_points:
+                    yield read(time_point)
+            finally:
+                self.set_active_time_value(active_time_value)
+            return
+
+        steps: queue.Queue = queue.Queue(maxsize=prefetch)
+        stop_event = threading.Event()
+
+        def put(item):
+            while not stop_event.is_set():
+                try:
+                    steps.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce():
+            try:
+                for time_point in time_points:
+                    if not put((read(time_point), None)):
+                        return
+            except Exception as err:
+                put((None, err))
+                return
+            put((None, None))
+
+        thread = threading.Thread(target=produce, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item, err = steps.get()
+                if err is not None:
+                    raise err
+                if item is None:
+                    return
+                yield item
+        finally:
+            stop_event.set()
+            thread.join()
+            self.set_active_time_value(active_time_value)
+
 
 class XMLImageDataReader(BaseReader, PointCellDataSelection):
     """XML Image Data Reader for .vti files."""
@@ -1878,6 +2051,15 @@ class PVDDataSet:
     group: str
 
 
+def _read_part(reader):
+    """Read the dataset of a part and release the output kept by its reader."""
+    data = reader.read()
+    # the reader then reads the file again on the next update
+    reader.reader.GetOutputDataObject(0).Initialize()
+    reader.reader.Modified()
+    return data
+
+
 class _PVDReader(BaseVTKReader):
     """Simulate a VTK reader for PVD files."""
 
@@ -1887,11 +2069,18 @@ class _PVDReader(BaseVTKReader):
         self._datasets = None
         self._active_datasets = None
         self._time_values = None
+        self._readers = {}
+        self._cache = OrderedDict()
+        self._cache_nbytes = 0
+        self.cache_size = 0
+        self.workers = 1
 
     def SetFileName(self, filename):
         """Set filename and update reader."""
         self._filename = filename
         self._directory = os.path.join(os.path.dirname(filename))
+        self._readers = {}
+        self.ClearCache()
 
     def UpdateInformation(self):
         """Parse PVD file."""
@@ -1920,15 +2109,64 @@ class _PVDReader(BaseVTKReader):
 
     def Update(self):
         """Read data and store it."""
-        self._data_object = pyvista.MultiBlock([reader.read() for reader in self._active_readers])
+        # the array selection of the parts is part of the key, as it
+        # changes the datasets read
+        key = (self._active_datasets[0].time,) + tuple(
+            (
+                tuple(reader.all_point_arrays_status.items()),
+                tuple(reader.all_cell_arrays_status.items()),
+            )
+            if isinstance(reader, PointCellDataSelection)
+            else None
+            for reader in self._active_readers
+        )
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            # the cached datasets are never handed out, so that modifying
+            # the datasets read does not modify the cache
+            blocks = [block.copy(deep=True) for block in self._cache[key][0]]
+        else:
+            workers = min(_resolve_workers(self.workers), len(self._active_readers))
+            if workers > 1:
+                with ThreadPoolExecutor(workers) as executor:
+                    blocks = list(executor.map(_read_part, self._active_readers))
+            else:
+                blocks = [_read_part(reader) for reader in self._active_readers]
+            self._AddToCache(key, blocks)
+        self._data_object = pyvista.MultiBlock(blocks)
+
+    def _AddToCache(self, key, blocks):
+        """Cache a copy of the datasets of a time step and evict the least recently used ones."""
+        if not self.cache_size:
+            return
+        # ``actual_memory_size`` is in kibibytes
+        nbytes = sum(block.actual_memory_size for block in blocks) * 1024
+        if nbytes > self.cache_size:
+            return
+        self._cache[key] = ([block.copy(deep=True) for block in blocks], nbytes)
+        self._cache_nbytes += nbytes
+        self._EvictFromCache()
+
+    def _EvictFromCache(self):
+        """Evict the least recently used time steps exceeding the cache size."""
+        while self._cache_nbytes > self.cache_size:
+            _, (_, nbytes) = self._cache.popitem(last=False)
+            self._cache_nbytes -= nbytes
+
+    def ClearCache(self):
+        """Release the cached time steps."""
+        self._cache.clear()
+        self._cache_nbytes = 0
 
     def _SetActiveTime(self, time_value):
         """Set active time."""
         self._active_datasets = self._time_mapping[time_value]
-        self._active_readers = [
-            get_reader(os.path.join(self._directory, dataset.path))
-            for dataset in self._active_datasets
-        ]
+        self._active_readers = []
+        for dataset in self._active_datasets:
+            path = os.path.join(self._directory, dataset.path)
+            if path not in self._readers:
+                self._readers[path] = get_reader(path)
+            self._active_readers.append(self._readers[path])
 
 
 # skip pydocstyle D102 check since docstring is taken from TimeReader
@@ -1951,10 +2189,75 @@ class PVDReader(BaseReader, TimeReader):
     >>> mesh = reader.read()[0]  # MultiBlock mesh with only 1 block
     >>> mesh.plot(scalars='z')
 
+    Cache the most recently read time steps, so that going back to a
+    previous time step does not read the files again.
+
+    >>> reader.cache_size = 1024**3  # 1 GiB
+
     """
 
     _class_reader = _PVDReader
 
+    @property
+    def workers(self) -> int:
+        """Return or set the number of threads reading the parts of a time step.
+
+        ``-1`` uses up to one thread per CPU. The VTK readers hold the
+        global interpreter lock while reading, so that threads only help
+        with readers releasing it. By default, the parts are read one
+        after the other.
+
+        .. versionadded:: 0.40.0
+
+        Returns
+        -------
+        int
+            Number of threads reading the parts of a time step.
+
+        """
+        return self.reader.workers
+
+    @workers.setter
+    def workers(self, workers: int):
+        _resolve_workers(workers)
+        self.reader.workers = workers
+
+    @property
+    def cache_size(self) -> int:
+        """Return or set the maximum size in bytes of the cached time steps.
+
+        A copy of the datasets of the most recently read time steps is
+        kept in memory within this budget. The cache is disabled by
+        default, with a size of ``0``. Datasets read from the cache are
+        copies, so modifying them does not modify the cache. The cache is
+        not invalidated when the files are modified; see
+        :func:`PVDReader.clear_cache`.
+
+        .. versionadded:: 0.40.0
+
+        Returns
+        -------
+        int
+            Maximum size in bytes of the cached time steps.
+
+        """
+        return self.reader.cache_size
+
+    @cache_size.setter
+    def cache_size(self, cache_size: int):
+        if cache_size < 0:
+            raise ValueError(f'`cache_size` must be non-negative, got {cache_size}.')
+        self.reader.cache_size = cache_size
+        self.reader._EvictFromCache()
+
+    def clear_cache(self):
+        """Release the cached time steps.
+
+        .. versionadded:: 0.40.0
+
+        """
+        self.reader.ClearCache()
+
     @property
     def active_readers(self):
         """Return the active readers.
@@ -1966,6 +2269,11 @@ class PVDReader(BaseReader, TimeReader):
         """
         return self.reader._active_readers
 
+    def _array_selection_readers(self):
+        return [
+            reader for reader in self.active_readers if isinstance(reader, PointCellDataSelection)
+        ]
+
     @property
     def datasets(self):
         """Return all datasets.
@@ -0,0 +1,207 @@
+"""Decompose data objects into NumPy arrays and rebuild them without copies."""
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from pyvista.core import _vtk_core as _vtk
+
+from .arrays import array_from_vtkmatrix, convert_array, vtkmatrix_from_array
+
+_POLYDATA_CELLS = ('verts', 'lines', 'polys', 'strips')
+
+
+def _to_vtk(values: np.ndarray, name: Optional[str] = None):
+    """Wrap a NumPy array in a VTK array, sharing its memory when possible."""
+    # empty buffers received out-of-band cannot be safely shared with VTK,
+    # and VTK arrays are always writable so read-only buffers such as
+    # ``bytes`` must be copied
+    deep = values.size == 0 or not values.flags.writeable
+    return convert_array(values, name=name, deep=deep)
+
+
+def _attributes_to_arrays(attributes) -> Tuple[List[Tuple[Optional[str], np.ndarray]], Dict]:
+    """Return the name and values of each array and the active attributes."""
+    arrays = []
+    for i in range(attributes.GetNumberOfArrays()):
+        vtk_arr = attributes.GetAbstractArray(i)
+        arrays.append((vtk_arr.GetName(), convert_array(vtk_arr)))
+
+    active = {}
+    if isinstance(attributes, _vtk.vtkDataSetAttributes):
+        indices = [-1] * _vtk.vtkDataSetAttributes.NUM_ATTRIBUTES
+        attributes.GetAttributeIndices(indices)
+        active = {attr: index for attr, index in enumerate(indices) if index >= 0}
+    return arrays, active
+
+
+def _arrays_to_attributes(state, attributes):
+    """Add arrays to a ``vtkFieldData`` without copying them."""
+    arrays, active = state
+    for name, values in arrays:
+        attributes.AddArray(_to_vtk(values, name))
+    for attr, index in active.items():
+        attributes.SetActiveAttribute(index, attr)
+
+
+def _cell_array_to_arrays(cell_array) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Return the offsets and connectivity of a ``vtkCellArray``."""
+    if cell_array is None:
+        return None
+    return (
+        _vtk.vtk_to_numpy(cell_array.GetOffsetsArray()),
+        _vtk.vtk_to_numpy(cell_array.GetConnectivityArray()),
+    )
+
+
+def _arrays_to_cell_array(arrays) -> _vtk.vtkCellArray:
+    """Create a ``vtkCellArray`` sharing the memory of offsets and connectivity."""
+    offsets, connectivity = arrays
+    connectivity = connectivity.astype(offsets.dtype, copy=False)
+    cell_array = _vtk.vtkCellArray()
+    cell_array.SetData(_to_vtk(offsets), _to_vtk(connectivity))
+    # ``SetData`` shallow copies the arrays into new ones, which must keep
+    # the NumPy arrays alive in place of the temporary arrays
+    cell_array.GetOffsetsArray()._numpy_reference = offsets
+    cell_array.GetConnectivityArray()._numpy_reference = connectivity
+    return cell_array
+
+
+def to_arrays(dataobject) -> Dict[str, Any]:
+    """Decompose a data object into NumPy arrays and metadata.
+
+    The arrays share memory with the data object whenever VTK stores them
+    contiguously, so they can be pickled out-of-band or placed in shared
+    memory without an intermediate copy.
+
+    Parameters
+    ----------
+    dataobject : pyvista.DataObject
+        Data object to decompose. The blocks of a
+        :class:`pyvista.MultiBlock` are returned as they are, so that they
+        are serialized recursively.
+
+    Returns
+    -------
+    dict
+        Description of the data object which can be passed to
+        :func:`from_arrays`.
+
+    """
+    state: Dict[str, Any] = {}
+    if isinstance(dataobject, _vtk.vtkMultiBlockDataSet):
+        state['blocks'] = [
+            (dataobject.get_block_name(i), dataobject[i]) for i in range(dataobject.n_blocks)
+        ]
+    elif isinstance(dataobject, _vtk.vtkImageData):
+        state['extent'] = dataobject.GetExtent()
+        state['origin'] = dataobject.GetOrigin()
+        state['spacing'] = dataobject.GetSpacing()
+        state['direction'] = array_from_vtkmatrix(dataobject.GetDirectionMatrix())
+    elif isinstance(dataobject, _vtk.vtkRectilinearGrid):
+        state['extent'] = dataobject.GetExtent()
+        state['coordinates'] = [
+            convert_array(coords)
+            for coords in (
+                dataobject.GetXCoordinates(),
+                dataobject.GetYCoordinates(),
+                dataobject.GetZCoordinates(),
+            )
+        ]
+    elif isinstance(dataobject, _vtk.vtkPointSet):
+        vtk_points = dataobject.GetPoints()
+        if vtk_points is not None:
+            state['points'] = convert_array(vtk_points.GetData())
+        if isinstance(dataobject, _vtk.vtkPolyData):
+            state['cells'] = {
+                name: _cell_array_to_arrays(getattr(dataobject, f'Get{name.capitalize()}')())
+                for name in _POLYDATA_CELLS
+            }
+        elif isinstance(dataobject, _vtk.vtkUnstructuredGrid):
+            state['cells'] = _cell_array_to_arrays(dataobject.GetCells())
+            if dataobject.GetCellTypesArray() is not None:
+                state['celltypes'] = convert_array(dataobject.GetCellTypesArray())
+            if dataobject.GetFaces() is not None:
+                state['faces'] = convert_array(dataobject.GetFaces())
+                state['face_locations'] = convert_array(dataobject.GetFaceLocations())
+        elif isinstance(dataobject, _vtk.vtkStructuredGrid):
+            state['dimensions'] = dataobject.GetDimensions()
+        elif isinstance(dataobject, _vtk.vtkExplicitStructuredGrid):
+            state['extent'] = dataobject.GetExtent()
+            state['cells'] = _cell_array_to_arrays(dataobject.GetCells())
+    elif not isinstance(dataobject, _vtk.vtkTable):
+        raise TypeError(f'Cannot serialize dataset of type {dataobject.GetDataObjectType()}')
+
+    if isinstance(dataobject, _vtk.vtkDataSet):
+        state['point_data'] = _attributes_to_arrays(dataobject.GetPointData())
+        state['cell_data'] = _attributes_to_arrays(dataobject.GetCellData())
+    elif isinstance(dataobject, _vtk.vtkTable):
+        state['row_data'] = _attributes_to_arrays(dataobject.GetRowData())
+    state['field_data'] = _attributes_to_arrays(dataobject.GetFieldData())
+    return state
+
+
+def from_arrays(dataobject, state: Dict[str, Any]):
+    """Populate an empty data object from the output of :func:`to_arrays`.
+
+    The VTK arrays of the data object wrap the NumPy arrays of ``state``
+    without copying them and keep them alive.
+
+    Parameters
+    ----------
+    dataobject : pyvista.DataObject
+        Empty data object of the same type as the decomposed one.
+
+    state : dict
+        Output of :func:`to_arrays`.
+
+    """
+    if isinstance(dataobject, _vtk.vtkMultiBlockDataSet):
+        for name, block in state['blocks']:
+            dataobject.append(block, name)
+    elif isinstance(dataobject, _vtk.vtkImageData):
+        dataobject.SetExtent(state['extent'])
+        dataobject.SetOrigin(state['origin'])
+        dataobject.SetSpacing(state['spacing'])
+        dataobject.SetDirectionMatrix(vtkmatrix_from_array(state['direction']))
+    elif isinstance(dataobject, _vtk.vtkRectilinearGrid):
+        dataobject.SetExtent(state['extent'])
+        x, y, z = (_to_vtk(coords) for coords in state['coordinates'])
+        dataobject.SetXCoordinates(x)
+        dataobject.SetYCoordinates(y)
+        dataobject.SetZCoordinates(z)
+    elif isinstance(dataobject, _vtk.vtkPointSet):
+        if 'points' in state:
+            vtk_points = _vtk.vtkPoints()
+            vtk_points.SetData(_to_vtk(state['points']))
+            dataobject.SetPoints(vtk_points)
+        if isinstance(dataobject, _vtk.vtkPolyData):
+            for name, arrays in state['cells'].items():
+                if arrays is not None:
+                    cell_array = _arrays_to_cell_array(arrays)
+                    getattr(dataobject, f'Set{name.capitalize()}')(cell_array)
+        elif isinstance(dataobject, _vtk.vtkUnstructuredGrid):
+            if state['cells'] is not None and 'celltypes' in state:
+                cell_array = _arrays_to_cell_array(state['cells'])
+                celltypes = _to_vtk(state['celltypes'])
+                if 'faces' in state:
+                    dataobject.SetCells(
+                        celltypes,
+                        cell_array,
+                        _to_vtk(state['face_locations']),
+                        _to_vtk(state['faces']),
+                    )
+                else:
+                    dataobject.SetCells(celltypes, cell_array)
+        elif isinstance(dataobject, _vtk.vtkStructuredGrid):
+            dataobject.SetDimensions(state['dimensions'])
+        elif isinstance(dataobject, _vtk.vtkExplicitStructuredGrid):
+            dataobject.SetExtent(state['extent'])
+            if state['cells'] is not None:
+                dataobject.SetCells(_arrays_to_cell_array(state['cells']))
+
+    if 'point_data' in state:
+        _arrays_to_attributes(state['point_data'], dataobject.GetPointData())
+        _arrays_to_attributes(state['cell_data'], dataobject.GetCellData())
+    if 'row_data' in state:
+        _arrays_to_attributes(state['row_data'], dataobject.GetRowData())
+    _arrays_to_attributes(state['field_data'], dataobject.GetFieldData())
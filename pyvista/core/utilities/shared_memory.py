@@ -0,0 +1,286 @@
+"""Share datasets between processes through shared memory blocks."""
+import mmap
+import os
+import sys
+from typing import Any, List, NamedTuple, Optional
+
+import numpy as np
+
+from . import serialization
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover
+    # platforms without shared memory, such as WebAssembly
+    shared_memory = None
+
+# alignment in bytes of each array in the shared memory block
+_ALIGNMENT = 64
+
+# directory where POSIX shared memory blocks are visible as files on Linux
+_SHM_DIR = '/dev/shm'
+
+
+class _SharedArray(NamedTuple):
+    """Index, data type and shape of an array in a shared memory block."""
+
+    index: int
+    dtype: str
+    shape: tuple
+
+
+class _SharedBlock(NamedTuple):
+    """Data object stored in a shared memory block."""
+
+    cls: type
+    state: Any
+
+
+def _check_shared_memory():
+    """Raise an error when shared memory is not supported on this platform."""
+    if shared_memory is None:
+        raise RuntimeError(
+            'Shared memory is not supported on this platform: '
+            '`multiprocessing.shared_memory` cannot be imported.'
+        )
+
+
+class _AttachedBlock:
+    """Shared memory block attached by a process which does not own it.
+
+    The arrays mapped from the block are NumPy views of this object, which
+    keeps the block open as long as any of them is alive.
+    """
+
+    def __init__(self, name: str):
+        """Attach the block without tracking it when possible."""
+        if sys.version_info >= (3, 13):  # pragma: no cover
+            self._shm = shared_memory.SharedMemory(name, track=False)
+        else:
+            self._shm = shared_memory.SharedMemory(name)
+        self._view = np.frombuffer(self._shm.buf, dtype=np.uint8)
+        self.__array_interface__ = self._view.__array_interface__
+
+    def __del__(self):
+        """Close the block once no array uses it anymore."""
+        # the view must be released before the block can be closed
+        del self._view
+        self._shm.close()
+
+
+def _pack(dataobject, arrays: List[np.ndarray]) -> _SharedBlock:
+    """Replace the arrays of a data object by their location in ``arrays``."""
+
+    def replace(value):
+        if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+            arrays.append(np.ascontiguousarray(value))
+            return _SharedArray(len(arrays) - 1, value.dtype.str, value.shape)
+        if isinstance(value, dict):
+            return {key: replace(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return type(value)(replace(item) for item in value)
+        if hasattr(value, 'GetDataObjectType'):
+            return _pack(value, arrays)
+        return value
+
+    return _SharedBlock(type(dataobject), replace(serialization.to_arrays(dataobject)))
+
+
+def _unpack(block: _SharedBlock, buffer, offsets: List[int]):
+    """Rebuild a data object from a packed state and a mapped buffer."""
+
+    def restore(value):
+        if isinstance(value, _SharedArray):
+            dtype = np.dtype(value.dtype)
+            start = offsets[value.index]
+            stop = start + int(np.prod(value.shape, dtype=np.int64)) * dtype.itemsize
+            return buffer[start:stop].view(dtype).reshape(value.shape)
+        if isinstance(value, _SharedBlock):
+            return _unpack(value, buffer, offsets)
+        if isinstance(value, dict):
+            return {key: restore(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return type(value)(restore(item) for item in value)
+        return value
+
+    dataobject = block.cls()
+    serialization.from_arrays(dataobject, restore(block.state))
+    return dataobject
+
+
+class SharedMemoryHandle:
+    """Picklable handle to a data object stored in shared memory.
+
+    Create a handle with :func:`pyvista.DataObject.to_shared_memory` and
+    rebuild the data object in any process with
+    :func:`pyvista.from_shared_memory`. Only the description of the data
+    object is pickled with the handle, not its arrays.
+
+    The process which created the handle owns the shared memory block and
+    must release it with :func:`SharedMemoryHandle.close` or by using the
+    handle as a context manager. Data objects created from the handle in
+    other processes remain valid after the block is released.
+
+    The block is managed by :class:`multiprocessing.shared_memory.SharedMemory`,
+    so a :class:`RuntimeError` is raised on platforms without shared
+    memory.
+
+    .. versionadded:: 0.40.0
+
+    Examples
+    --------
+    Share a mesh with worker processes.
+
+    >>> import pyvista as pv
+    >>> mesh = pv.Sphere()
+    >>> with mesh.to_shared_memory() as handle:
+    ...     shared = pv.from_shared_memory(handle)
+    ...
+    >>> shared == mesh
+    True
+
+    """
+
+    def __init__(self, dataobject):
+        """Copy the arrays of a data object into a new shared memory block."""
+        _check_shared_memory()
+        arrays: List[np.ndarray] = []
+        self._block = _pack(dataobject, arrays)
+
+        self._offsets = []
+        size = 0
+        for array in arrays:
+            size = -(-size // _ALIGNMENT) * _ALIGNMENT
+            self._offsets.append(size)
+            size += array.nbytes
+        self._size = max(size, 1)
+
+        self._shm: Optional[shared_memory.SharedMemory] = shared_memory.SharedMemory(
+            create=True, size=self._size
+        )
+        self._name = self._shm.name
+        for array, offset in zip(arrays, self._offsets):
+            target = np.ndarray(array.shape, array.dtype, buffer=self._shm.buf, offset=offset)
+            target[...] = array
+            del target
+
+    def __getstate__(self):
+        """Pickle the description of the data object only."""
+        state = self.__dict__.copy()
+        state['_shm'] = None
+        return state
+
+    def __enter__(self) -> 'SharedMemoryHandle':
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Release the shared memory block when owned by this process."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Return the object representation."""
+        return (
+            f'{type(self).__name__}({self._block.cls.__name__}, '
+            f'name={self._name!r}, nbytes={self._size})'
+        )
+
+    @property
+    def name(self) -> str:
+        """Return the name of the shared memory block.
+
+        Returns
+        -------
+        str
+            Name of the shared memory block.
+
+        """
+        return self._name
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the shared memory block in bytes.
+
+        Returns
+        -------
+        int
+            Size of the shared memory block.
+
+        """
+        return self._size
+
+    def close(self):
+        """Release and unlink the shared memory block.
+
+        This has no effect on copies of the handle unpickled in other
+        processes, which do not own the block.
+        """
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def _map(self):
+        """Map the shared memory block as an array of bytes.
+
+        The block is mapped as a private copy-on-write buffer where the
+        platform allows it, and attached as writable shared memory
+        otherwise.
+        """
+        if os.name == 'nt':  # pragma: no cover
+            buffer = mmap.mmap(-1, self._size, tagname=self._name, access=mmap.ACCESS_COPY)
+            return np.frombuffer(buffer, dtype=np.uint8)
+
+        path = os.path.join(_SHM_DIR, self._name.lstrip('/'))
+        if os.path.isfile(path):
+            with open(path, 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), self._size, access=mmap.ACCESS_COPY)
+            return np.frombuffer(buffer, dtype=np.uint8)
+
+        # for instance on macOS, where the blocks are not visible as files
+        return np.asarray(_AttachedBlock(self._name))
+
+
+def from_shared_memory(handle: SharedMemoryHandle):
+    """Create a data object from a shared memory handle.
+
+    The arrays of the data object are mapped from the shared memory block
+    without copy. On Linux and Windows the mapping is copy-on-write:
+    modifying the data object only affects the current process. On other
+    platforms, such as macOS, the block is attached as writable shared
+    memory, so that modifying the arrays in place also modifies the data
+    objects created from the block in all processes.
+
+    .. versionadded:: 0.40.0
+
+    Parameters
+    ----------
+    handle : pyvista.SharedMemoryHandle
+        Handle returned by :func:`pyvista.DataObject.to_shared_memory`,
+        possibly unpickled in another process.
+
+    Returns
+    -------
+    pyvista.DataObject
+        Data object sharing the memory of the block.
+
+    Examples
+    --------
+    Process a large mesh in several worker processes.
+
+    >>> import pyvista as pv
+    >>> from concurrent.futures import ProcessPoolExecutor
+    >>> def n_points(handle):
+    ...     return pv.from_shared_memory(handle).n_points
+    ...
+    >>> mesh = pv.Sphere()
+    >>> with mesh.to_shared_memory() as handle:
+    ...     with ProcessPoolExecutor(2) as executor:  # doctest:+SKIP
+    ...         n = list(executor.map(n_points, [handle] * 4))
+    ...
+
+    """
+    if not isinstance(handle, SharedMemoryHandle):
+        raise TypeError(f'Expected a SharedMemoryHandle, got {type(handle).__name__}.')
+    _check_shared_memory()
+    return _unpack(handle._block, handle._map(), handle._offsets)
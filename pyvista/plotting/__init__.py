@@ -1,55 +1,101 @@
 """Plotting routines."""
 # flake8: noqa: F401
+import importlib as _importlib
 
 from pyvista import MAX_N_COLOR_BARS
 from pyvista._plot import plot
 
-from . import _vtk
-from ._property import Property
-from ._typing import Chart, ColorLike
-from .actor import Actor
-from .actor_properties import ActorProperties
-from .axes import Axes
-from .axes_actor import AxesActor
-from .camera import Camera
-from .charts import Chart2D, ChartBox, ChartMPL, ChartPie
-from .colors import PARAVIEW_BACKGROUND, Color, color_char_to_word, get_cmap_safe, hexcolors
-from .composite_mapper import BlockAttributes, CompositeAttributes, CompositePolyDataMapper
-from .cube_axes_actor import CubeAxesActor
-from .errors import InvalidCameraError, RenderWindowUnavailable
-from .export_vtkjs import export_plotter_vtkjs, get_vtkjs_url
-from .helpers import plot_arrows, plot_compare_four
-from .lights import Light
-from .lookup_table import LookupTable
-from .mapper import (
-    DataSetMapper,
-    FixedPointVolumeRayCastMapper,
-    GPUVolumeRayCastMapper,
-    OpenGLGPUVolumeRayCastMapper,
-    PointGaussianMapper,
-    SmartVolumeMapper,
-    UnstructuredGridVolumeRayCastMapper,
-)
-from .picking import PickingHelper
-from .plotter import _ALL_PLOTTERS, BasePlotter, Plotter, close_all
-from .render_window_interactor import RenderWindowInteractor
-from .renderer import CameraPosition, Renderer, scale_point
-from .texture import Texture, image_to_texture, numpy_to_texture
-from .tools import (
-    FONTS,
-    check_math_text_support,
-    check_matplotlib_vtk_compatibility,
-    create_axes_marker,
-    create_axes_orientation_box,
-    normalize,
-    opacity_transfer_function,
-    parse_font_family,
-    system_supports_plotting,
+# Attributes of the plotting API and the submodule defining them. The
+# submodules import the rendering libraries of VTK, so they are only
+# imported when one of their attributes is first accessed.
+_LAZY_IMPORTS = {
+    '_property': ['Property'],
+    '_typing': ['Chart', 'ColorLike'],
+    'actor': ['Actor'],
+    'actor_properties': ['ActorProperties'],
+    'axes': ['Axes'],
+    'axes_actor': ['AxesActor'],
+    'camera': ['Camera'],
+    'charts': ['Chart2D', 'ChartBox', 'ChartMPL', 'ChartPie'],
+    'colors': ['PARAVIEW_BACKGROUND', 'Color', 'color_char_to_word', 'get_cmap_safe', 'hexcolors'],
+    'composite_mapper': ['BlockAttributes', 'CompositeAttributes', 'CompositePolyDataMapper'],
+    'cube_axes_actor': ['CubeAxesActor'],
+    'errors': ['InvalidCameraError', 'RenderWindowUnavailable'],
+    'export_vtkjs': ['export_plotter_vtkjs', 'get_vtkjs_url'],
+    'helpers': ['plot_arrows', 'plot_compare_four'],
+    'lights': ['Light'],
+    'lookup_table': ['LookupTable'],
+    'mapper': [
+        'DataSetMapper',
+        'FixedPointVolumeRayCastMapper',
+        'GPUVolumeRayCastMapper',
+        'OpenGLGPUVolumeRayCastMapper',
+        'PointGaussianMapper',
+        'SmartVolumeMapper',
+        'UnstructuredGridVolumeRayCastMapper',
+    ],
+    'picking': ['PickingHelper'],
+    'plotter': ['_ALL_PLOTTERS', 'BasePlotter', 'Plotter', 'close_all'],
+    'render_window_interactor': ['RenderWindowInteractor'],
+    'renderer': ['CameraPosition', 'Renderer', 'scale_point'],
+    'texture': ['Texture', 'image_to_texture', 'numpy_to_texture'],
+    'tools': [
+        'FONTS',
+        'check_math_text_support',
+        'check_matplotlib_vtk_compatibility',
+        'create_axes_marker',
+        'create_axes_orientation_box',
+        'normalize',
+        'opacity_transfer_function',
+        'parse_font_family',
+        'system_supports_plotting',
+    ],
+    'utilities': [
+        'Scraper',
+        'active_scalars_algorithm',
+        'add_ids_algorithm',
+        'algorithm_to_mesh_handler',
+        'cell_data_to_point_data_algorithm',
+        'check_depth_peeling',
+        'compare_images',
+        'crinkle_algorithm',
+        'cubemap',
+        'cubemap_from_filenames',
+        'decimation_algorithm',
+        'extract_surface_algorithm',
+        'image_from_window',
+        'outline_algorithm',
+        'point_data_to_cell_data_algorithm',
+        'pointset_to_polydata_algorithm',
+        'remove_alpha',
+        'run_image_filter',
+        'set_algorithm_input',
+        'start_xvfb',
+        'triangulate_algorithm',
+        'uses_egl',
+        'wrap_image_array',
+        # submodules of ``pyvista.plotting.utilities``
+        'algorithms',
+        'gl_checks',
+        'regression',
+        'sphinx_gallery',
+        'xvfb',
+    ],
+    'volume': ['Volume'],
+    'volume_property': ['VolumeProperty'],
+    'widgets': ['WidgetHelper'],
+}
+_LAZY_ATTRIBUTES = {name: module for module, names in _LAZY_IMPORTS.items() for name in names}
+
+# other public submodules, which are imported by the submodules above
+_LAZY_SUBMODULES = (
+    'background_renderer',
+    'opts',
+    'prop3d',
+    'render_passes',
+    'renderers',
+    'scalar_bars',
 )
-from .utilities import *
-from .volume import Volume
-from .volume_property import VolumeProperty
-from .widgets import WidgetHelper
 
 
 class QtDeprecationError(Exception):
@@ -81,3 +127,38 @@ class QtInteractor:
     def __init__(self, *args, **kwargs):
         """Empty init."""
         raise QtDeprecationError('QtInteractor')
+
+
+__all__ = [
+    'BackgroundPlotter',
+    'MAX_N_COLOR_BARS',
+    'QtDeprecationError',
+    'QtInteractor',
+    'plot',
+    *(name for name in _LAZY_ATTRIBUTES if not name.startswith('_')),
+    *(name for name in _LAZY_IMPORTS if not name.startswith('_')),
+    *_LAZY_SUBMODULES,
+]
+
+
+def __getattr__(name):
+    """Import an attribute or a submodule of the plotting API on first access."""
+    if name in _LAZY_ATTRIBUTES:
+        module = _importlib.import_module(f'{__name__}.{_LAZY_ATTRIBUTES[name]}')
+        value = getattr(module, name)
+    elif name.startswith('__'):
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    else:
+        try:
+            value = _importlib.import_module(f'{__name__}.{name}')
+        except ModuleNotFoundError as e:
+            if e.name != f'{__name__}.{name}':
+                raise
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Return the attributes of the plotting API, including those not yet imported."""
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, *__all__})
@@ -6,117 +6,160 @@ plotting API. Here, we attempt to import modules using the ``vtkmodules``
 package, which lets us only have to import from select modules and not
 the entire library.
 
+Each ``vtkmodules`` extension module is only imported when one of its
+attributes is first accessed, except for the modules overriding the
+rendering classes of VTK, which must be imported before any rendering
+object is created. Attributes of :mod:`pyvista.core._vtk_core` are
+available from this module as well.
+
 """
 # flake8: noqa: F401
 
-from vtkmodules.vtkChartsCore import (
-    vtkAxis,
-    vtkChart,
-    vtkChartBox,
-    vtkChartPie,
-    vtkChartXY,
-    vtkChartXYZ,
-    vtkPlotArea,
-    vtkPlotBar,
-    vtkPlotBox,
-    vtkPlotLine,
-    vtkPlotLine3D,
-    vtkPlotPie,
-    vtkPlotPoints,
-    vtkPlotPoints3D,
-    vtkPlotStacked,
-    vtkPlotSurface,
-)
-from vtkmodules.vtkCommonColor import vtkColorSeries
-from vtkmodules.vtkInteractionWidgets import (
-    vtkBoxWidget,
-    vtkButtonWidget,
-    vtkImplicitPlaneWidget,
-    vtkLineWidget,
-    vtkOrientationMarkerWidget,
-    vtkPlaneWidget,
-    vtkResliceCursorPicker,
-    vtkScalarBarWidget,
-    vtkSliderRepresentation2D,
-    vtkSliderWidget,
-    vtkSphereWidget,
-    vtkSplineWidget,
-    vtkTexturedButtonRepresentation2D,
-)
-from vtkmodules.vtkRenderingAnnotation import (
-    vtkAnnotatedCubeActor,
-    vtkAxesActor,
-    vtkAxisActor2D,
-    vtkCornerAnnotation,
-    vtkCubeAxesActor,
-    vtkLegendBoxActor,
-    vtkLegendScaleActor,
-    vtkScalarBarActor,
-)
-from vtkmodules.vtkRenderingContext2D import (
-    vtkBlockItem,
-    vtkBrush,
-    vtkContext2D,
-    vtkContextActor,
-    vtkContextScene,
-    vtkImageItem,
-    vtkPen,
-)
+try:
+    from vtkmodules.vtkPythonContext2D import vtkPythonItem
+except ImportError:  # pragma: no cover
+    # `vtkmodules.vtkPythonContext2D` is unavailable in some versions of `vtk` (see #3224)
+
+    class vtkPythonItem:  # type: ignore
+        """Empty placeholder."""
+
+        def __init__(self):  # pragma: no cover
+            """Raise version error on init."""
+            from pyvista.core.errors import VTKVersionError
+
+            raise VTKVersionError('Chart backgrounds require the vtkPythonContext2D module')
+
 
 try:
     from vtkmodules.vtkRenderingCore import vtkHardwarePicker
 except ImportError:  # pragma: no cover
     # VTK < 9.2 is missing this class
     vtkHardwarePicker = None
-from vtkmodules.vtkRenderingCore import (
-    vtkAbstractMapper,
-    vtkActor,
-    vtkActor2D,
-    vtkAreaPicker,
-    vtkCamera,
-    vtkCellPicker,
-    vtkColorTransferFunction,
-    vtkCompositeDataDisplayAttributes,
-    vtkCoordinate,
-    vtkDataSetMapper,
-    vtkImageActor,
-    vtkLight,
-    vtkLightActor,
-    vtkLightKit,
-    vtkMapper,
-    vtkPointGaussianMapper,
-    vtkPointPicker,
-    vtkPolyDataMapper,
-    vtkPolyDataMapper2D,
-    vtkProp3D,
-    vtkPropAssembly,
-    vtkProperty,
-    vtkPropPicker,
-    vtkRenderedAreaPicker,
-    vtkRenderer,
-    vtkRenderWindow,
-    vtkRenderWindowInteractor,
-    vtkScenePicker,
-    vtkSelectVisiblePoints,
-    vtkSkybox,
-    vtkTextActor,
-    vtkTexture,
-    vtkVolume,
-    vtkVolumeProperty,
-    vtkWindowToImageFilter,
-    vtkWorldPointPicker,
-)
+
+# These modules register the implementations of the text renderer and of
+# the render window interactor in the object factory of VTK
 from vtkmodules.vtkRenderingFreeType import vtkMathTextFreeTypeTextRenderer, vtkVectorText
-from vtkmodules.vtkRenderingLabel import vtkLabelPlacementMapper, vtkPointSetToLabelHierarchy
 from vtkmodules.vtkRenderingUI import vtkGenericRenderWindowInteractor
-from vtkmodules.vtkRenderingVolume import (
-    vtkFixedPointVolumeRayCastMapper,
-    vtkGPUVolumeRayCastMapper,
-    vtkUnstructuredGridVolumeRayCastMapper,
-    vtkVolumePicker,
-)
-from vtkmodules.vtkViewsContext2D import vtkContextInteractorStyle
 
-from pyvista.core._vtk_core import *
+from pyvista.core import _vtk_core
 
 from ._vtk_gl import *
+
+# Attributes imported on first access from each ``vtkmodules`` module
+_LAZY_IMPORTS = {
+    'vtkmodules.vtkChartsCore': [
+        'vtkAxis',
+        'vtkChart',
+        'vtkChartBox',
+        'vtkChartPie',
+        'vtkChartXY',
+        'vtkChartXYZ',
+        'vtkPlotArea',
+        'vtkPlotBar',
+        'vtkPlotBox',
+        'vtkPlotLine',
+        'vtkPlotLine3D',
+        'vtkPlotPie',
+        'vtkPlotPoints',
+        'vtkPlotPoints3D',
+        'vtkPlotStacked',
+        'vtkPlotSurface',
+    ],
+    'vtkmodules.vtkCommonColor': ['vtkColorSeries'],
+    'vtkmodules.vtkInteractionWidgets': [
+        'vtkBoxWidget',
+        'vtkButtonWidget',
+        'vtkImplicitPlaneWidget',
+        'vtkLineWidget',
+        'vtkOrientationMarkerWidget',
+        'vtkPlaneWidget',
+        'vtkResliceCursorPicker',
+        'vtkScalarBarWidget',
+        'vtkSliderRepresentation2D',
+        'vtkSliderWidget',
+        'vtkSphereWidget',
+        'vtkSplineWidget',
+        'vtkTexturedButtonRepresentation2D',
+    ],
+    'vtkmodules.vtkRenderingAnnotation': [
+        'vtkAnnotatedCubeActor',
+        'vtkAxesActor',
+        'vtkAxisActor2D',
+        'vtkCornerAnnotation',
+        'vtkCubeAxesActor',
+        'vtkLegendBoxActor',
+        'vtkLegendScaleActor',
+        'vtkScalarBarActor',
+    ],
+    'vtkmodules.vtkRenderingContext2D': [
+        'vtkBlockItem',
+        'vtkBrush',
+        'vtkContext2D',
+        'vtkContextActor',
+        'vtkContextScene',
+        'vtkImageItem',
+        'vtkPen',
+    ],
+    'vtkmodules.vtkRenderingCore': [
+        'vtkAbstractMapper',
+        'vtkActor',
+        'vtkActor2D',
+        'vtkAreaPicker',
+        'vtkCamera',
+        'vtkCellPicker',
+        'vtkColorTransferFunction',
+        'vtkCompositeDataDisplayAttributes',
+        'vtkCoordinate',
+        'vtkDataSetMapper',
+        'vtkImageActor',
+        'vtkLight',
+        'vtkLightActor',
+        'vtkLightKit',
+        'vtkMapper',
+        'vtkPointGaussianMapper',
+        'vtkPointPicker',
+        'vtkPolyDataMapper',
+        'vtkPolyDataMapper2D',
+        'vtkProp3D',
+        'vtkPropAssembly',
+        'vtkProperty',
+        'vtkPropPicker',
+        'vtkRenderedAreaPicker',
+        'vtkRenderer',
+        'vtkRenderWindow',
+        'vtkRenderWindowInteractor',
+        'vtkScenePicker',
+        'vtkSelectVisiblePoints',
+        'vtkSkybox',
+        'vtkTextActor',
+        'vtkTexture',
+        'vtkVolume',
+        'vtkVolumeProperty',
+        'vtkWindowToImageFilter',
+        'vtkWorldPointPicker',
+    ],
+    'vtkmodules.vtkRenderingLabel': ['vtkLabelPlacementMapper', 'vtkPointSetToLabelHierarchy'],
+    'vtkmodules.vtkRenderingVolume': [
+        'vtkFixedPointVolumeRayCastMapper',
+        'vtkGPUVolumeRayCastMapper',
+        'vtkUnstructuredGridVolumeRayCastMapper',
+        'vtkVolumePicker',
+    ],
+    'vtkmodules.vtkViewsContext2D': ['vtkContextInteractorStyle'],
+}
+_LAZY_ATTRIBUTES = {name: (module,) for module, names in _LAZY_IMPORTS.items() for name in names}
+
+
+def __getattr__(name):
+    """Import a VTK attribute on first access."""
+    if name in _LAZY_ATTRIBUTES:
+        return _vtk_core._import_attribute(globals(), _LAZY_ATTRIBUTES, name)
+    try:
+        return getattr(_vtk_core, name)
+    except AttributeError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+
+def __dir__():
+    """Return the attributes of this module, including those not yet imported."""
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, *dir(_vtk_core)})
@@ -42,6 +42,8 @@ NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 """
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import errno
 import gzip
 import hashlib
@@ -49,11 +51,19 @@ import json
 import os
 import shutil
 import sys
+import threading
 import time
 import zipfile
 
+import numpy as np
+
+from pyvista.core.utilities.misc import _resolve_workers
+
 FILENAME_EXTENSION = '.vtkjs'
 
+# maximum size in bytes of the compressed arrays kept for later exports
+BLOB_CACHE_SIZE = 256 * 1024**2
+
 arrayTypesMapping = '  bBhHiIlLfdL'  # last one is idtype
 
 jsMapping = {
@@ -115,6 +125,74 @@ def get_object_id(obj):
 # -----------------------------------------------------------------------------
 
 
+_blob_cache = OrderedDict()  # type: ignore
+_blob_cache_nbytes = 0
+_blob_cache_lock = threading.Lock()
+_blob_writers = threading.local()
+
+
+def _compress_blob(md5, buffer):
+    """Return the gzip compressed content of a buffer.
+
+    Compressed arrays are cached by the hash of their content, so that
+    exporting the same scene again does not compress them again.
+    """
+    global _blob_cache_nbytes
+    with _blob_cache_lock:
+        if md5 in _blob_cache:
+            _blob_cache.move_to_end(md5)
+            return _blob_cache[md5]
+
+    # ``zlib`` releases the GIL, which lets threads compress arrays concurrently
+    blob = gzip.compress(buffer, compresslevel=6, mtime=0)
+
+    with _blob_cache_lock:
+        if md5 not in _blob_cache and len(blob) <= BLOB_CACHE_SIZE:
+            _blob_cache[md5] = blob
+            _blob_cache_nbytes += len(blob)
+            while _blob_cache_nbytes > BLOB_CACHE_SIZE:
+                _blob_cache_nbytes -= len(_blob_cache.popitem(last=False)[1])
+    return blob
+
+
+def _write_blob(path, md5, buffer, compress):
+    """Write a buffer to disk, compressing it when requested."""
+    if compress:
+        buffer = _compress_blob(md5, buffer)
+        path += '.gz'
+    with open(path, 'wb') as f:
+        f.write(buffer)
+
+
+class _BlobWriter:
+    """Write the arrays dumped within this context from a pool of threads.
+
+    Arrays with the same content are only written once to each directory.
+    """
+
+    def __init__(self, workers=-1):
+        self._executor = ThreadPoolExecutor(_resolve_workers(workers))
+        self._futures = {}
+
+    def __enter__(self):
+        self._previous = getattr(_blob_writers, 'active', None)
+        _blob_writers.active = self
+        return self
+
+    def __exit__(self, *args):
+        _blob_writers.active = self._previous
+        try:
+            for future in self._futures.values():
+                future.result()
+        finally:
+            self._executor.shutdown()
+            self._futures.clear()
+
+    def write(self, path, md5, buffer, compress):
+        if path not in self._futures:
+            self._futures[path] = self._executor.submit(_write_blob, path, md5, buffer, compress)
+
+
 def dump_data_array(dataset_dir, data_dir, array, root=None, compress=True):
     """Dump vtkjs data array."""
     # import here to avoid circular imports
@@ -127,27 +205,20 @@ def dump_data_array(dataset_dir, data_dir, array, root=None, compress=True):
 
     if array.GetDataType() == 12:
         # IdType need to be converted to Uint32
-        array_size = array.GetNumberOfTuples() * array.GetNumberOfComponents()
-        new_array = _vtk.vtkTypeUInt32Array()
-        new_array.SetNumberOfTuples(array_size)
-        for i in range(array_size):
-            new_array.SetValue(i, -1 if array.GetValue(i) < 0 else array.GetValue(i))
-        pbuffer = memoryview(new_array)
+        ids = _vtk.vtk_to_numpy(array)
+        new_array = ids.astype(np.uint32)
+        new_array[ids < 0] = np.iinfo(np.uint32).max
+        pbuffer = memoryview(new_array).cast('B')
     else:
-        pbuffer = memoryview(array)
+        pbuffer = memoryview(array).cast('B')
 
     pMd5 = hashlib.md5(pbuffer).hexdigest()
     ppath = os.path.join(data_dir, pMd5)
-    with open(ppath, 'wb') as f:
-        f.write(pbuffer)
-
-    if compress:
-        with open(ppath, 'rb') as f_in, gzip.open(
-            os.path.join(data_dir, pMd5 + '.gz'), 'wb'
-        ) as f_out:
-            shutil.copyfileobj(f_in, f_out)
-        # Close then remove.
-        os.remove(ppath)
+    writer = getattr(_blob_writers, 'active', None)
+    if writer is None:
+        _write_blob(ppath, pMd5, pbuffer, compress)
+    else:
+        writer.write(ppath, pMd5, pbuffer, compress)
 
     root['ref'] = get_ref(os.path.relpath(data_dir, dataset_dir), pMd5)
     root['vtkClass'] = 'vtkDataArray'
@@ -300,7 +371,7 @@ def dump_all_arrays(dataset_dir, data_dir, dataset, root=None, compress=True):
 
     # Cell data
     cd = dataset.GetCellData()
-    cd_size = pd.GetNumberOfArrays()
+    cd_size = cd.GetNumberOfArrays()
     for i in range(cd_size):
         array = cd.GetArray(i)
         if array:
@@ -431,22 +502,11 @@ def mkdir_p(path):
             raise
 
 
-def export_plotter_vtkjs(plotter, filename, compress_arrays=False):
-    """Export a plotter's rendering window to the VTKjs format."""
-    arrays = []  # assist in cleaning up references
-
+def _dump_scene(plotter, output_dir, doCompressArrays, arrays):
+    """Write the datasets of the visible actors and return the scene components."""
     # import here to avoid circular imports
     from . import _vtk
 
-    sceneName = os.path.split(filename)[1]
-    doCompressArrays = compress_arrays
-
-    # Generate timestamp and use it to make subdirectory within the top level output dir
-    timeStamp = time.strftime("%a-%d-%b-%Y-%H-%M-%S")
-    root_output_directory = os.path.split(filename)[0]
-    output_dir = os.path.join(root_output_directory, timeStamp)
-    mkdir_p(output_dir)
-
     renderers = plotter.render_window.GetRenderers()
 
     scDirs = []
@@ -622,6 +682,26 @@ def export_plotter_vtkjs(plotter, filename, compress_arrays=False):
     for key, val in textureToSave.items():
         write_data_set('', val, output_dir, None, new_name=key, compress=doCompressArrays)
 
+    return sceneComponents
+
+
+def export_plotter_vtkjs(plotter, filename, compress_arrays=False):
+    """Export a plotter's rendering window to the VTKjs format."""
+    arrays = []  # assist in cleaning up references
+
+    sceneName = os.path.split(filename)[1]
+    doCompressArrays = compress_arrays
+
+    # Generate timestamp and use it to make subdirectory within the top level output dir
+    timeStamp = time.strftime("%a-%d-%b-%Y-%H-%M-%S")
+    root_output_directory = os.path.split(filename)[0]
+    output_dir = os.path.join(root_output_directory, timeStamp)
+    mkdir_p(output_dir)
+
+    # arrays are compressed and written concurrently while the scene is traversed
+    with _BlobWriter():
+        sceneComponents = _dump_scene(plotter, output_dir, doCompressArrays, arrays)
+
     cameraClippingRange = plotter.camera.clipping_range
 
     sceneDescription = {
@@ -660,14 +740,18 @@ def export_plotter_vtkjs(plotter, filename, compress_arrays=False):
             for fname in fileList:
                 fullPath = os.path.join(dirName, fname)
                 relPath = f'{sceneName}/{os.path.relpath(fullPath, output_dir)}'
-                zf.write(fullPath, arcname=relPath, compress_type=compression)
+                # compressed arrays are stored as they are rather than deflated again
+                zf.write(
+                    fullPath,
+                    arcname=relPath,
+                    compress_type=zipfile.ZIP_STORED if fname.endswith('.gz') else compression,
+                )
     finally:
         zf.close()
 
     shutil.rmtree(output_dir)
 
     # this must occur to avoid leaks
-    scDirs.clear()
     for array in arrays:
         array.SetReferenceCount(0)
 
@@ -22,9 +22,12 @@ def _try_import(module, name):
     _module = importlib.import_module(module)
     try:
         feature = inspect.getattr_static(_module, name)
-        import_path = f'from {module} import {name}'
     except AttributeError:
-        return None, None
+        # attributes of ``pyvista.plotting`` are imported on first access
+        if name not in getattr(_module, '_LAZY_ATTRIBUTES', ()):
+            return None, None
+        feature = getattr(_module, name)
+    import_path = f'from {module} import {name}'
     return feature, import_path
 
 
@@ -339,3 +339,61 @@ def test_cell_types():
     for cell_type in cell_types:
         if hasattr(vtk, "VTK_" + cell_type):
             assert getattr(pyvista.CellType, cell_type) == getattr(vtk, 'VTK_' + cell_type)
+
+
+@pytest.mark.parametrize("grid", grids, ids=[type(grid).__name__ for grid in grids])
+def test_cells_view(grid):
+    view = grid.cells_view
+    assert len(view) == view.n_cells == grid.n_cells
+    assert view.offsets.size == grid.n_cells + 1
+    assert np.array_equal(view.celltypes, [grid.get_cell(i).type for i in range(grid.n_cells)])
+    assert np.array_equal(view.n_points, [grid.get_cell(i).n_points for i in range(grid.n_cells)])
+    assert np.allclose(view.bounds, [grid.get_cell(i).bounds for i in range(grid.n_cells)])
+    for i in (0, grid.n_cells - 1):
+        assert np.array_equal(view.get_point_ids(i), grid.get_cell(i).point_ids)
+        assert np.allclose(view.get_points(i), grid.get_cell(i).points)
+    assert not view.connectivity.flags.writeable
+
+
+def test_cells_view_centers():
+    grid = load_hexbeam()
+    centers = [grid.get_cell(i).center for i in range(grid.n_cells)]
+    assert np.allclose(grid.cells_view.centers, centers)
+
+
+def test_cells_view_indexing():
+    grid = load_tetbeam()
+    view = grid.cells_view
+    ids = np.array([5, 0, -1, 5])
+    sub = view[ids]
+    assert sub.cell_ids.tolist() == [5, 0, grid.n_cells - 1, 5]
+    assert np.array_equal(sub.bounds, view.bounds[ids])
+    assert np.array_equal(sub.centers, view.centers[ids])
+    for i, cell_id in enumerate(sub.cell_ids):
+        assert np.array_equal(sub.get_point_ids(i), view.get_point_ids(cell_id))
+
+    mask = view.centers[:, 2] > 2
+    assert np.array_equal(view[mask].cell_ids, np.flatnonzero(mask))
+    assert np.array_equal(view[10:20].cell_ids, np.arange(10, 20))
+    assert view[3].cell_ids.tolist() == [3]
+    assert view[[]].n_cells == 0
+
+    with pytest.raises(IndexError):
+        view[grid.n_cells]
+    with pytest.raises(IndexError):
+        view[np.ones(3, dtype=bool)]
+    with pytest.raises(TypeError):
+        view[0.5]
+
+
+def test_cells_view_empty_cells():
+    points = np.random.random((3, 3))
+    grid = pyvista.UnstructuredGrid(
+        [0, 3, 0, 1, 2], [CellType.EMPTY_CELL, CellType.TRIANGLE], points
+    )
+    view = grid.cells_view
+    assert view.n_points.tolist() == [0, 3]
+    assert np.isnan(view.bounds[0]).all()
+    assert np.isnan(view.centers[0]).all()
+    assert np.allclose(view.centers[1], points.mean(axis=0))
+    assert np.allclose(view[[1]].bounds, grid.get_cell(1).bounds)
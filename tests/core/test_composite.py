@@ -1,4 +1,6 @@
+import functools
 import pathlib
+import pickle
 import platform
 import weakref
 
@@ -456,6 +458,46 @@ def test_multi_block_copy(ant, sphere, uniform, airplane, tetbeam):
         assert pyvista.is_pyvista_dataset(multi_copy.GetBlock(i))
 
 
+@pytest.mark.parametrize('pickle_format', ['xml', 'legacy', 'binary'])
+def test_multi_block_pickle(multiblock_all, pickle_format):
+    pyvista.set_pickle_format(pickle_format)
+    multi = multiblock_all
+    multi.append(MultiBlock([PolyData(), None]), 'nested')
+    multi.field_data['data'] = np.arange(3)
+
+    multi_2 = pickle.loads(pickle.dumps(multi))
+    assert multi_2 == multi
+    assert multi_2.keys() == multi.keys()
+    assert isinstance(multi_2['nested'], MultiBlock)
+    assert multi_2['nested'][1] is None
+    assert np.array_equal(multi_2.field_data['data'], np.arange(3))
+    pyvista.set_pickle_format('xml')
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+@pytest.mark.parametrize('workers', [1, 2])
+def test_multi_block_map(sphere, uniform, workers, executor):
+    multi = MultiBlock(
+        {'sphere': sphere, 'nested': MultiBlock({'uniform': uniform, 'empty': None})}
+    )
+    func = functools.partial(pyvista.DataSetFilters.outline)
+    output = multi.map(func, workers=workers, executor=executor)
+    assert output.keys() == ['sphere', 'nested']
+    assert output['nested'].keys() == ['uniform', 'empty']
+    assert output['sphere'] == sphere.outline()
+    assert output['nested']['uniform'] == uniform.outline()
+    assert output['nested']['empty'] is None
+
+    clipped, remainder = multi.map(
+        functools.partial(pyvista.DataSetFilters.clip, return_clipped=True), workers=workers
+    )
+    assert clipped['nested'].keys() == remainder['nested'].keys() == ['uniform', 'empty']
+    assert clipped['sphere'].n_points + remainder['sphere'].n_points > sphere.n_points
+
+    with pytest.raises(ValueError, match='executor'):
+        multi.map(func, executor='cluster')
+
+
 def test_multi_block_negative_index(ant, sphere, uniform, airplane, tetbeam):
     multi = multi_from_datasets(ant, sphere, uniform, airplane, tetbeam)
     # Now check everything
@@ -1,6 +1,7 @@
 """Tests for pyvista.core.dataset."""
 
 import multiprocessing
+import os
 import pickle
 
 from hypothesis import HealthCheck, assume, given, settings
@@ -856,6 +857,92 @@ def test_find_closest_point():
     assert len(index) == 5
 
 
+@pytest.fixture(params=['kdtree', 'vtk'])
+def query_backend(request, monkeypatch):
+    if request.param == 'vtk':
+        # exercise the locator fallback used when scipy is not installed
+        monkeypatch.setattr(pyvista.DataSet, '_get_kdtree', lambda self: None)
+    return request.param
+
+
+@pytest.mark.parametrize('workers', [1, 3])
+def test_query_nearest(workers, query_backend):
+    mesh = pyvista.Sphere()
+    rng = np.random.default_rng(0)
+    points = rng.random((100, 3)) - 0.5
+    indices, distances = mesh.query_nearest(points, k=4, workers=workers)
+    assert indices.shape == distances.shape == (100, 4)
+
+    all_distances = np.linalg.norm(points[:, np.newaxis] - mesh.points, axis=-1)
+    expected = np.sort(all_distances, axis=1)[:, :4]
+    assert np.allclose(distances, expected)
+    assert np.array_equal(indices[:, 0], [mesh.find_closest_point(point) for point in points])
+
+    indices, distances = mesh.query_nearest(points, k=1)
+    assert indices.shape == (100, 1)
+    assert np.allclose(distances[:, 0], expected[:, 0])
+
+    indices, distances = mesh.query_nearest(points[0], k=1)
+    assert indices.shape == (1, 1)
+
+
+def test_query_nearest_cached():
+    mesh = pyvista.Sphere()
+    indices, _ = mesh.query_nearest([0, 0, 1])
+    assert indices[0, 0] == 1
+    tree = mesh._locators['point_kdtree'][0]
+    mesh.query_nearest([0, 0, 1])
+    assert mesh._locators['point_kdtree'][0] is tree
+
+    # the tree is built again when the points are modified
+    mesh.points[:] *= 2
+    mesh.Modified()
+    indices, distances = mesh.query_nearest([0, 0, 1])
+    assert mesh._locators['point_kdtree'][0] is not tree
+    assert np.isclose(distances[0, 0], 0)
+
+
+def test_query_nearest_missing(query_backend):
+    mesh = pyvista.PolyData([[0.0, 0, 0], [1.0, 0, 0]])
+    indices, distances = mesh.query_nearest([[0.1, 0, 0]], k=3)
+    assert np.array_equal(indices, [[0, 1, -1]])
+    assert np.allclose(distances, [[0.1, 0.9, np.inf]])
+
+    indices, distances = pyvista.PolyData().query_nearest([[0.1, 0, 0]], k=2)
+    assert np.array_equal(indices, [[-1, -1]])
+
+    with pytest.raises(ValueError, match='`k` must be'):
+        mesh.query_nearest([0, 0, 0], k=0)
+
+
+@pytest.mark.parametrize('workers', [1, 3])
+def test_query_radius(workers, query_backend):
+    mesh = pyvista.Sphere()
+    rng = np.random.default_rng(0)
+    points = rng.random((100, 3)) - 0.5
+    radius = rng.random(100) * 0.2
+    offsets, indices, distances = mesh.query_radius(points, radius, sort=True, workers=workers)
+    assert offsets.shape == (101,)
+    assert offsets[-1] == indices.size == distances.size
+
+    all_distances = np.linalg.norm(points[:, np.newaxis] - mesh.points, axis=-1)
+    for i in range(points.shape[0]):
+        neighbors = indices[offsets[i] : offsets[i + 1]]
+        assert set(neighbors) == set(np.nonzero(all_distances[i] <= radius[i])[0])
+        assert np.allclose(distances[offsets[i] : offsets[i + 1]], all_distances[i][neighbors])
+        assert np.all(np.diff(distances[offsets[i] : offsets[i + 1]]) >= 0)
+
+    # a single radius for all query points
+    offsets, indices, distances = mesh.query_radius(points, 0.1, workers=workers)
+    for i in range(points.shape[0]):
+        neighbors = indices[offsets[i] : offsets[i + 1]]
+        assert set(neighbors) == set(np.nonzero(all_distances[i] <= 0.1)[0])
+        assert np.allclose(distances[offsets[i] : offsets[i + 1]], all_distances[i][neighbors])
+
+    with pytest.raises(ValueError, match='`radius` must be'):
+        mesh.query_radius(points, -1.0)
+
+
 def test_find_closest_cell():
     mesh = pyvista.Wavelet()
     node = np.array([0, 0.2, 0.2])
@@ -935,6 +1022,65 @@ def test_find_cells_intersecting_line():
             assert len(indices) == 1
 
 
+def test_locators_cached():
+    mesh = pyvista.Sphere()
+    assert mesh.find_closest_point((0, 1, 0)) == 212
+    locator = mesh._get_point_locator()
+    assert mesh._get_point_locator() is locator
+    mesh.find_closest_cell([0.1, 0.2, 0.3])
+    cell_locator = mesh._get_cell_locator()
+    mesh.find_containing_cell([0.1, 0.2, 0.3])
+    assert mesh._get_cell_locator() is cell_locator
+
+    # modifying the data arrays does not invalidate the locators
+    mesh.point_data['data'] = np.arange(mesh.n_points)
+    mesh.point_data['data'][:] = 0
+    assert mesh._get_point_locator() is locator
+
+    # modifying the points invalidates the locators
+    mesh.points += [0, 1, 0]
+    assert mesh._get_point_locator() is not locator
+    assert mesh._get_cell_locator() is not cell_locator
+    assert mesh.find_closest_point((0, 2, 0)) == 212
+
+    # modifying the topology invalidates the locators
+    cell_locator = mesh._get_cell_locator()
+    mesh.faces = mesh.faces[: mesh.faces[0] + 1]
+    assert mesh._get_cell_locator() is not cell_locator
+    assert mesh.find_closest_cell([0.1, 0.2, 0.3]) == 0
+
+
+def test_locators_do_not_keep_dataset_alive():
+    mesh = pyvista.Sphere()
+    deleted = []
+    mesh.AddObserver('DeleteEvent', lambda *args: deleted.append(True))
+    mesh.find_closest_point((0, 1, 0))
+    mesh.find_closest_cell((0, 1, 0))
+    del mesh
+    assert deleted
+
+
+def test_build_clear_locators():
+    mesh = pyvista.Sphere()
+    mesh.build_locators(point_locator='static', cell_locator='static')
+    assert isinstance(mesh._get_point_locator(), vtk.vtkStaticPointLocator)
+    assert isinstance(mesh._get_cell_locator(), vtk.vtkStaticCellLocator)
+    index = mesh.find_closest_point((0, 1, 0))
+    assert np.isclose(mesh.points[index][1], mesh.bounds[3])
+    assert mesh.find_closest_cell([0.1, 0.2, 0.3]) == 591
+    assert len(mesh.find_cells_within_bounds(mesh.bounds)) == mesh.n_cells
+
+    mesh.clear_locators()
+    assert not mesh._locators
+    assert isinstance(mesh._get_cell_locator(), vtk.vtkCellLocator)
+    assert isinstance(mesh._get_cell_locator(default='tree'), vtk.vtkCellTreeLocator)
+
+    with pytest.raises(ValueError, match='Invalid point locator'):
+        mesh.build_locators(point_locator='foo')
+    with pytest.raises(ValueError, match='Invalid cell locator'):
+        mesh.build_locators(cell_locator='foo')
+
+
 def test_find_cells_within_bounds():
     mesh = pyvista.Cube()
 
@@ -1122,7 +1268,7 @@ def test_point_is_inside_cell():
     assert np.array_equal(in_cell, np.array([True, False]))
 
 
-@pytest.mark.parametrize('pickle_format', ['xml', 'legacy'])
+@pytest.mark.parametrize('pickle_format', ['xml', 'legacy', 'binary'])
 def test_serialize_deserialize(datasets, pickle_format):
     pyvista.set_pickle_format(pickle_format)
     for dataset in datasets:
@@ -1159,12 +1305,60 @@ def test_serialize_deserialize(datasets, pickle_format):
             assert arr_have == pytest.approx(arr_expected)
 
 
+def test_serialize_binary_out_of_band(datasets, datasets_vtk9):
+    pyvista.set_pickle_format('binary')
+    for dataset in datasets + datasets_vtk9:
+        buffers = []
+        data = pickle.dumps(dataset, protocol=5, buffer_callback=buffers.append)
+        dataset_2 = pickle.loads(data, buffers=buffers)
+        assert dataset_2 == dataset
+        assert len(data) < 4096
+
+        # the buffers are wrapped without copy
+        if isinstance(dataset, vtk.vtkPointSet):
+            assert np.shares_memory(dataset_2.points, dataset.points)
+    pyvista.set_pickle_format('xml')
+
+
+def test_serialize_binary_read_only_buffers():
+    pyvista.set_pickle_format('binary')
+    mesh = pyvista.Sphere()
+    mesh.point_data['data'] = np.arange(mesh.n_points, dtype=float)
+    buffers = []
+    data = pickle.dumps(mesh, protocol=5, buffer_callback=buffers.append)
+    buffers = [bytes(buffer.raw()) for buffer in buffers]
+    mesh_2 = pickle.loads(data, buffers=buffers)
+    assert mesh_2 == mesh
+
+    # read-only buffers are copied instead of being modified in place
+    mesh_2.points[:] = 7
+    mesh_2.point_data['data'][:] = 7
+    mesh_3 = pickle.loads(data, buffers=buffers)
+    assert mesh_3 == mesh
+    assert np.all(mesh_2.points == 7)
+    pyvista.set_pickle_format('xml')
+
+
+def test_serialize_binary_active_attributes():
+    pyvista.set_pickle_format('binary')
+    mesh = pyvista.Sphere()
+    mesh.cell_data['vectors'] = np.random.random((mesh.n_cells, 3))
+    mesh.set_active_vectors('vectors', preference='cell')
+    mesh.field_data['text'] = ['a', 'bb']
+    mesh_2 = pickle.loads(pickle.dumps(mesh))
+    assert mesh_2 == mesh
+    assert mesh_2.cell_data.active_vectors_name == 'vectors'
+    assert mesh_2.point_data.active_normals_name == 'Normals'
+    assert mesh_2.field_data['text'].tolist() == ['a', 'bb']
+    pyvista.set_pickle_format('xml')
+
+
 def n_points(dataset):
     # used in multiprocessing test
     return dataset.n_points
 
 
-@pytest.mark.parametrize('pickle_format', ['xml', 'legacy'])
+@pytest.mark.parametrize('pickle_format', ['xml', 'legacy', 'binary'])
 def test_multiprocessing(datasets, pickle_format):
     # exercise pickling via multiprocessing
     pyvista.set_pickle_format(pickle_format)
@@ -1174,6 +1368,99 @@ def test_multiprocessing(datasets, pickle_format):
         assert res == dataset.n_points
 
 
+def shared_n_points(handle):
+    # used in shared memory test
+    dataset = pyvista.from_shared_memory(handle)
+    # only the structure of this data object is modified
+    dataset.point_data.clear()
+    return dataset.n_points
+
+
+def test_shared_memory(datasets, datasets_vtk9):
+    for dataset in datasets + datasets_vtk9:
+        dataset.field_data['values'] = np.arange(3)
+        with dataset.to_shared_memory() as handle:
+            handle_2 = pickle.loads(pickle.dumps(handle))
+            assert len(pickle.dumps(handle)) < 4096
+            dataset_2 = pyvista.from_shared_memory(handle_2)
+            name = handle.name
+        assert not os.path.exists(f'/dev/shm/{name}') or os.name == 'nt'
+
+        # data objects remain valid once the block is released
+        assert dataset_2 == dataset
+        if isinstance(dataset, vtk.vtkPointSet):
+            dataset_2.points[0] += 1
+            assert not np.array_equal(dataset_2.points, dataset.points)
+
+
+def shared_modify_points(handle):
+    # used in shared memory test
+    dataset = pyvista.from_shared_memory(handle)
+    dataset.points += 1
+    return dataset.points[0].tolist()
+
+
+@pytest.mark.skipif(
+    os.name != 'nt' and not os.path.isdir('/dev/shm'),
+    reason='Shared memory is only mapped copy-on-write on Linux and Windows',
+)
+def test_shared_memory_copy_on_write():
+    mesh = pyvista.Sphere()
+    with mesh.to_shared_memory() as handle:
+        shared = pyvista.from_shared_memory(handle)
+        shared.points[0] = 0
+        assert np.array_equal(shared.points[0], [0, 0, 0])
+        assert np.array_equal(pyvista.from_shared_memory(handle).points, mesh.points)
+
+        # writes of the workers do not reach the parent process
+        with multiprocessing.Pool(2) as p:
+            res = p.map(shared_modify_points, [handle] * 2)
+        assert res == [(mesh.points[0] + 1).tolist()] * 2
+        assert np.array_equal(pyvista.from_shared_memory(handle).points, mesh.points)
+
+
+def test_shared_memory_attached(monkeypatch):
+    from pyvista.core.utilities import shared_memory
+
+    # platforms where the blocks are not files attach them as shared memory
+    monkeypatch.setattr(shared_memory, '_SHM_DIR', os.path.join(os.sep, 'missing'))
+    mesh = pyvista.Sphere()
+    with mesh.to_shared_memory() as handle:
+        shared = pyvista.from_shared_memory(handle)
+        shared.points[0] = 0
+        assert np.array_equal(pyvista.from_shared_memory(handle).points[0], [0, 0, 0])
+    # the data object remains valid once the block is released
+    assert np.array_equal(shared.points[1:], mesh.points[1:])
+
+
+def test_shared_memory_unsupported(monkeypatch):
+    from pyvista.core.utilities import shared_memory
+
+    monkeypatch.setattr(shared_memory, 'shared_memory', None)
+    with pytest.raises(RuntimeError, match='not supported on this platform'):
+        pyvista.Sphere().to_shared_memory()
+
+
+def test_shared_memory_multiprocessing(hexbeam):
+    n_arrays = hexbeam.n_arrays
+    with hexbeam.to_shared_memory() as handle:
+        with multiprocessing.Pool(2) as p:
+            res = p.map(shared_n_points, [handle] * 2)
+        assert res == [hexbeam.n_points] * 2
+        assert pyvista.from_shared_memory(handle).n_arrays == n_arrays
+
+
+def test_shared_memory_multiblock():
+    multi = pyvista.MultiBlock({'sphere': pyvista.Sphere(), 'nested': pyvista.MultiBlock([None])})
+    with multi.to_shared_memory() as handle:
+        multi_2 = pyvista.from_shared_memory(handle)
+    assert multi_2 == multi
+    assert multi_2.keys() == ['sphere', 'nested']
+
+    with pytest.raises(TypeError, match='SharedMemoryHandle'):
+        pyvista.from_shared_memory(multi)
+
+
 def test_rotations_should_match_by_a_360_degree_difference():
     mesh = examples.load_airplane()
 
@@ -1760,3 +2047,109 @@ def test_point_neighbors_levels(grid: DataSet, i0, n_levels):
             assert all([0 <= id < grid.n_points for id in ids])
             assert len(ids) > 0
         assert i == n_levels - 1
+
+
+@pytest.mark.parametrize("grid", grids, ids=ids)
+def test_point_adjacency(grid: DataSet):
+    offsets, indices = grid.point_adjacency()
+    assert offsets.shape == (grid.n_points + 1,)
+    assert offsets[-1] == indices.size
+    for i in range(0, grid.n_points, max(grid.n_points // 50, 1)):
+        assert list(indices[offsets[i] : offsets[i + 1]]) == sorted(grid.point_neighbors(i))
+
+
+@pytest.mark.parametrize("grid", grids_cells, ids=ids_cells)
+@pytest.mark.parametrize("connections", ["points", "edges", "faces"])
+def test_cell_adjacency(grid: DataSet, connections):
+    offsets, indices = grid.cell_adjacency(connections)
+    assert offsets.shape == (grid.n_cells + 1,)
+    assert offsets[-1] == indices.size
+    for i in range(0, grid.n_cells, max(grid.n_cells // 50, 1)):
+        expected = sorted(grid.cell_neighbors(i, connections))
+        assert list(indices[offsets[i] : offsets[i + 1]]) == expected
+
+
+def test_adjacency_mixed_polydata():
+    mesh = pyvista.PolyData(
+        np.random.default_rng(0).random((20, 3)),
+        lines=[3, 3, 4, 5, 2, 5, 6],
+        faces=[5, 7, 8, 9, 10, 11, 3, 11, 12, 13, 4, 11, 10, 14, 15],
+    )
+    mesh.verts = [1, 0, 2, 1, 2]
+    offsets, indices = mesh.point_adjacency(connections='edges')
+    assert list(indices[offsets[3] : offsets[4]]) == [4]
+    assert list(indices[offsets[11] : offsets[12]]) == [7, 10, 12, 13, 15]
+
+    mesh = mesh + pyvista.Sphere().triangulate().strip()
+    for connections in ["points", "edges"]:
+        offsets, indices = mesh.cell_adjacency(connections)
+        for i in range(mesh.n_cells):
+            expected = sorted(mesh.cell_neighbors(i, connections))
+            assert list(indices[offsets[i] : offsets[i + 1]]) == expected
+
+
+def test_adjacency_cached():
+    mesh = pyvista.Sphere()
+    offsets, indices = mesh.cell_adjacency()
+    assert not indices.flags.writeable
+    assert mesh.cell_adjacency()[1] is indices
+
+    # modifying points does not modify the topology
+    mesh.points *= 2
+    assert mesh.cell_adjacency()[1] is indices
+
+    mesh.faces = mesh.faces[:8]
+    offsets, indices = mesh.cell_adjacency()
+    assert offsets.size == 3
+    assert list(indices) == [1, 0]
+
+
+def test_adjacency_sparse():
+    mesh = pyvista.Sphere()
+    matrix = mesh.cell_adjacency('edges', sparse=True)
+    offsets, indices = mesh.cell_adjacency('edges')
+    assert matrix.shape == (mesh.n_cells, mesh.n_cells)
+    assert np.array_equal(matrix.indptr, offsets)
+    assert np.array_equal(matrix.indices, indices)
+    assert (matrix != matrix.T).nnz == 0
+
+
+def test_raises_adjacency_connections(grid):
+    with pytest.raises(ValueError, match='got "topological"'):
+        grid.cell_adjacency("topological")
+    with pytest.raises(ValueError, match='got "faces"'):
+        grid.point_adjacency("faces")
+
+
+def test_neighbors_hops():
+    mesh = pyvista.Sphere()
+    hops = mesh.point_neighbors_hops(0, n_levels=3)
+    levels = list(mesh.point_neighbors_levels(0, n_levels=3))
+    for i, level in enumerate(levels):
+        assert np.array_equal(np.flatnonzero(hops == i + 1), level)
+    assert np.flatnonzero(hops == 0).tolist() == [0]
+    assert hops.max() == 3
+
+    hops = mesh.cell_neighbors_hops(0, 'edges', n_levels=2)
+    levels = list(mesh.cell_neighbors_levels(0, 'edges', n_levels=2))
+    for i, level in enumerate(levels):
+        assert np.array_equal(np.flatnonzero(hops == i + 1), level)
+
+
+def test_neighbors_hops_sources():
+    mesh = pyvista.Sphere()
+    seeds = [0, mesh.n_cells - 1]
+    hops, sources = mesh.cell_neighbors_hops(seeds, 'edges', return_sources=True)
+    assert (hops >= 0).all()
+    assert np.isin(sources, seeds).all()
+    assert sources[seeds[0]] == seeds[0]
+    assert sources[seeds[1]] == seeds[1]
+    for seed in seeds:
+        single = mesh.cell_neighbors_hops(seed, 'edges')
+        region = sources == seed
+        assert (hops[region] == single[region]).all()
+
+    with pytest.raises(IndexError):
+        mesh.cell_neighbors_hops(mesh.n_cells)
+    with pytest.raises(IndexError):
+        mesh.point_neighbors_hops([0, -1])
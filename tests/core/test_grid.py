@@ -425,6 +425,31 @@ def test_extract_cells(hexbeam, invert):
     part_beam = hexbeam.extract_cells(ind)
 
 
+@pytest.mark.parametrize("invert", [True, False])
+def test_extract_cells_mask(hexbeam, invert):
+    ind = [1, 2, 3]
+    n_ind = [i for i in range(hexbeam.n_cells) if i not in ind] if invert else ind
+
+    mask = np.zeros(hexbeam.n_cells, dtype=bool)
+    mask[ind] = True
+    part_beam = hexbeam.extract_cells(mask, invert=invert)
+    assert part_beam.n_cells == len(n_ind)
+    assert part_beam.n_points < hexbeam.n_points
+    assert np.allclose(part_beam.cell_data['vtkOriginalCellIds'], n_ind)
+
+
+def test_extract_cells_invert_large():
+    grid = pyvista.ImageData(dimensions=(51, 51, 51)).cast_to_unstructured_grid()
+    ind = np.arange(0, grid.n_cells, 3)
+    part = grid.extract_cells(ind, invert=True)
+    assert part.n_cells == grid.n_cells - ind.size
+    assert np.array_equal(part['vtkOriginalCellIds'], np.setdiff1d(np.arange(grid.n_cells), ind))
+
+    assert grid.extract_cells([], invert=True).n_cells == grid.n_cells
+    with pytest.raises(ValueError, match='Boolean array size must match'):
+        grid.extract_cells(np.ones(10, dtype=bool))
+
+
 def test_merge(hexbeam):
     grid = hexbeam.copy()
     grid.points[:, 0] += 1
@@ -1403,6 +1428,50 @@ def test_ExplicitStructuredGrid_neighbors():
     assert all(np.issubdtype(ind, np.integer) for ind in indices)
     assert indices == [1, 4, 20]
 
+    indices = grid.neighbors([1, 4], rel='topological')
+    assert indices == [0, 2, 5, 8, 21, 24]
+
+    with pytest.raises(ValueError, match='`rel` must be one of'):
+        grid.neighbors(0, rel='foo')
+
+
+def test_ExplicitStructuredGrid_neighbors_chunks(monkeypatch):
+    grid = examples.load_explicit_structured()
+    ind = np.arange(0, grid.n_cells, 3)
+    expected = grid.neighbors(ind, rel='geometric')
+    assert len(expected) > len(ind)
+
+    # cells are processed in chunks bounding the number of compared cells
+    monkeypatch.setattr(pyvista.core.pointset, '_GEOMETRIC_NEIGHBOR_PAIRS', 1)
+    assert grid.neighbors(ind, rel='geometric') == expected
+    assert grid.neighbors([], rel='geometric') == []
+
+
+def test_ExplicitStructuredGrid_face_neighbors():
+    grid = examples.load_explicit_structured()
+    neighbors = grid.face_neighbors(rel='topological')
+    assert neighbors.shape == (grid.n_cells, 6)
+    for i in range(grid.n_cells):
+        assert sorted(neighbors[i][neighbors[i] >= 0]) == grid.neighbors(i, rel='topological')
+    assert np.array_equal(grid.face_neighbors(), neighbors)
+
+    # corners moved apart disconnect the faces of the cells
+    ni, nj, nk = 2, 1, 1
+    corners = np.mgrid[: ni + 1, : nj + 1, : nk + 1].astype(float)
+    for axis in range(1, 4):
+        corners = corners.repeat(2, axis=axis)
+    corners = corners[:, 1:-1, 1:-1, 1:-1].transpose().reshape(-1, 3)
+    grid = pyvista.ExplicitStructuredGrid((ni + 1, nj + 1, nk + 1), corners)
+    assert grid.n_points == 12
+    assert np.array_equal(grid.face_neighbors(), [[-1, 1, -1, -1, -1, -1], [0, -1, -1, -1, -1, -1]])
+    corners[2, 2] += 0.5
+    grid = pyvista.ExplicitStructuredGrid((ni + 1, nj + 1, nk + 1), corners)
+    assert grid.face_neighbors(rel='connectivity').max() == -1
+    assert grid.face_neighbors(rel='topological').max() == 1
+
+    with pytest.raises(ValueError, match='`rel` must be one of'):
+        grid.face_neighbors(rel='geometric')
+
 
 def test_ExplicitStructuredGrid_compute_connectivity():
     connectivity = np.asarray(
@@ -0,0 +1,153 @@
+import numpy as np
+import pytest
+
+import pyvista
+from pyvista.core.errors import PyVistaPipelineError
+from pyvista.core.pipeline import _FilterAlgorithm
+
+
+@pytest.fixture()
+def noise():
+    mesh = pyvista.ImageData(dimensions=(20, 20, 20))
+    mesh.point_data['noise'] = np.random.default_rng(0).random(mesh.n_points)
+    return mesh
+
+
+def test_pipeline(noise):
+    pipeline = noise.pipeline().clip(normal='x').threshold(0.5).extract_surface()
+    assert len(pipeline) == 3
+    assert pipeline.stages[1] == ('threshold', (), {'value': 0.5})
+    assert repr(pipeline) == (
+        "Pipeline(ImageData -> clip(normal='x') -> threshold(value=0.5) -> extract_surface())"
+    )
+    output = pipeline.execute()
+    assert isinstance(output, pyvista.PolyData)
+    assert output == noise.clip(normal='x').threshold(0.5).extract_surface()
+
+
+def test_pipeline_reexecute(noise):
+    pipeline = noise.pipeline().threshold(0.5).extract_surface()
+    algorithms = pipeline._algorithms
+    first = pipeline.execute()
+    mtimes = [alg.GetOutputDataObject(0).GetMTime() for alg in algorithms]
+
+    # unchanged parameters do not run any filter
+    pipeline.set_parameters(0, value=0.5)
+    pipeline.execute()
+    assert [alg.GetOutputDataObject(0).GetMTime() for alg in algorithms] == mtimes
+
+    # only the changed filter and the following ones run
+    pipeline.set_parameters(1, pass_pointid=False)
+    output = pipeline.execute()
+    assert algorithms[0].GetOutputDataObject(0).GetMTime() == mtimes[0]
+    assert 'vtkOriginalPointIds' not in output.point_data
+    assert 'vtkOriginalPointIds' in first.point_data
+
+    # a modified input runs all the filters
+    noise.point_data['noise'] = 1 - noise.point_data['noise']
+    output = pipeline.execute()
+    assert output == noise.threshold(0.5).extract_surface(pass_pointid=False)
+
+    pipeline.input = pyvista.ImageData(dimensions=(3, 3, 3))
+    pipeline.input.point_data['noise'] = np.ones(27)
+    assert pipeline.execute().n_cells == 24
+
+
+def test_pipeline_release_data(noise):
+    pipeline = noise.pipeline(release_data=True).threshold(0.5).extract_surface()
+    output = pipeline.execute()
+    assert output.n_cells
+    assert pipeline._algorithms[0].GetOutputDataObject(0).GetNumberOfCells() == 0
+
+
+def test_pipeline_empty(noise):
+    output = noise.pipeline().execute()
+    assert output == noise
+    assert output is not noise
+
+
+def test_pipeline_composite(noise):
+    blocks = pyvista.MultiBlock([noise, noise.copy()])
+    output = blocks.pipeline().threshold(0.5).execute()
+    assert isinstance(output, pyvista.MultiBlock)
+    assert output[0] == noise.threshold(0.5)
+
+
+def test_pipeline_errors(noise):
+    with pytest.raises(AttributeError, match='no attribute or filter'):
+        noise.pipeline().not_a_filter()
+
+    pipeline = noise.pipeline().threshold(scalars='missing').extract_surface()
+    with pytest.raises(ValueError, match='No arrays'):
+        pipeline.execute()
+    pipeline.set_parameters(0, scalars='noise')
+    assert pipeline.execute().n_cells
+
+    pipeline = noise.pipeline().clip(normal='x', return_clipped=True)
+    with pytest.raises(PyVistaPipelineError, match='instead of a dataset'):
+        pipeline.execute()
+
+
+@pytest.mark.parametrize(
+    ('stages', 'native'),
+    [
+        ([('clip', {'normal': 'x'})], pyvista._vtk.vtkTableBasedClipDataSet),
+        ([('clip', {'normal': 'y', 'invert': False, 'value': 0.2})], None),
+        ([('slice', {'normal': 'z'})], pyvista._vtk.vtkCutter),
+        ([('threshold', {'value': 0.5, 'invert': True})], pyvista._vtk.vtkThreshold),
+        ([('threshold', {'value': (0.2, 0.7), 'all_scalars': True})], None),
+        ([('contour', {'isosurfaces': 3})], pyvista._vtk.vtkContourFilter),
+        ([('extract_surface', {})], pyvista._vtk.vtkDataSetSurfaceFilter),
+        ([('extract_surface', {}), ('smooth', {'n_iter': 10})], None),
+        ([('extract_surface', {}), ('clip', {'normal': 'x'})], None),
+    ],
+)
+@pytest.mark.parametrize('cast', [False, True])
+def test_pipeline_native(noise, stages, native, cast):
+    if cast:
+        noise = noise.cast_to_unstructured_grid()
+    pipeline = noise.pipeline()
+    expected = noise
+    for name, kwargs in stages:
+        pipeline = getattr(pipeline, name)(**kwargs)
+        expected = getattr(expected, name)(**kwargs)
+    # all these filters run their VTK algorithm without any wrapping
+    assert not any(isinstance(alg, _FilterAlgorithm) for alg in pipeline._algorithms)
+    if native is not None:
+        assert isinstance(pipeline._algorithms[0], native)
+    output = pipeline.execute()
+    assert type(output) is type(expected)
+    assert output == expected
+
+
+def test_pipeline_fallback(noise):
+    pipeline = noise.pipeline().clip(normal='x').extract_surface()
+    assert not isinstance(pipeline._algorithms[0], _FilterAlgorithm)
+
+    # parameters without a VTK equivalent fall back to the filter itself,
+    # and the following stages are connected to the new algorithm
+    pipeline.set_parameters(0, crinkle=True)
+    assert isinstance(pipeline._algorithms[0], _FilterAlgorithm)
+    assert pipeline.execute() == noise.clip(normal='x', crinkle=True).extract_surface()
+
+    pipeline.set_parameters(0, crinkle=False)
+    assert not isinstance(pipeline._algorithms[0], _FilterAlgorithm)
+    assert pipeline.execute() == noise.clip(normal='x').extract_surface()
+
+    # filters without a single VTK algorithm are always wrapped
+    pipeline = noise.pipeline().extract_surface().compute_normals()
+    assert isinstance(pipeline._algorithms[1], _FilterAlgorithm)
+    assert pipeline.execute() == noise.extract_surface().compute_normals()
+
+
+def test_pipeline_native_memory():
+    # the intermediate datasets of a native pipeline are only held by VTK,
+    # which releases each one once the next algorithm has run
+    mesh = pyvista.ImageData(dimensions=(30, 30, 30))
+    mesh.point_data['noise'] = np.random.default_rng(0).random(mesh.n_points)
+    pipeline = mesh.pipeline(release_data=True).clip(normal='x').threshold(0.5).extract_surface()
+    output = pipeline.execute()
+    assert output == mesh.clip(normal='x').threshold(0.5).extract_surface()
+    for alg in pipeline._algorithms[:-1]:
+        assert alg.GetOutputDataObject(0).GetNumberOfCells() == 0
+    assert pipeline._algorithms[-1].GetOutputDataObject(0).GetNumberOfCells() == output.n_cells
@@ -4,10 +4,12 @@ import pathlib
 
 import numpy as np
 import pytest
+import vtk
+from vtk.util.numpy_support import vtk_to_numpy
 
 import pyvista
 from pyvista import examples
-from pyvista.core.errors import NotAllTrianglesError
+from pyvista.core.errors import NotAllTrianglesError, PyVistaDeprecationWarning
 from pyvista.errors import PyVistaFutureWarning
 
 radius = 0.5
@@ -239,23 +241,70 @@ def test_ray_trace(sphere):
     assert np.any(ind)
 
 
+def test_ray_trace_matches_obb_tree(sphere):
+    rng = np.random.default_rng(0)
+    origins = rng.uniform(-1, 1, (50, 3))
+    end_points = rng.uniform(-1, 1, (50, 3))
+    for origin, end_point in zip(origins, end_points):
+        points = vtk.vtkPoints()
+        cell_ids = vtk.vtkIdList()
+        sphere.obbTree.IntersectWithLine(origin, end_point, points, cell_ids)
+        expected = vtk_to_numpy(points.GetData())
+        actual, cells = sphere.ray_trace(origin, end_point)
+        assert actual.dtype == expected.dtype
+        assert np.allclose(actual, expected)
+        assert cells.size == actual.shape[0]
+
+    # polygons are triangulated, and the original cell indices returned
+    mesh = pyvista.Cylinder()
+    points, cells = mesh.ray_trace([0, 0, 0], [1, 0, 0])
+    assert np.allclose(points, [[0.5, 0, 0]])
+    assert mesh.get_cell(cells[0]).n_points > 3
+
+
 def test_multi_ray_trace(sphere):
-    pytest.importorskip('rtree')
-    pytest.importorskip('pyembree')
-    pytest.importorskip('trimesh')
     origins = [[1, 0, 1], [0.5, 0, 1], [0.25, 0, 1], [0, 0, 1]]
     directions = [[0, 0, -1]] * 4
-    points, ind_r, ind_t = sphere.multi_ray_trace(origins, directions, retry=True)
+    points, ind_r, ind_t = sphere.multi_ray_trace(origins, directions)
     assert np.any(points)
     assert np.any(ind_r)
     assert np.any(ind_t)
 
+    # hits are sorted by ray and distance, and hits of adjacent triangles
+    # at the poles are merged
+    assert ind_r.tolist() == [2, 2, 3, 3]
+    assert np.allclose(points[2:], [[0, 0, 0.5], [0, 0, -0.5]])
+    for ray in (2, 3):
+        end_point = np.add(origins[ray], np.multiply(directions[ray], 2))
+        expected, expected_cells = sphere.ray_trace(origins[ray], end_point)
+        assert np.allclose(points[ind_r == ray], expected)
+        assert np.array_equal(ind_t[ind_r == ray], expected_cells)
+
+    first, first_r, _ = sphere.multi_ray_trace(origins, directions, first_point=True, workers=2)
+    assert first_r.tolist() == [2, 3]
+    assert np.allclose(first, points[[0, 2]])
+
+    with pytest.warns(PyVistaDeprecationWarning):
+        sphere.multi_ray_trace(origins, directions, retry=True)
+
     # check non-triangulated
     mesh = pyvista.Cylinder()
     with pytest.raises(NotAllTrianglesError):
         mesh.multi_ray_trace(origins, directions)
 
 
+def test_multi_ray_trace_cached(sphere):
+    origins = [[0, 0, 0]] * 2
+    directions = [[1, 0, 0], [0, 0, 1]]
+    points, _, _ = sphere.multi_ray_trace(origins, directions)
+    assert 'ray_bvh' in sphere._locators
+
+    sphere.translate([0.25, 0, 0], inplace=True)
+    moved, _, _ = sphere.multi_ray_trace(origins, directions)
+    assert not np.allclose(moved, points)
+    assert np.allclose(moved[0], [0.75, 0, 0], atol=1e-2)
+
+
 def test_edge_mask(sphere):
     _ = sphere.edge_mask(10, progress_bar=True)
 
@@ -681,6 +730,20 @@ def test_remove_points_all(sphere):
     assert sphere_copy.n_faces == sphere.n_faces - 1
 
 
+def test_remove_points_indices(sphere):
+    remove = np.arange(0, sphere.n_points, 5)
+    mask = np.zeros(sphere.n_points, dtype=bool)
+    mask[remove] = True
+    mesh, ridx = sphere.remove_points(remove)
+    mesh_mask, ridx_mask = sphere.remove_points(mask)
+    assert np.array_equal(ridx, ridx_mask)
+    assert mesh == mesh_mask
+    assert not np.isin(ridx, remove).any()
+    assert np.allclose(mesh.points, sphere.points[ridx])
+    faces = ridx[mesh.faces.reshape(-1, 4)[:, 1:]]
+    assert not np.isin(faces, remove).any()
+
+
 def test_remove_points_fail(sphere, plane):
     # not triangles:
     with pytest.raises(NotAllTrianglesError):
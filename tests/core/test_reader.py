@@ -519,6 +519,132 @@ def test_pvdreader_no_part_group():
         assert dataset.part == 0
 
 
+@pytest.fixture()
+def pvd_series(tmp_path):
+    """Write a series of 4 time steps of 2 parts each and return the PVD file name."""
+    datasets = []
+    for time in range(4):
+        for part in range(2):
+            mesh = pyvista.Sphere(center=(part, 0, 0))
+            mesh.point_data['time'] = np.full(mesh.n_points, time)
+            mesh.cell_data['ids'] = np.arange(mesh.n_cells)
+            filename = f'sphere_{time}_{part}.vtp'
+            mesh.save(tmp_path / filename)
+            datasets.append(f'<DataSet timestep="{time}" part="{part}" file="{filename}"/>')
+    filename = tmp_path / 'series.pvd'
+    filename.write_text(
+        '<?xml version="1.0"?>\n<VTKFile type="Collection" version="0.1">\n<Collection>\n'
+        + '\n'.join(datasets)
+        + '\n</Collection>\n</VTKFile>\n'
+    )
+    return str(filename)
+
+
+@pytest.mark.parametrize('prefetch', [0, 1, 3])
+def test_iter_time_steps(pvd_series, prefetch):
+    reader = pyvista.get_reader(pvd_series)
+    reader.set_active_time_point(2)
+
+    steps = list(reader.iter_time_steps(prefetch=prefetch))
+    assert [time for time, _ in steps] == [0.0, 1.0, 2.0, 3.0]
+    for time, mesh in steps:
+        assert mesh.n_blocks == 2
+        assert np.all(mesh[1]['time'] == time)
+    assert reader.active_time_value == 2.0
+
+    steps = reader.iter_time_steps(1, None, 2, prefetch=prefetch, cell_arrays=[])
+    assert [time for time, _ in steps] == [1.0, 3.0]
+    for _, mesh in reader.iter_time_steps(prefetch=prefetch, point_arrays=[], cell_arrays=['ids']):
+        assert mesh[0].array_names == ['ids']
+
+    # stop the iteration early
+    steps = reader.iter_time_steps(prefetch=prefetch)
+    next(steps)
+    steps.close()
+    assert reader.active_time_value == 2.0
+
+
+def test_iter_time_steps_errors(pvd_series):
+    reader = pyvista.get_reader(pvd_series)
+    with pytest.raises(ValueError, match='prefetch'):
+        next(reader.iter_time_steps(prefetch=-1))
+
+    os.remove(os.path.join(os.path.dirname(pvd_series), 'sphere_2_0.vtp'))
+    steps = reader.iter_time_steps(prefetch=2)
+    assert next(steps)[0] == 0.0
+    assert next(steps)[0] == 1.0
+    with pytest.raises(FileNotFoundError):
+        next(steps)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_pvdreader_cache(pvd_series, workers, monkeypatch):
+    read_part = pyvista.core.utilities.reader._read_part
+    n_reads = []
+
+    def counting_read_part(reader):
+        n_reads.append(reader.path)
+        return read_part(reader)
+
+    monkeypatch.setattr(pyvista.core.utilities.reader, '_read_part', counting_read_part)
+    reader = pyvista.PVDReader(pvd_series)
+    assert reader.cache_size == 0
+    reader.read()
+    reader.read()
+    assert len(n_reads) == 4
+    assert not reader.reader._cache
+    n_reads.clear()
+
+    reader.workers = workers
+    assert reader.workers == workers
+    reader.cache_size = 2**30
+    for time_point in [0, 1, 0, 1]:
+        reader.set_active_time_point(time_point)
+        mesh = reader.read()
+        assert mesh.n_blocks == 2
+        assert np.all(mesh[0]['time'] == time_point)
+        assert np.all(mesh[1]['time'] == time_point)
+    assert len(n_reads) == 4
+    assert len(set(map(id, reader.reader._readers.values()))) == 4
+
+    # a different array selection is not read from the cache
+    reader.active_readers[0].disable_point_array('time')
+    assert 'time' not in reader.read()[0].array_names
+    assert len(n_reads) == 6
+
+    # a cache too small for one time step
+    reader.cache_size = reader.read().actual_memory_size * 1024 - 1
+    assert not reader.reader._cache
+    reader.read()
+    assert len(n_reads) == 8
+
+    reader.cache_size = 2**30
+    reader.read()
+    reader.clear_cache()
+    reader.read()
+    assert len(n_reads) == 12
+
+    with pytest.raises(ValueError, match='cache_size'):
+        reader.cache_size = -1
+    with pytest.raises(ValueError):
+        reader.workers = 0
+
+
+def test_pvdreader_cache_copies(pvd_series):
+    reader = pyvista.PVDReader(pvd_series)
+    reader.cache_size = 2**30
+    mesh = reader.read()
+    mesh[0]['time'][:] = -1
+    mesh[0].points[:] = 0
+
+    # neither the first read nor the reads from the cache share arrays with it
+    for _ in range(2):
+        mesh = reader.read()
+        assert np.all(mesh[0]['time'] == 0)
+        assert np.any(mesh[0].points != 0)
+        mesh[0]['time'][:] = -1
+
+
 def get_cavity_reader():
     filename = examples.download_cavity(load=False)
     return pyvista.get_reader(filename)
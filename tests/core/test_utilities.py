@@ -1,8 +1,10 @@
 """Test pyvista core utilities."""
+import json
 import os
 import pathlib
 import pickle
 import shutil
+import time
 import unittest.mock as mock
 import warnings
 
@@ -21,10 +23,16 @@ from pyvista.core.utilities.arrays import (
     raise_has_duplicates,
     vtk_id_list_to_array,
 )
+from pyvista.core.utilities.collision import _get_collision_filter, _sweep_and_prune
 from pyvista.core.utilities.docs import linkcode_resolve
 from pyvista.core.utilities.fileio import get_ext
 from pyvista.core.utilities.helpers import is_inside_bounds
-from pyvista.core.utilities.misc import assert_empty_kwargs, check_valid_vector, has_module
+from pyvista.core.utilities.misc import (
+    _map_chunks,
+    assert_empty_kwargs,
+    check_valid_vector,
+    has_module,
+)
 from pyvista.core.utilities.observers import Observer
 from pyvista.core.utilities.points import vector_poly_data
 from pyvista.errors import PyVistaDeprecationWarning
@@ -194,6 +202,73 @@ def test_read_force_ext_wrong_extension(tmpdir):
         fileio.read(fname, force_ext='.not_supported')
 
 
+@pytest.mark.parametrize('mmap', [True, False])
+def test_pvnpy(datasets, tmpdir, mmap):
+    for i, dataset in enumerate(datasets):
+        dataset.point_data['complex'] = np.arange(dataset.n_points) * (1 + 1j)
+        dataset.field_data['names'] = ['a', 'b']
+        filename = str(tmpdir.join(f'dataset_{i}.pvnpy'))
+        dataset.save(filename)
+        assert 'complex' in dataset.point_data
+        assert dataset.field_data.keys() == ['names']
+
+        mesh = pyvista.read(filename, mmap=mmap)
+        assert type(mesh) is type(dataset)
+        assert mesh == dataset
+        assert mesh.point_data['complex'].dtype == np.complex128
+
+        # modifying a memory mapped mesh does not modify the file
+        mesh.points[:] = 0
+        assert pyvista.read(filename, mmap=mmap) == dataset
+
+
+def test_pvnpy_composite(tmpdir, sphere, hexbeam):
+    multi = pyvista.MultiBlock({'sphere': sphere, 'nested': pyvista.MultiBlock([None, hexbeam])})
+    filename = str(tmpdir.join('multi.pvnpy'))
+    multi.save(filename)
+    multi_in = pyvista.read(filename, mmap=True)
+    assert multi_in == multi
+    assert multi_in.keys() == multi.keys()
+    assert multi_in['nested'][0] is None
+
+    table = pyvista.Table({'a': np.arange(5), 'b': np.arange(5.0)})
+    filename = str(tmpdir.join('table.pvnpy'))
+    pyvista.save_pvnpy(filename, table)
+    assert pyvista.read_pvnpy(filename) == table
+
+    # existing arrays are replaced when saving again
+    pyvista.save_pvnpy(filename, pyvista.Table())
+    assert pyvista.read_pvnpy(filename).n_arrays == 0
+    assert not list(pathlib.Path(filename).glob('*.npy'))
+
+
+@pytest.mark.parametrize('compression', [fileio.zipfile.ZIP_STORED, fileio.zipfile.ZIP_DEFLATED])
+def test_pvnpy_zip(tmpdir, hexbeam, compression):
+    directory = pathlib.Path(str(tmpdir.join('hexbeam.pvnpy')))
+    hexbeam.save(directory)
+    filename = str(tmpdir.join('hexbeam.zip'))
+    with fileio.zipfile.ZipFile(filename, 'w', compression) as archive:
+        for path in directory.iterdir():
+            archive.write(path, f'hexbeam.pvnpy/{path.name}')
+    shutil.rmtree(directory)
+    assert pyvista.read_pvnpy(filename) == hexbeam
+    assert pyvista.read_pvnpy(filename, mmap=False) == hexbeam
+
+
+def test_pvnpy_errors(tmpdir, sphere):
+    with pytest.raises(ValueError, match='pvnpy'):
+        pyvista.read(ex.planefile, mmap=True)
+    with pytest.raises(FileNotFoundError):
+        pyvista.read(str(tmpdir.join('missing.pvnpy')))
+    filename = str(tmpdir.join('file.pvnpy'))
+    with open(filename, 'w') as fid:
+        fid.write('not a directory')
+    with pytest.raises(ValueError, match='neither'):
+        pyvista.read_pvnpy(filename)
+    with pytest.raises(FileExistsError):
+        sphere.save(filename)
+
+
 @mock.patch('pyvista.core.utilities.fileio.read')
 def test_read_legacy(read_mock):
     with pytest.warns(PyVistaDeprecationWarning):
@@ -745,6 +820,10 @@ def test_set_pickle_format():
     pyvista.set_pickle_format('xml')
     assert pyvista.PICKLE_FORMAT == 'xml'
 
+    pyvista.set_pickle_format('binary')
+    assert pyvista.PICKLE_FORMAT == 'binary'
+    pyvista.set_pickle_format('xml')
+
     with pytest.raises(ValueError):
         pyvista.set_pickle_format('invalid_format')
 
@@ -871,3 +950,253 @@ def test_coerce_points_like_args_does_not_copy():
 def test_has_module():
     assert has_module('pytest')
     assert not has_module('not_a_module')
+
+
+@pytest.mark.parametrize('workers', [1, 4, -1])
+@pytest.mark.parametrize('n_items', [0, 3, 100])
+def test_map_chunks(workers, n_items):
+    bounds = _map_chunks(lambda start, stop: (start, stop), n_items, workers=workers, chunk_size=7)
+    assert bounds[0][0] == 0
+    assert bounds[-1][1] == n_items
+    assert all(bounds[i][1] == bounds[i + 1][0] for i in range(len(bounds) - 1))
+    assert all(stop - start <= 7 for start, stop in bounds)
+
+    with pytest.raises(ValueError, match='`workers` must be'):
+        _map_chunks(lambda start, stop: None, n_items, workers=0)
+
+
+@pytest.fixture()
+def filter_cache():
+    pyvista.set_filter_cache(64 * 1024**2)
+    yield
+    pyvista.set_filter_cache(None)
+
+
+def test_filter_cache(filter_cache, uniform):
+    uniform.point_data.set_array(np.zeros(uniform.n_points), 'zeros')
+    surface = uniform.extract_surface()
+    assert uniform.extract_surface(progress_bar=True) == surface
+    assert uniform.extract_surface() is not surface
+    info = pyvista.filter_cache_info()
+    assert (info.hits, info.misses, info.n_items) == (2, 1, 1)
+    uncached = type(uniform).extract_surface.__wrapped__(uniform)
+    assert info.nbytes == uncached.actual_memory_size * 1024
+
+    # different arguments
+    uniform.extract_surface(pass_pointid=False)
+    assert pyvista.filter_cache_info().misses == 2
+
+    # chained filters on unmodified outputs
+    normals = uniform.extract_surface().compute_normals()
+    assert uniform.extract_surface().compute_normals() == normals
+    assert pyvista.filter_cache_info().hits == 5
+
+    # modified input
+    uniform.point_data.remove('zeros')
+    assert 'zeros' not in uniform.extract_surface().point_data
+    assert pyvista.filter_cache_info().misses == 4
+
+    # inplace filters are not cached
+    surface.compute_normals(inplace=True)
+    assert pyvista.filter_cache_info().misses == 4
+
+    pyvista.clear_filter_cache()
+    assert pyvista.filter_cache_info() == (0, 0, 0, 0, 64 * 1024**2)
+
+
+def test_filter_cache_copies(filter_cache):
+    mesh = pyvista.Sphere()
+    normals = mesh.compute_normals()
+    expected = normals['Normals'].copy()
+
+    # modifying the outputs in place does not modify the cached output
+    normals['Normals'][:] = 0
+    cached = mesh.compute_normals()
+    assert pyvista.filter_cache_info().hits == 1
+    assert np.array_equal(cached['Normals'], expected)
+    cached['Normals'][:] = 0
+    assert np.array_equal(mesh.compute_normals()['Normals'], expected)
+    assert pyvista.filter_cache_info().hits == 2
+
+
+def test_filter_cache_eviction(filter_cache):
+    spheres = [pyvista.Sphere(theta_resolution=100, phi_resolution=100) for _ in range(4)]
+    nbytes = spheres.pop().triangulate().actual_memory_size * 1024
+    pyvista.set_filter_cache(2 * nbytes)
+    for sphere in spheres:
+        sphere.triangulate()
+    assert pyvista.filter_cache_info().n_items == 2
+    spheres[0].triangulate()
+    assert pyvista.filter_cache_info().hits == 0
+
+    # released with their input
+    del spheres, sphere
+    assert pyvista.filter_cache_info().n_items == 0
+
+    with pytest.raises(ValueError, match='must be positive'):
+        pyvista.set_filter_cache(-1)
+
+
+def test_profile(uniform, tmpdir):
+    with pyvista.profile() as prof:
+        surface = uniform.threshold(300, progress_bar=True).extract_surface()
+    assert [(event.filter, event.phase) for event in prof.events] == [
+        ('threshold', 'update'),
+        ('threshold', 'output'),
+        ('extract_surface', 'update'),
+        ('extract_surface', 'output'),
+    ]
+    threshold, _, extract, output = prof.events
+    assert threshold.algorithm == 'vtkThreshold'
+    assert (threshold.n_input_points, threshold.n_input_cells) == (
+        uniform.n_points,
+        uniform.n_cells,
+    )
+    assert extract.n_output_cells == surface.n_cells
+    assert output.output_nbytes == surface.actual_memory_size * 1024
+    assert all(event.duration >= 0 for event in prof.events)
+    assert repr(prof).startswith('Profile(4 events')
+
+    # hooks are removed when leaving the context
+    uniform.extract_surface()
+    assert len(prof.events) == 4
+
+    table = prof.to_table()
+    assert table.n_rows == 4
+    assert table['filter'].tolist() == [event.filter for event in prof.events]
+    assert np.array_equal(table['duration'], [event.duration for event in prof.events])
+
+    filename = str(tmpdir.join('trace.json'))
+    trace = prof.to_chrome_trace(filename)
+    with open(filename) as f:
+        assert json.load(f) == trace
+    assert len(trace['traceEvents']) == 4
+    assert trace['traceEvents'][0]['ts'] == 0
+    assert trace['traceEvents'][2]['args']['algorithm'] == 'vtkDataSetSurfaceFilter'
+
+
+def test_profile_hook(sphere):
+    events = []
+    pyvista.add_profile_hook(events.append)
+    try:
+        sphere.compute_normals()
+    finally:
+        pyvista.remove_profile_hook(events.append)
+    sphere.compute_normals()
+    assert [event.algorithm for event in events] == ['vtkPolyDataNormals'] * 2
+
+    with pytest.raises(ValueError):
+        pyvista.remove_profile_hook(events.append)
+
+
+def test_profile_filter_name(sphere):
+    # filters running their algorithm in a private helper are recorded
+    # under their public name
+    with pyvista.profile() as prof:
+        sphere.clip(normal='x')
+        sphere.clip_box(invert=False)
+    assert {event.filter for event in prof.events} == {'clip', 'clip_box'}
+
+
+def test_sweep_and_prune():
+    rng = np.random.default_rng(0)
+    lower = rng.uniform(0, 10, (200, 3))
+    upper = lower + rng.uniform(0, 2, (200, 3))
+    pairs = _sweep_and_prune(lower, upper)
+
+    overlap = np.all(
+        (lower[:, np.newaxis] <= upper[np.newaxis]) & (lower[np.newaxis] <= upper[:, np.newaxis]),
+        axis=-1,
+    )
+    expected = np.argwhere(np.triu(overlap, k=1))
+    assert np.array_equal(pairs, expected)
+    assert _sweep_and_prune(lower[:1], upper[:1]).shape == (0, 2)
+
+
+def test_collide_all():
+    sphere = pyvista.Sphere(theta_resolution=10, phi_resolution=10)
+    cube = pyvista.Cube(center=(1.6, 0, 0.5))
+    grid = pyvista.ImageData(dimensions=(3, 3, 3), spacing=(0.5,) * 3, origin=(-0.13, -0.21, 0))
+    meshes = [sphere, sphere, cube, grid]
+    transform = vtk.vtkTransform()
+    transform.Translate(0, 0, -1.45)
+    transforms = [None, np.eye(4), None, transform]
+    transforms[1][0, 3] = 0.8
+
+    contacts = pyvista.collide_all(meshes, transforms)
+    assert contacts.keys() == ['mesh_a', 'mesh_b', 'cell_a', 'cell_b', 'point']
+    pairs = np.column_stack((contacts['mesh_a'], contacts['mesh_b']))
+    assert np.unique(pairs, axis=0).tolist() == [[0, 1], [0, 3], [1, 2], [1, 3]]
+    assert contacts['cell_b'][pairs[:, 1] == 3].max() < grid.n_cells
+
+    # contacts match the collisions of each pair of transformed meshes
+    surfaces = [
+        sphere,
+        sphere.translate([0.8, 0, 0], inplace=False),
+        cube.triangulate(),
+        grid.extract_surface().translate([0, 0, -1.45]),
+    ]
+    for i in range(4):
+        for j in range(i + 1, 4):
+            _, n_contacts = surfaces[i].collision(surfaces[j])
+            assert n_contacts == np.sum((pairs[:, 0] == i) & (pairs[:, 1] == j))
+
+    # the narrow phase filters are reused with updated transforms
+    filters = sphere._locators['collision_filters'][0]
+    alg = filters[id(sphere)][1]
+    transforms[1][0, 3] = 0.9
+    contacts = pyvista.collide_all(meshes, transforms, contact_mode=2)
+    assert filters[id(sphere)][1] is alg
+    assert contacts['point'].shape == (contacts.n_rows, 3)
+    assert contacts.n_rows > 0
+
+    sphere.points *= 2
+    pyvista.collide_all(meshes, transforms)
+    assert filters[id(sphere)][1] is not alg
+
+    # the filters of the pairs which no longer overlap are freed
+    assert set(filters) == {id(sphere), id(cube), id(grid)}
+    transforms[3] = np.eye(4)
+    transforms[3][0, 3] = 10
+    pyvista.collide_all(meshes, transforms)
+    assert set(filters) == {id(sphere), id(cube)}
+
+    assert pyvista.collide_all([]).n_rows == 0
+    assert pyvista.collide_all([sphere, pyvista.PolyData()]).n_rows == 0
+    with pytest.raises(ValueError, match='one 4x4 transformation matrix'):
+        pyvista.collide_all(meshes, transforms[:2])
+
+
+def test_collide_all_filters_keyed_by_mesh():
+    sphere = pyvista.Sphere()
+    meshes = [sphere, sphere.copy(), sphere.copy()]
+    transforms = np.tile(np.eye(4), (3, 1, 1))
+    transforms[:, 0, 3] = [0, 0.9, 10]
+    pyvista.collide_all(meshes, transforms)
+    alg = sphere._locators['collision_filters'][0][id(meshes[1])][1]
+
+    # the filters follow the meshes rather than their position in the list
+    meshes[1], meshes[2] = meshes[2], meshes[1]
+    transforms[:, 0, 3] = [0, 10, 0.9]
+    contacts = pyvista.collide_all(meshes, transforms)
+    assert sphere._locators['collision_filters'][0][id(meshes[2])][1] is alg
+    assert np.unique(contacts['mesh_b']).tolist() == [2]
+
+
+def test_collide_all_reuses_obb_trees():
+    # the narrow phase filters are executed once on a single triangle so
+    # that they do not build their OBB trees again on their next execution,
+    # which relies on the implementation of vtkCollisionDetectionFilter
+    sphere = pyvista.Sphere(theta_resolution=100, phi_resolution=100)
+    alg = _get_collision_filter(sphere, sphere.copy(), 0.001, 2)
+    times = []
+    for offset in range(10, 50, 10):
+        matrix = np.eye(4)
+        matrix[0, 3] = offset
+        alg.GetMatrix(1).DeepCopy(matrix.ravel())
+        start = time.perf_counter()
+        alg.Update()
+        times.append(time.perf_counter() - start)
+    # building the trees of the disjoint spheres takes much longer than
+    # testing their root boxes
+    assert max(times[1:]) < times[0] / 10
@@ -289,8 +289,11 @@ def test_slice_orthogonal_filter(datasets):
         assert slices is not None
         assert isinstance(slices, pyvista.MultiBlock)
         assert slices.n_blocks == 3
+        # the points have the precision of a single slice
+        dtype = dataset.slice(normal='x').points.dtype
         for slc in slices:
             assert isinstance(slc, pyvista.PolyData)
+            assert slc.points.dtype == dtype
 
 
 def test_slice_orthogonal_filter_composite(composite):
@@ -308,8 +311,10 @@ def test_slice_along_axis(datasets):
         assert slices is not None
         assert isinstance(slices, pyvista.MultiBlock)
         assert slices.n_blocks == ns[i]
+        dtype = dataset.slice(normal='x').points.dtype
         for slc in slices:
             assert isinstance(slc, pyvista.PolyData)
+            assert slc.n_points == 0 or slc.points.dtype == dtype
     dataset = examples.load_uniform()
     with pytest.raises(ValueError):
         dataset.slice_along_axis(axis='u')
@@ -321,6 +326,108 @@ def test_slice_along_axis_composite(composite):
     assert output.n_blocks == composite.n_blocks
 
 
+@pytest.mark.parametrize('generate_triangles', [False, True])
+def test_slice_along_axis_matches_slice(hexbeam, generate_triangles):
+    hexbeam.cell_data['cell_ids'] = np.arange(hexbeam.n_cells)
+    slices = hexbeam.slice_along_axis(
+        n=5, axis='z', tolerance=0.0, generate_triangles=generate_triangles
+    )
+    centers = np.linspace(*hexbeam.bounds[4:], 5)
+    for slc, center in zip(slices, centers):
+        expected = hexbeam.slice(
+            normal='z', origin=(0, 0, center), generate_triangles=generate_triangles
+        )
+        assert slc.n_points == expected.n_points
+        assert slc.n_cells == expected.n_cells
+        assert slc.array_names == expected.array_names
+        for name in expected.array_names:
+            assert np.array_equal(np.sort(slc[name]), np.sort(expected[name]))
+        assert np.allclose(np.sort(slc.points, axis=0), np.sort(expected.points, axis=0))
+
+
+def test_slice_along_axis_profile(hexbeam):
+    with pyvista.profile() as prof:
+        hexbeam.slice_along_axis(n=3, axis='z')
+    assert prof.events
+    assert {event.filter for event in prof.events} == {'slice_along_axis'}
+
+
+def test_slice_combine(uniform):
+    slices = uniform.slice_along_axis(n=4)
+    combined = uniform.slice_along_axis(n=4, combine=True)
+    assert isinstance(combined, pyvista.PolyData)
+    assert combined.n_cells == sum(slc.n_cells for slc in slices)
+    counts = np.bincount(combined.cell_data['slice_index'], minlength=4)
+    assert counts.tolist() == [slc.n_cells for slc in slices]
+
+    combined = uniform.slice_orthogonal(combine=True)
+    assert isinstance(combined, pyvista.PolyData)
+    assert np.unique(combined.cell_data['slice_index']).tolist() == [0, 1, 2]
+    assert 'slice_index' not in uniform.cell_data
+
+
+@pytest.mark.parametrize(
+    'filter_name, kwargs',
+    [
+        ('clip', {'normal': 'z'}),
+        ('slice', {'normal': 'y'}),
+        ('slice_orthogonal', {}),
+        ('slice_along_axis', {'n': 3}),
+        ('threshold', {'scalars': 'Spatial Point Data'}),
+        ('contour', {'isosurfaces': 3, 'scalars': 'Spatial Point Data'}),
+        ('extract_surface', {}),
+    ],
+)
+def test_filter_composite_workers(uniform, filter_name, kwargs):
+    # some filters use another algorithm for polydata than for composites
+    sphere = pyvista.Sphere(radius=5, center=uniform.center)
+    sphere['Spatial Point Data'] = sphere.points[:, 2]
+    composite = pyvista.MultiBlock(
+        {'a': uniform, 'nested': pyvista.MultiBlock({'b': uniform.translate((12, 0, 0))})}
+    )
+    composite['nested'].append(None, 'empty')
+    composite['nested'].append(sphere, 'sphere')
+    serial = getattr(composite, filter_name)(**kwargs)
+    output = getattr(composite, filter_name)(workers=2, **kwargs)
+    assert output.keys() == ['a', 'nested']
+    assert output['nested'].keys() == ['b', 'empty', 'sphere']
+    assert output['nested']['empty'] is None
+    for name in ['b', 'sphere']:
+        assert isinstance(output['nested'][name], type(serial['nested'][name]))
+        assert output['nested'][name] == serial['nested'][name]
+    assert output['a'] == serial['a']
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_filter_composite_missing_array(workers):
+    sphere = pyvista.Sphere()
+    sphere['x'] = sphere.points[:, 0]
+    composite = pyvista.MultiBlock([sphere, pyvista.Cube()])
+
+    # blocks without the array give empty outputs
+    output = composite.threshold(0.0, scalars='x', workers=workers)
+    assert output[0] == sphere.threshold(0.0, scalars='x')
+    assert isinstance(output[1], pyvista.UnstructuredGrid)
+    assert output[1].n_cells == 0
+
+    output = composite.contour(3, scalars='x', workers=workers, progress_bar=True)
+    assert output[0] == sphere.contour(3, scalars='x', rng=sphere.get_data_range('x'))
+    assert isinstance(output[1], pyvista.PolyData)
+    assert output[1].n_cells == 0
+
+
+def test_contour_composite_range(uniform):
+    composite = pyvista.MultiBlock([uniform, uniform.copy()])
+    composite[1]['Spatial Point Data'] = uniform['Spatial Point Data'] + 100
+    rng = composite.get_data_range('Spatial Point Data')
+    output = composite.contour(4, scalars='Spatial Point Data')
+    for block in output:
+        values = block['Spatial Point Data']
+        assert np.all(np.isclose(values[:, None], np.linspace(*rng, 4)).any(axis=1))
+    with pytest.raises(TypeError, match='name'):
+        composite.contour(scalars=uniform['Spatial Point Data'])
+
+
 def test_threshold(datasets):
     for dataset in datasets[0:3]:
         thresh = dataset.threshold(progress_bar=True)
@@ -1651,6 +1758,14 @@ def test_extract_points():
     assert sub_surf_adj.n_cells == 4
     assert sub_surf_nocells.cells[0] == 1
 
+    # boolean masks select the same points
+    mask = np.zeros(surf.n_points, dtype=bool)
+    mask[[0, 1, 4, 5]] = True
+    assert surf.extract_points(mask) == sub_surf_adj
+    assert surf.extract_points(mask, adjacent_cells=False) == sub_surf
+    with pytest.raises(ValueError, match='Boolean array size must match'):
+        surf.extract_points(mask[:-1])
+
 
 def test_slice_along_line_composite(composite):
     # Now test composite data structures
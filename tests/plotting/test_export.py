@@ -1,4 +1,6 @@
+import gzip
 import os
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -80,3 +82,26 @@ def test_vtkjs_url():
     vtkjs_url = 'http://viewer.pyvista.org/?fileURL=https://dl.dropbox.com/s/6m5ttdbv5bf4ngj/ripple.vtkjs?dl=0'
     assert vtkjs_url in pyvista.get_vtkjs_url(file_url)
     assert vtkjs_url in pyvista.get_vtkjs_url('dropbox', file_url)
+
+
+def test_dump_data_array(tmpdir, monkeypatch):
+    from pyvista.plotting import export_vtkjs
+
+    data_dir = str(tmpdir)
+    cells = pyvista.Sphere().GetPolys().GetData()
+    root = export_vtkjs.dump_data_array(data_dir, data_dir, cells, compress=False)
+    assert root['dataType'] == 'Uint32Array'
+    with open(os.path.join(data_dir, root['ref']['id']), 'rb') as f:
+        assert np.array_equal(np.frombuffer(f.read(), np.uint32), pyvista.convert_array(cells))
+
+    # compressed arrays are reused between exports
+    monkeypatch.setattr(export_vtkjs, '_blob_cache', export_vtkjs.OrderedDict())
+    compress = mock.Mock(wraps=export_vtkjs.gzip.compress)
+    monkeypatch.setattr(export_vtkjs.gzip, 'compress', compress)
+    with export_vtkjs._BlobWriter():
+        export_vtkjs.dump_data_array(data_dir, data_dir, cells)
+        export_vtkjs.dump_data_array(data_dir, data_dir, cells)
+    export_vtkjs.dump_data_array(data_dir, data_dir, cells)
+    assert compress.call_count == 1
+    with gzip.open(os.path.join(data_dir, root['ref']['id'] + '.gz')) as f:
+        assert np.array_equal(np.frombuffer(f.read(), np.uint32), pyvista.convert_array(cells))
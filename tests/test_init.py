@@ -19,3 +19,55 @@ def test_vtk_not_loaded():
 
     # anything other than 0 indicates an error
     assert not os.system(f'{sys.executable} -c "{exe_str}"'), developer_note
+
+
+def test_plotting_not_loaded():
+    """Verify that using the core API does not load the plotting modules.
+
+    Headless applications only reading, filtering and writing meshes
+    should not pay for importing the rendering libraries of VTK.
+
+    """
+    exe_str = (
+        "import sys; import pyvista; "
+        "mesh = pyvista.Sphere().elevation().threshold(0.5).extract_surface(); "
+        "assert 'pyvista.plotting.plotter' not in sys.modules; "
+        "assert not [m for m in sys.modules if m.startswith('vtkmodules.vtkRendering')]; "
+        "assert 'matplotlib' not in sys.modules; "
+        "assert pyvista.Plotter.__module__ == 'pyvista.plotting.plotter'"
+    )
+
+    assert not os.system(f'{sys.executable} -c "{exe_str}"')
+
+
+def test_vtk_modules_loaded_lazily():
+    """Verify that VTK modules are only loaded when first used."""
+    exe_str = (
+        "import sys; import pyvista; "
+        "prefixes = ('vtkmodules.vtkIO', 'vtkmodules.vtkImaging'); "
+        "assert not [m for m in sys.modules if m.startswith(prefixes)]; "
+        "assert 'vtkmodules.vtkFiltersSources' not in sys.modules; "
+        "pyvista.Sphere(); "
+        "assert 'vtkmodules.vtkFiltersSources' in sys.modules"
+    )
+
+    assert not os.system(f'{sys.executable} -c "{exe_str}"')
+
+
+def test_lazy_namespace_unchanged():
+    """Verify that the lazily imported names resolve to the same objects."""
+    exe_str = (
+        "import pyvista; from pyvista import plotting; "
+        "assert pyvista.utilities is plotting.utilities; "
+        "assert pyvista.helpers is plotting.helpers; "
+        "assert pyvista.errors is plotting.errors; "
+        "assert callable(pyvista.utilities.start_xvfb); "
+        "assert pyvista.utilities.xvfb is plotting.utilities.xvfb; "
+        "assert pyvista.helpers.plot_arrows is pyvista.plot_arrows; "
+        "names = dir(pyvista); "
+        "assert {'plotter', 'renderer', 'widgets', 'colors', 'tools', 'opts'} <= set(names); "
+        "assert not {'importlib', 'threading'} & set(names); "
+        "assert pyvista.opts is plotting.opts"
+    )
+
+    assert not os.system(f'{sys.executable} -c "{exe_str}"')
@@ -60,3 +60,45 @@ def test_file_format():
 
     with pytest.raises((KeyError, WriteError)):
         pyvista.save_meshio("foo.npy", beam, file_format="npy")
+
+
+def test_meshio_mixed_cells(tmpdir):
+    voxels = pyvista.ImageData(dimensions=(3, 3, 3)).cast_to_unstructured_grid()
+    pixels = pyvista.ImageData(dimensions=(3, 3, 1)).cast_to_unstructured_grid()
+    polygons = pyvista.PolyData(
+        [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 1.0], [0.0, 2.0, 0.0]],
+        faces=[5, 0, 1, 2, 3, 4, 3, 0, 1, 2, 3, 0, 2, 3, 4, 0, 1, 2, 3],
+    ).cast_to_unstructured_grid()
+    mesh = voxels + pixels.translate((5, 0, 0)) + polygons.translate((10, 0, 0)) + beam
+    mesh.cell_data['cell_ids'] = np.arange(mesh.n_cells)
+
+    filename = str(tmpdir.join('mixed.vtu'))
+    pyvista.save_meshio(filename, mesh)
+    mesh_in = pyvista.read_meshio(filename)
+    assert mesh_in.n_cells == mesh.n_cells
+    assert np.array_equal(mesh_in.cell_data['cell_ids'], mesh.cell_data['cell_ids'])
+    assert np.allclose(mesh_in.compute_cell_sizes()['Volume'], mesh.compute_cell_sizes()['Volume'])
+    assert np.allclose(mesh_in.compute_cell_sizes()['Area'], mesh.compute_cell_sizes()['Area'])
+
+
+def test_meshio_polyhedron(tmpdir):
+    points = np.array(
+        [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]]
+        + [[0.5, 0.5, 1.5]],
+        dtype=float,
+    )
+    cube = [[0, 3, 2, 1], [4, 5, 6, 7], [0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7]]
+    pyramid = [[4, 5, 6, 7], [4, 5, 8], [5, 6, 8], [6, 7, 8], [7, 4, 8]]
+    mesh_meshio = meshio.Mesh(points, [('polyhedron8', [cube]), ('polyhedron5', [pyramid])])
+
+    mesh = pyvista.from_meshio(mesh_meshio)
+    assert np.array_equal(mesh.celltypes, [pyvista.CellType.POLYHEDRON] * 2)
+    assert np.isclose(mesh.volume, 1 + 1 / 6)
+
+    filename = str(tmpdir.join('polyhedron.vtu'))
+    pyvista.save_meshio(filename, mesh)
+    mesh_in = meshio.read(filename)
+    assert [block.type for block in mesh_in.cells] == ['polyhedron8', 'polyhedron5']
+    for block, faces in zip(mesh_in.cells, [cube, pyramid]):
+        assert [face.tolist() for face in block.data[0]] == faces
+    assert pyvista.from_meshio(mesh_in) == mesh